@@ -0,0 +1,59 @@
+"""Import time, i.e. the cold-start cost that shinydashboard adds to an app's process.
+
+Each scenario runs in a fresh interpreter, several times; the reported time is the
+median, minus the median time for an interpreter that imports nothing.
+
+- import: ``import shinydashboard``
+- static UI: building a page with the components' default icons, as an app's UI does
+- server: also creating the renderers, which imports shiny
+
+Usage: python benchmarks/bench_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 15
+
+SCENARIOS = {
+    "baseline": "pass",
+    "import": "import shinydashboard",
+    "static UI": """
+import shinydashboard as sdb
+sdb.page(
+    sdb.header(),
+    sdb.sidebar("Dashboard", sdb.sidebar_menu_tab("Tab", "tab")),
+    sdb.body(sdb.info_box("Title", "1"), sdb.value_box("1", "Value")),
+)
+""",
+    "server": """
+import shinydashboard as sdb
+sdb.render_value_box(lambda: sdb.value_box("1", "Value"))
+sdb.render_menu_dropdown(lambda: sdb.menu_dropdown("icon"))
+sdb.dashboard_server
+""",
+}
+
+
+def run(code: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    baseline = run(SCENARIOS["baseline"])
+    print(f"{'interpreter startup':>20}: {baseline * 1000:8.1f} ms")
+    for name, code in SCENARIOS.items():
+        if name == "baseline":
+            continue
+        print(f"{name:>20}: {(run(code) - baseline) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Page generation time per request, for function-style UIs.
+
+Measures building a typical :func:`shinydashboard.page` and rendering it the way Shiny
+does for each request to a function-style UI, with the page-shell cache (the rendered
+head and the page's dependencies) cold (cleared before every page, i.e. the cost without
+the cache) and warm.
+
+Usage: python benchmarks/bench_page.py
+"""
+
+import timeit
+
+import htmltools as ht
+
+import shinydashboard as sdb
+from shinydashboard._layout import _head_deps, _head_html
+
+
+def app_ui() -> ht.Tag:
+    return sdb.page(
+        header=sdb.header(),
+        sidebar=sdb.sidebar(
+            "Dashboard",
+            *[sdb.sidebar_menu_tab(f"Tab {i}", f"tab{i}") for i in range(5)],
+        ),
+        body=sdb.body(
+            sdb.navset(
+                *[
+                    sdb.nav_content(
+                        f"tab{i}",
+                        sdb.value_box(str(i), "Value"),
+                        sdb.info_box("Title", str(i)),
+                    )
+                    for i in range(5)
+                ]
+            )
+        ),
+        title="Benchmark",
+        lang="en",
+    )
+
+
+def render_page() -> str:
+    return ht.HTMLDocument(app_ui()).render()["html"]
+
+
+def render_page_cold() -> str:
+    _head_html.cache_clear()
+    _head_deps.cache_clear()
+    return render_page()
+
+
+def main() -> None:
+    number = 100
+    for label, fn in [("cold shell cache", render_page_cold), ("warm", render_page)]:
+        fn()
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"page per request ({label}): {best * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Per-tile rendering cost of value_box(), info_box() and card(), as tags and as strings.
+
+Times, per tile:
+
+- tags: building the component and rendering it with ``get_html_string()``, as Shiny
+  does
+- template: the ``*_html()`` function
+
+(That the templates write the same markup as the components is tested in
+tests/test_templates.py.)
+
+Usage: python benchmarks/bench_templates.py
+"""
+
+import timeit
+
+import shinydashboard as sdb
+
+
+def main() -> None:
+    number = 2000
+    benches = [
+        ("value_box", sdb.value_box, sdb.value_box_html, ("1,234", "Users"), {}),
+        ("info_box", sdb.info_box, sdb.info_box_html, ("Users", "1,234"), {}),
+        ("card", sdb.card, sdb.card_html, ("Title", "Body"), {"closeable": True}),
+    ]
+    for label, component, template, args, kwargs in benches:
+        for kind, fn in [
+            ("tags", lambda: component(*args, **kwargs).get_html_string()),
+            ("template", lambda: template(*args, **kwargs)),
+        ]:
+            fn()
+            best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+            print(f"{label} ({kind}): {best * 1e6:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Construction and serialization time of the components, at several scales.
+
+Each benchmark builds some synthetic dashboard UI and renders it to HTML, the way Shiny
+does:
+
+- page: a page() whose sidebar has 5/50/500 tabs (each with a nav_content pane)
+- tiles: a body() with 10/100/1000 tiles (a mix of value boxes, info boxes and cards)
+- notifications: a menu_dropdown() with 10/1000 notifications
+- render: re-rendering a value box, a grid of 100 tiles, and a menu of 100
+  notifications through their renderers, in a Shiny session (over a mocked
+  connection), as when their values change
+
+These use pytest-benchmark. Timings depend on the machine, so compare against
+baselines saved on the same machine; e.g. save them before making changes:
+
+    pytest benchmarks --benchmark-autosave
+
+and then compare, failing on any benchmark whose median time is more than 50% slower:
+
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:50%
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Iterator, List
+
+import htmltools as ht
+import pytest
+from shiny import App, Session, ui
+from shiny._connection import MockConnection
+from shiny.session import session_context
+from shiny.types import SilentCancelOutputException
+
+import shinydashboard as sdb
+
+
+def page_ui(n_items: int) -> ht.Tag:
+    return sdb.page(
+        header=sdb.header(),
+        sidebar=sdb.sidebar(
+            "Dashboard",
+            *[sdb.sidebar_menu_tab(f"Tab {i}", f"tab{i}") for i in range(n_items)],
+        ),
+        body=sdb.body(
+            sdb.navset(
+                *[
+                    sdb.nav_content(f"tab{i}", sdb.value_box(str(i), "Value"))
+                    for i in range(n_items)
+                ]
+            )
+        ),
+        title="Benchmark",
+        lang="en",
+    )
+
+
+def tiles(n_tiles: int, version: int = 0) -> List[ht.TagChild]:
+    res: List[ht.TagChild] = []
+    for i in range(n_tiles):
+        value = str(i + version)
+        if i % 3 == 0:
+            res.append(sdb.value_box(value, "Value", color="success", width=3))
+        elif i % 3 == 1:
+            res.append(sdb.info_box("Title", value, subtitle="Subtitle", width=3))
+        else:
+            res.append(sdb.card("Card", value, width=3))
+    return res
+
+
+def notifications(n_items: int, version: int = 0) -> ht.TagChild:
+    return sdb.menu_dropdown(
+        sdb.icon("bell"),
+        *[
+            sdb.item_notification(f"Notification {i}", time=f"{i + version} mins")
+            for i in range(n_items)
+        ],
+        header=f"{n_items} notifications",
+    )
+
+
+@pytest.mark.parametrize("n", [5, 50, 500])
+def test_page(benchmark, n):
+    benchmark(lambda: ht.HTMLDocument(page_ui(n)).render())
+
+
+@pytest.mark.parametrize("n", [10, 100, 1000])
+def test_tiles(benchmark, n):
+    benchmark(lambda: sdb.body(ht.tags.div(*tiles(n), class_="row")).get_html_string())
+
+
+@pytest.mark.parametrize("n", [10, 1000])
+def test_notifications(benchmark, n):
+    benchmark(lambda: ht.TagList(notifications(n)).get_html_string())
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    app = App(ui.page_fluid(), None)
+    yield app._create_session(MockConnection())
+
+
+def round_trip(session: Session, renderer: Any) -> Callable[[], Any]:
+    # Renders the output once, as its observer would after an invalidation, and
+    # returns the value to send
+    loop = asyncio.new_event_loop()
+
+    async def render() -> Any:
+        with session_context(session):
+            try:
+                return await renderer.render()
+            except SilentCancelOutputException:
+                return None
+
+    def run() -> Any:
+        return loop.run_until_complete(render())
+
+    # The first rendering is sent in full; the ones after it, as patches
+    assert run() is not None
+    return run
+
+
+def test_render_value_box(benchmark, session):
+    version = 0
+
+    @sdb.render_value_box
+    def box() -> ht.Tag:
+        nonlocal version
+        version += 1
+        return sdb.value_box(str(version), "Value", icon=sdb.icon("clock"))
+
+    res = benchmark(round_trip(session, box))
+    assert list(res["patch"].values()) == [str(version)]
+
+
+def test_render_grid(benchmark, session):
+    version = 0
+
+    @sdb.render_value_box_grid
+    def grid() -> List[Dict[str, Any]]:
+        nonlocal version
+        version += 1
+        return [dict(value=str(i + version), subtitle="Value") for i in range(100)]
+
+    res = benchmark(round_trip(session, grid))
+    assert len(res["patch"]) == 100
+
+
+def test_render_menu(benchmark, session):
+    version = 0
+
+    @sdb.render_menu_dropdown
+    def menu() -> ht.TagChild:
+        nonlocal version
+        version += 1
+        return notifications(100, version)
+
+    res = benchmark(round_trip(session, menu))
+    assert "html" in res
@@ -1,6 +1,5 @@
 import datetime
 
-import faicons
 from shiny import App, Inputs, Outputs, Session, reactive, ui
 
 import shinydashboard as sdb
@@ -30,8 +29,10 @@ app_ui = sdb.page(
 
 
 def server(input: Inputs, output: Outputs, session: Session) -> None:
+    # The click count is the same for every session, so with broadcast=True, the value
+    # box is rendered just once per click for all of them
     @output
-    @sdb.render_value_box
+    @sdb.render_value_box(broadcast=True)
     def valueBox1():
         """Shows the current click count in a value_box."""
 
@@ -39,7 +40,7 @@ def server(input: Inputs, output: Outputs, session: Session) -> None:
             str(click_count()),
             "clicks",
             color="success",
-            icon=faicons.icon_svg("arrow-pointer"),
+            icon=sdb.icon("arrow-pointer"),
         )
 
     @output
@@ -57,7 +58,7 @@ def server(input: Inputs, output: Outputs, session: Session) -> None:
             "Current time",
             current_time.strftime("%I:%M:%S %p"),
             subtitle=str(current_time.tzinfo),
-            icon=faicons.icon_svg("clock"),
+            icon=sdb.icon("clock"),
             color="warning",
         )
 
@@ -2,41 +2,141 @@
 
 __version__ = "0.0.0.9000"
 
-from ._body import body
-from ._card import card
-from ._dropdown import (
-    item_message,
-    item_notification,
-    menu_dropdown,
-    output_menu_dropdown,
-    render_menu_dropdown,
-)
-from ._layout import header, header_link, page
-from ._sidebar import (
-    brand,
-    nav_content,
-    navset,
-    sidebar,
-    sidebar_menu_link,
-    sidebar_menu_tab,
-    sidebar_submenu,
-)
-from ._valuebox import (
-    info_box,
-    output_info_box,
-    output_value_box,
-    render_info_box,
-    render_value_box,
-    value_box,
-)
+# The submodules are imported on first use, rather than by `import shinydashboard`, so
+# that apps (and workers) start faster; e.g. shiny isn't imported until it's needed.
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from ._body import body
+    from ._card import card
+    from ._compress import compress_assets, serve_precompressed
+    from ._export import export_html
+    from ._dropdown import (
+        item_message,
+        item_notification,
+        menu_dropdown,
+        output_menu_dropdown,
+        render_menu_dropdown,
+    )
+    from ._icons import icon, icon_cache_info
+    from ._layout import header, header_link, page
+    from ._metrics import (
+        client_timings,
+        enable_output_stats,
+        output_stats,
+        output_stats_text,
+        render_stats,
+        reset_render_stats,
+    )
+    from ._notifications import NotificationStore
+    from ._server import (
+        dashboard_server,
+        insert_menu_item,
+        remove_menu_item,
+        set_menu_badge,
+    )
+    from ._templates import card_html, info_box_html, value_box_html
+    from ._sidebar import (
+        brand,
+        nav_content,
+        navset,
+        sidebar,
+        sidebar_menu_link,
+        sidebar_menu_tab,
+        sidebar_submenu,
+    )
+    from ._valuebox import (
+        info_box,
+        output_info_box,
+        output_value_box,
+        output_value_box_grid,
+        render_info_box,
+        render_value_box,
+        render_value_box_grid,
+        value_box,
+    )
+
+_lazy_attrs = {
+    "body": "._body",
+    "card": "._card",
+    "compress_assets": "._compress",
+    "serve_precompressed": "._compress",
+    "export_html": "._export",
+    "item_message": "._dropdown",
+    "item_notification": "._dropdown",
+    "menu_dropdown": "._dropdown",
+    "output_menu_dropdown": "._dropdown",
+    "render_menu_dropdown": "._dropdown",
+    "icon": "._icons",
+    "icon_cache_info": "._icons",
+    "header": "._layout",
+    "header_link": "._layout",
+    "page": "._layout",
+    "client_timings": "._metrics",
+    "enable_output_stats": "._metrics",
+    "output_stats": "._metrics",
+    "output_stats_text": "._metrics",
+    "render_stats": "._metrics",
+    "NotificationStore": "._notifications",
+    "reset_render_stats": "._metrics",
+    "dashboard_server": "._server",
+    "insert_menu_item": "._server",
+    "remove_menu_item": "._server",
+    "set_menu_badge": "._server",
+    "brand": "._sidebar",
+    "nav_content": "._sidebar",
+    "navset": "._sidebar",
+    "sidebar": "._sidebar",
+    "sidebar_menu_link": "._sidebar",
+    "sidebar_menu_tab": "._sidebar",
+    "sidebar_submenu": "._sidebar",
+    "card_html": "._templates",
+    "info_box_html": "._templates",
+    "value_box_html": "._templates",
+    "info_box": "._valuebox",
+    "output_info_box": "._valuebox",
+    "output_value_box": "._valuebox",
+    "output_value_box_grid": "._valuebox",
+    "render_info_box": "._valuebox",
+    "render_value_box": "._valuebox",
+    "render_value_box_grid": "._valuebox",
+    "value_box": "._valuebox",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _lazy_attrs:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(_lazy_attrs[name], __name__), name)
+    # Cache it, so that __getattr__ isn't called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_lazy_attrs])
+
 
 __all__ = (
+    "NotificationStore",
     "body",
     "brand",
     "card",
+    "card_html",
+    "client_timings",
+    "compress_assets",
+    "dashboard_server",
+    "enable_output_stats",
+    "export_html",
     "header_link",
     "header",
+    "icon",
+    "icon_cache_info",
     "info_box",
+    "info_box_html",
+    "insert_menu_item",
     "item_message",
     "item_notification",
     "menu_dropdown",
@@ -44,14 +144,24 @@ __all__ = (
     "nav_content",
     "output_info_box",
     "output_menu_dropdown",
+    "output_stats",
+    "output_stats_text",
     "output_value_box",
+    "output_value_box_grid",
     "page",
     "render_info_box",
     "render_menu_dropdown",
+    "render_stats",
     "render_value_box",
+    "render_value_box_grid",
+    "remove_menu_item",
+    "reset_render_stats",
+    "serve_precompressed",
+    "set_menu_badge",
     "sidebar_menu_link",
     "sidebar_menu_tab",
     "sidebar_submenu",
     "sidebar",
     "value_box",
+    "value_box_html",
 )
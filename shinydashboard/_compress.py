@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import gzip
+import mimetypes
+import os
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from ._htmldeps import registered_dependency
+from ._utils import package_file
+
+if TYPE_CHECKING:
+    from shiny import App
+    from starlette.responses import FileResponse
+    from starlette.types import Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+# The package's directories of static assets
+_asset_dirs = ("www", "shinydashboard")
+
+# Files that are worth compressing; fonts like .woff2 are already compressed
+_compressible = (".css", ".js", ".map", ".svg", ".json", ".txt", ".ttf", ".eot")
+
+# Encodings that can be served from precompressed files, by preference
+_encodings = {"br": ".br", "gzip": ".gz"}
+
+_immutable = "public, max-age=31536000, immutable"
+
+
+def compress_assets(dirs: Optional[Sequence[str]] = None) -> List[str]:
+    """Write gzip (``.gz``) and brotli (``.br``) compressed copies of static assets.
+
+    Writes the compressed copies next to the originals, for :func:`serve_precompressed`
+    to send to browsers that accept them. Run this once when building or deploying an
+    app, rather than at runtime. Brotli
+    copies are only written if the ``brotli`` package is installed.
+
+    Parameters
+    ----------
+    dirs
+        The directories whose files should be compressed (recursively). By default,
+        the assets bundled with this package.
+
+    Returns
+    -------
+        The paths of the files that were written. Copies that are already up to date,
+        or that wouldn't be any smaller than the original, aren't written.
+    """
+    if dirs is None:
+        dirs = [package_file(x) for x in _asset_dirs]
+
+    written: List[str] = []
+    for root in dirs:
+        for dir, _, files in os.walk(root):
+            for f in files:
+                if f.endswith(_compressible):
+                    written.extend(compress_file(os.path.join(dir, f)))
+    return written
+
+
+def compress_file(path: str) -> List[str]:
+    """Write compressed copies of one file, returning the paths written."""
+    written: List[str] = []
+    mtime = os.path.getmtime(path)
+    data: Optional[bytes] = None
+    for encoding, ext in _encodings.items():
+        if encoding == "br" and brotli is None:
+            continue
+        out = path + ext
+        if os.path.exists(out) and os.path.getmtime(out) >= mtime:
+            continue
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        if encoding == "br":
+            compressed = brotli.compress(data)
+        else:
+            # mtime=0 so that the output only depends on the input
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) >= len(data):
+            continue
+        with open(out, "wb") as f:
+            f.write(compressed)
+        written.append(out)
+    return written
+
+
+def serve_precompressed(app: App):
+    """Serve shinydashboard's HTML dependencies from precompressed files, where
+    available.
+
+    Wraps a Shiny app so that, when a browser requests a file from one of
+    shinydashboard's HTML dependencies (such as AdminLTE's stylesheet) and accepts
+    brotli or gzip encoding, the matching ``.br`` or ``.gz`` file written by
+    :func:`compress_assets` is sent as is, without compressing anything per request.
+    Compressed copies that are older than their originals are ignored. Since the
+    dependencies' versions include a hash of their contents, their URLs change whenever
+    their contents do, so their files are also sent with ``Cache-Control: immutable``.
+    Every other request is passed through to the app.
+
+    Parameters
+    ----------
+    app
+        A Shiny :class:`App`.
+
+    Returns
+    -------
+        An ASGI app, to run in place of ``app``.
+
+    Examples
+    --------
+    >>> app = App(app_ui, server)
+    >>> app = sdb.serve_precompressed(app)
+    """
+    lib_path = re.compile(
+        "^/" + re.escape(app.lib_prefix.strip("/")) + "/([^/]+)/(.+)$"
+    )
+
+    async def serve(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            m = lib_path.match(scope["path"])
+            if m is not None:
+                response = _dependency_file(scope, m.group(1), m.group(2))
+                if response is not None:
+                    await response(scope, receive, send)
+                    return
+        await app(scope, receive, send)
+
+    return serve
+
+
+def _dependency_file(scope: Scope, dep_dir: str, file: str) -> Optional[FileResponse]:
+    from starlette.responses import FileResponse
+
+    dep = registered_dependency(dep_dir)
+    if dep is None:
+        return None
+
+    root = os.path.realpath(dep.source_path_map()["source"])
+    path = os.path.realpath(os.path.join(root, file))
+    if not path.startswith(root + os.sep) or not os.path.isfile(path):
+        return None
+
+    headers: Dict[str, str] = {"Vary": "Accept-Encoding"}
+    if "+" in str(dep.version):
+        headers["Cache-Control"] = _immutable
+
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    mtime = os.path.getmtime(path)
+    for encoding in _accepted_encodings(scope):
+        compressed = path + _encodings[encoding]
+        # A copy older than the original is out of date
+        if os.path.isfile(compressed) and os.path.getmtime(compressed) >= mtime:
+            headers["Content-Encoding"] = encoding
+            return FileResponse(compressed, headers=headers, media_type=media_type)
+
+    if "Cache-Control" in headers:
+        return FileResponse(path, headers=headers, media_type=media_type)
+    # Nothing to add; let the app serve it
+    return None
+
+
+def _accepted_encodings(scope: Scope) -> List[str]:
+    accept = ""
+    for key, value in scope["headers"]:
+        if key == b"accept-encoding":
+            accept += value.decode("latin-1") + ","
+
+    accepted: Dict[str, float] = {}
+    for item in accept.split(","):
+        parts = item.strip().split(";")
+        encoding = parts[0].strip().lower()
+        q = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if encoding in _encodings and q > 0:
+            accepted[encoding] = q
+
+    # Highest q-value first; for ties, prefer brotli
+    order = list(_encodings)
+    return sorted(accepted, key=lambda x: (-accepted[x], order.index(x)))
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional, Union
 
 import htmltools as ht
-from faicons import icon_svg
 from htmltools import tags
-from shiny import render
 
-from ._utils import insert_dividers
+from ._icons import icon as cached_icon
+from ._utils import MISSING, MISSING_TYPE, insert_dividers
+
+if TYPE_CHECKING:
+    from ._render import RenderMenu
 
 
 def menu_dropdown(
@@ -16,6 +18,7 @@ def menu_dropdown(
     badge_value: Optional[Union[int, Literal["auto"]]] = "auto",
     badge_status: Optional[str] = "primary",
     header: Optional[ht.TagChild] = None,
+    id: Optional[str] = None,
 ) -> ht.TagChild:
     """A drop-down menu, designed to be used as part of a :func:`header`'s
     ``children_right`` argument, and intended to be filled with :func:`item_message` and
@@ -38,12 +41,17 @@ def menu_dropdown(
     header
         Content to display when the menu is dropped down, in a region above the menu
         items.
+    id
+        An id for the menu, so that items can be added to it and removed from it with
+        :func:`insert_menu_item` and :func:`remove_menu_item`. (Not needed for menus
+        rendered with :func:`render_menu_dropdown`, which use the output's id.)
 
     Returns
     -------
         A :class:`Tag` object, suitable for inclusion in :func:`header`'s ``children_right`` argument.
     """
 
+    badge_auto = badge_value == "auto"
     if badge_value == "auto":
         badge_value = len(args)
 
@@ -64,7 +72,7 @@ def menu_dropdown(
     )
 
     menu = tags.li(
-        {"class": "nav-item dropdown"},
+        {"class": "nav-item dropdown", "id": id},
         tags.a(
             {"class": "nav-link", "data-bs-toggle": "dropdown", "href": "#"},
             icon,
@@ -72,6 +80,8 @@ def menu_dropdown(
                 tags.span(
                     {"class": f"navbar-badge badge bg-{badge_status}"},
                     str(badge_value),
+                    # Counted again in the browser, as items are added or removed
+                    data_badge="auto" if badge_auto else None,
                 )
                 if badge_value is not None and badge_status is not None
                 else None
@@ -89,7 +99,43 @@ def output_menu_dropdown(id: str) -> ht.Tag:
     return tags.li(id=id, class_="shinydashboard-menu-output")
 
 
-render_menu_dropdown = render.ui
+def render_menu_dropdown(
+    fn: Optional[Callable[[], Any]] = None,
+    *,
+    throttle_ms: Optional[float] = None,
+    delay_ms: Optional[float] = None,
+) -> Union[RenderMenu, Callable[[Callable[[], Any]], RenderMenu]]:
+    """A Shiny render decorator for dynamic :func:`menu_dropdown` outputs; like
+    ``shiny.render.ui``, except that a menu that's the same as the one already shown
+    isn't sent again.
+
+    Parameters
+    ----------
+    fn
+        A user-defined function to decorate; its name should match with the
+        corresponding :func:`output_menu_dropdown` in the UI. The function should
+        return a :func:`menu_dropdown` object, or ``None``.
+    throttle_ms
+        If given, render the menu at most once per this many milliseconds; see
+        :func:`render_value_box`.
+    delay_ms
+        If given, wait this many milliseconds after the menu's dependencies first
+        change before rendering it; see :func:`render_value_box`.
+
+    Returns
+    -------
+        A decorated function that must be further decorated with ``@output``.
+    """
+    # Imported here, since it needs shiny, which is slow to import and not needed for
+    # static UI
+    from ._render import RenderMenu, rate_limit
+
+    def decorator(fn: Callable[[], Any]) -> RenderMenu:
+        return RenderMenu(rate_limit(fn, throttle_ms, delay_ms))
+
+    if fn is None:
+        return decorator
+    return decorator(fn)
 
 
 def item_message(
@@ -163,9 +209,7 @@ def item_message(
 def item_notification(
     message: ht.TagChild,
     *,
-    icon: Optional[ht.TagChild] = icon_svg(
-        "circle-exclamation", fill="var(--bs-secondary)"
-    ),
+    icon: Union[Optional[ht.TagChild], MISSING_TYPE] = MISSING,
     time: Optional[ht.TagChild] = None,
     href: Optional[str] = None,
 ):
@@ -187,6 +231,9 @@ def item_notification(
     -------
         A :class:`Tag` object, suitable for inclusion in :func:`menu_dropdown`.
     """
+    if isinstance(icon, MISSING_TYPE):
+        icon = cached_icon("circle-exclamation", fill="var(--bs-secondary)")
+
     child = tags.div(
         {"class": "d-flex"},
         (
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import base64
+import copy
+import mimetypes
+import os
+import re
+from typing import Iterable, List, Optional, Set, Union, cast
+
+import htmltools as ht
+
+from ._htmldeps import deps_bootstrap
+from ._icons import icon_refs, icons_css
+from ._layout import _cdn_bootstrap, _cdn_fontawesome
+from ._purge import _script_words, class_names, purge_css as _purge_css
+from ._sidebar import lazy_tab
+from ._utils import is_tag
+
+# shinydashboard.js needs Shiny (and its jQuery), so it's left out of exported pages.
+# Without it, this shows the sidebar's start tab, like ensureActivatedTab() in tabs.ts.
+_start_tab_js = """\
+document.addEventListener("DOMContentLoaded",function(){\
+var a=document.querySelectorAll(".nav-sidebar a[data-bs-toggle='tab']");\
+var t=document.querySelector(".nav-sidebar a[data-bs-toggle='tab'][data-start-selected='1']")||a[0];\
+t&&bootstrap.Tab.getOrCreateInstance(t).show()})"""
+
+_css_url_re = re.compile(r"""url\(\s*(["']?)([^"')]+)\1\s*\)""")
+# The parts of a stylesheet that minifying leaves alone (strings), or drops (comments,
+# except /*! ... */ licenses)
+_css_skip_re = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)""", re.S
+)
+_css_space_re = re.compile(r"\s*([{};,>])\s*")
+_html_pre_re = re.compile(r"(<(pre|textarea)\b.*?</\2>)", re.S | re.I)
+
+# Types that mimetypes doesn't always know about
+_font_types = {
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".ttf": "font/ttf",
+    ".eot": "application/vnd.ms-fontobject",
+    ".svg": "image/svg+xml",
+}
+
+
+def export_html(
+    ui: ht.Tag,
+    path: Optional[str] = None,
+    *,
+    purge_css: Union[bool, Iterable[str]] = True,
+    minify: bool = True,
+) -> str:
+    """Render a dashboard page into a single, self-contained HTML file.
+
+    The page's stylesheets and scripts are inlined, along with the files (like images)
+    that the stylesheets refer to, so the file can be opened or sent as is, without a
+    server or a network connection. Font Awesome icons (from ``<i class="fas ...">``
+    tags) are drawn by inline CSS for just the icons the page uses, as with
+    ``page(icons="subset")``; a page made with ``cdn=True`` gets the bundled copies
+    of its dependencies instead.
+
+    The page is static: outputs (such as :func:`output_value_box`) are left empty, and
+    shinydashboard's own script, which needs Shiny, is left out. The sidebar's tabs
+    still work, and lazy :func:`nav_content` panes are exported with their contents.
+
+    Parameters
+    ----------
+    ui
+        The page, as returned by :func:`page`.
+    path
+        If given, the file to write the HTML to.
+    purge_css
+        If ``True`` (the default), leave out the style rules that can't apply to the
+        page, i.e. most of AdminLTE's; see :func:`page`. Pass a list of class names to
+        keep those as well, e.g. for classes added by scripts of your own.
+    minify
+        If ``True`` (the default), strip the comments and needless whitespace out of
+        the HTML and CSS. (The bundled scripts are already minified.)
+
+    Returns
+    -------
+        The HTML.
+
+    Examples
+    --------
+    >>> import shinydashboard as sdb
+    >>> report = sdb.page(
+    ...     body=sdb.body(sdb.value_box("42", "Orders", color="success")),
+    ...     title="Daily report",
+    ... )
+    >>> sdb.export_html(report, "report.html")
+    """
+    tree = _fill_lazy_tabs(ui.tagify())
+    deps = tree.get_dependencies()
+    html = tree.get_html_string()
+    if minify:
+        html = _minify_html(html)
+
+    # A page made with cdn=True refers to Font Awesome and Bootstrap on the CDN
+    fontawesome = any(x.name == "font-awesome" for x in deps)
+    for tag in (_cdn_fontawesome(), _cdn_bootstrap()):
+        link = tag.get_html_string()
+        if link in html:
+            html = html.replace(link, "")
+            if tag.name == "link":
+                fontawesome = True
+            else:
+                deps = [*deps_bootstrap(), *deps]
+
+    used: Optional[Set[str]] = None
+    if purge_css:
+        used = class_names(tree) | _script_words()
+        if not isinstance(purge_css, bool):
+            used.update(purge_css)
+
+    assets: List[str] = []
+    if fontawesome:
+        assets.append(_style(icons_css(icon_refs(tree)), None, False))
+    for dep in deps:
+        if dep.name == "font-awesome":
+            continue
+        if "subdir" not in dep.source:
+            raise ValueError(
+                f"Can't inline the {dep.name} dependency, whose files aren't local"
+            )
+        root = dep.source_path_map(lib_prefix=None)["source"]
+        assets.extend(ht.Tag("meta", **m).get_html_string() for m in dep.meta)
+        for x in dep.stylesheet:
+            file = os.path.join(root, x["href"])
+            assets.append(_style(_inline_urls(_read(file), file), used, minify))
+        if dep.name != "shinydashboard":
+            for x in dep.script:
+                assets.append(_script(_read(os.path.join(root, x["src"]))))
+        if dep.head:
+            assets.append(str(dep.head))
+    if "tab-pane" in class_names(tree):
+        assets.append(_script(_start_tab_js))
+
+    end = html.find("</head>")
+    html = "<!DOCTYPE html>\n" + html[:end] + "".join(assets) + html[end:]
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+    return html
+
+
+def _fill_lazy_tabs(x: ht.TagChild) -> ht.TagChild:
+    # A copy of the (tagified) tree, with the contents of the lazy nav_content() panes
+    # in place
+    if not is_tag(x):
+        return x
+    tag = cast(ht.Tag, x)
+    res = copy.copy(tag)
+    children = [_fill_lazy_tabs(child) for child in tag.children]
+    token = tag.attrs.get("data-lazy-tab")
+    tab = None if token is None else lazy_tab(str(token))
+    if tab is not None:
+        children.extend(_fill_lazy_tabs(tab[1].tagify()))
+        res.attrs = copy.copy(tag.attrs)
+        del res.attrs["data-lazy-tab"]
+    res.children = type(tag.children)(*children)
+    return res
+
+
+def _read(file: str) -> str:
+    with open(file, encoding="utf-8") as f:
+        return f.read()
+
+
+def _style(css: str, used: Optional[Set[str]], minify: bool) -> str:
+    # Also takes HTML, like icons_css() returns (which, from htmltools 0.6, isn't a str)
+    css = str(css)
+    if used is not None:
+        css = _purge_css(css, used)
+    if minify:
+        css = minify_css(css)
+    return "<style>" + re.sub(r"</(style)", r"<\\/\1", css, flags=re.I) + "</style>"
+
+
+def _script(js: str) -> str:
+    return "<script>" + re.sub(r"</(script)", r"<\\/\1", js, flags=re.I) + "</script>"
+
+
+def _inline_urls(css: str, file: str) -> str:
+    # Replace the local files that a stylesheet refers to with data: URLs
+    dir = os.path.dirname(file)
+
+    def replace(m: "re.Match[str]") -> str:
+        url = m.group(2).strip()
+        if re.match(r"(?:[a-z]+:|//|#)", url, re.I):
+            return m.group()
+        target = os.path.join(dir, re.split(r"[?#]", url)[0])
+        if not os.path.isfile(target):
+            return m.group()
+        ext = os.path.splitext(target)[1].lower()
+        mime = _font_types.get(ext) or mimetypes.guess_type(target)[0]
+        with open(target, "rb") as f:
+            data = base64.b64encode(f.read()).decode("ascii")
+        return f'url("data:{mime or "application/octet-stream"};base64,{data}")'
+
+    return _css_url_re.sub(replace, css)
+
+
+def minify_css(css: str) -> str:
+    """Remove the comments and needless whitespace from a stylesheet."""
+    out: List[str] = []
+    pos = 0
+    for m in _css_skip_re.finditer(css):
+        out.append(_css_space_re.sub(r"\1", re.sub(r"\s+", " ", css[pos : m.start()])))
+        if m.group(1) or m.group(2).startswith("/*!"):
+            out.append(m.group())
+        pos = m.end()
+    out.append(_css_space_re.sub(r"\1", re.sub(r"\s+", " ", css[pos:])))
+    return "".join(out).replace(";}", "}").strip()
+
+
+def _minify_html(html: str) -> str:
+    # Drop the indentation, except where whitespace is content
+    parts = _html_pre_re.split(html)
+    # re.split() returns [text, pre, tag name, text, pre, tag name, ..., text]
+    for i in range(0, len(parts), 3):
+        parts[i] = re.sub(r"\n[ \t]+", "\n", parts[i])
+    return "".join(x for i, x in enumerate(parts) if i % 3 != 2)
@@ -1,35 +1,182 @@
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
 from htmltools import HTMLDependency
+
 from . import __version__
+from ._utils import package_file
+
+
+# The dependencies made by this package, by the directory they're served from
+# ("name-version"), for serve_precompressed() to find their files
+_dependencies: Dict[str, HTMLDependency] = {}
+
+
+def registered(dep: HTMLDependency) -> HTMLDependency:
+    """Record one of the package's dependencies, so that its files can be served from
+    precompressed copies."""
+    _dependencies[dep.source_path_map(lib_prefix=None)["href"]] = dep
+    return dep
+
+
+def registered_dependency(dep_dir: str) -> Optional[HTMLDependency]:
+    """The dependency served from the directory ``dep_dir``, if the package made it."""
+    return _dependencies.get(dep_dir)
+
+
+# AdminLTE's stylesheets that aren't part of the main dependency: the right-to-left
+# version (which replaces the main stylesheet) and the dark mode add-on. Each is in its
+# own directory, so that only the files a page uses are served or copied.
+_adminlte_rtl = ("AdminLTE-rtl", "www/adminlte-rtl", "css/adminlte.rtl.min.css")
+_adminlte_dark = (
+    "AdminLTE-dark",
+    "www/adminlte-dark",
+    "css/adminlte-dark-addon.min.css",
+)
+
+
+def deps_adminlte(
+    direction: Literal["ltr", "rtl"] = "ltr", dark: bool = False
+) -> List[HTMLDependency]:
+    if direction == "rtl":
+        deps = [dep_adminlte_js(), dep_stylesheet(*_adminlte_rtl)]
+    else:
+        deps = [
+            package_dependency(
+                "AdminLTE",
+                content_version(
+                    "4.0.0-alpha.1",
+                    "www/adminlte",
+                    ["js/adminlte.min.js", "css/adminlte.min.css"],
+                ),
+                "www/adminlte",
+                script={"src": "js/adminlte.min.js"},
+                stylesheet={"href": "css/adminlte.min.css"},
+            )
+        ]
+    if dark:
+        deps.append(dep_stylesheet(*_adminlte_dark))
+    return deps
+
+
+def adminlte_stylesheets(
+    direction: Literal["ltr", "rtl"] = "ltr", dark: bool = False
+) -> List[Tuple[str, str, str]]:
+    """The (name, subdir, href) of each AdminLTE stylesheet used by a page."""
+    res = [
+        _adminlte_rtl
+        if direction == "rtl"
+        else ("AdminLTE", "www/adminlte", "css/adminlte.min.css")
+    ]
+    if dark:
+        res.append(_adminlte_dark)
+    return res
+
+
+def dep_adminlte_js() -> HTMLDependency:
+    """AdminLTE's script, for when its stylesheet is provided separately."""
+    return package_dependency(
+        "AdminLTE",
+        content_version("4.0.0-alpha.1", "www/adminlte", ["js/adminlte.min.js"]),
+        "www/adminlte",
+        script={"src": "js/adminlte.min.js"},
+    )
 
 
-def deps_adminlte() -> List[HTMLDependency]:
+def dep_stylesheet(name: str, subdir: str, href: str) -> HTMLDependency:
+    return package_dependency(
+        name,
+        content_version("4.0.0-alpha.1", subdir, [href]),
+        subdir,
+        stylesheet={"href": href},
+    )
+
+
+def deps_fontawesome() -> List[HTMLDependency]:
+    return [
+        package_dependency(
+            "font-awesome",
+            content_version("5.15.4", "www/fontawesome"),
+            "www/fontawesome",
+            stylesheet={"href": "css/all.min.css"},
+            # The stylesheet refers to the webfonts
+            all_files=True,
+        ),
+    ]
+
+
+def deps_bootstrap() -> List[HTMLDependency]:
     return [
-        HTMLDependency(
-            "AdminLTE",
-            "4.0.0-alpha.1",
-            source={
-                "package": "shinydashboard",
-                "subdir": "www/adminlte",
-            },
-            script={"src": "js/adminlte.min.js"},
-            stylesheet={"href": "css/adminlte.min.css"},
+        package_dependency(
+            "bootstrap",
+            content_version("5.2.2", "www/bootstrap", ["js/bootstrap.bundle.min.js"]),
+            "www/bootstrap",
+            script={"src": "js/bootstrap.bundle.min.js"},
         ),
     ]
 
 
 def deps_shinydashboard() -> List[HTMLDependency]:
     return [
-        HTMLDependency(
+        package_dependency(
+            "shinydashboard",
+            content_version(
+                __version__,
+                "shinydashboard",
+                ["js/shinydashboard.js", "css/shinydashboard.css"],
+            ),
             "shinydashboard",
-            __version__,
-            source={
-                "package": "shinydashboard",
-                "subdir": "shinydashboard",
-            },
             script={"src": "js/shinydashboard.js"},
             stylesheet={"href": "css/shinydashboard.css"},
         )
     ]
+
+
+def package_dependency(
+    name: str, version: str, subdir: str, **kwargs: Any
+) -> HTMLDependency:
+    """A dependency on files in one of the package's directories."""
+    # With the directory's full path, rather than {"package": "shinydashboard"}, which
+    # htmltools resolves (at some cost) each time the dependency is rendered
+    return registered(
+        HTMLDependency(name, version, source={"subdir": package_file(subdir)}, **kwargs)
+    )
+
+
+def content_version(
+    version: str, subdir: str, files: Optional[List[str]] = None
+) -> str:
+    """Add a hash of a dependency's files to its version, as a local version label.
+
+    The version is part of the dependency's URL, so the URL changes exactly when the
+    files do, and browsers and proxies can cache the files indefinitely. ``files`` are
+    relative to ``subdir``; if ``None``, every file in ``subdir`` is included.
+    """
+    return (
+        version + "+" + _content_hash(subdir, None if files is None else tuple(files))
+    )
+
+
+@lru_cache(maxsize=None)
+def _content_hash(subdir: str, files: Optional[Tuple[str, ...]]) -> str:
+    root = package_file(subdir)
+    if files is None:
+        files = tuple(
+            sorted(
+                os.path.relpath(os.path.join(dir, f), root).replace(os.sep, "/")
+                for dir, _, dir_files in os.walk(root)
+                for f in dir_files
+                # Not precompressed copies, which may or may not have been made
+                if not f.endswith((".gz", ".br"))
+            )
+        )
+    h = hashlib.sha256()
+    for f in files:
+        h.update(f.encode("utf-8") + b"\0")
+        with open(os.path.join(root, f), "rb") as fh:
+            h.update(hashlib.sha256(fh.read()).digest())
+    return h.hexdigest()[:12]
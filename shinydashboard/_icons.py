@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import quote
+
+import htmltools as ht
+
+from ._utils import is_tag, is_tag_list
+
+# An icon that a page uses: a Font Awesome style ("solid", "regular", "brands") and the
+# icon's name, e.g. ("solid", "bars") for <i class="fas fa-bars">.
+IconRef = Tuple[str, str]
+
+_style_classes = {
+    "fa": "solid",
+    "fas": "solid",
+    "far": "regular",
+    "fab": "brands",
+}
+
+# AdminLTE's card widget swaps these classes in the browser (maximize/restore and
+# collapse/expand), so if a page uses one of them it needs the other as well.
+_swapped_icons = {
+    "expand": "compress",
+    "compress": "expand",
+    "plus": "minus",
+    "minus": "plus",
+}
+
+_class_attr_re = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+# Rules shared by every icon. Each icon is drawn by masking the element's background
+# (in the current text color) with the icon's SVG, so unlike the webfont, only the
+# icons that are used need to be sent. The sizing classes mirror Font Awesome's. (The
+# inline SVGs from faicons.icon_svg() also have the "fa" class, but draw themselves.)
+_base_css = """\
+.fa:not(svg),.fas,.far,.fab{display:inline-block;height:1em;vertical-align:-.125em;\
+background-color:currentColor;\
+-webkit-mask-repeat:no-repeat;mask-repeat:no-repeat;\
+-webkit-mask-position:center;mask-position:center;\
+-webkit-mask-size:contain;mask-size:contain;\
+-webkit-mask-image:var(--sdb-fa-icon);mask-image:var(--sdb-fa-icon)}\
+.fa-fw{width:1.25em!important}\
+.fa-xs{font-size:.75em}.fa-sm{font-size:.875em}\
+.fa-lg{font-size:1.33333em;vertical-align:-.0667em}\
+.fa-2x{font-size:2em}.fa-3x{font-size:3em}.fa-4x{font-size:4em}.fa-5x{font-size:5em}\
+"""
+
+
+class IconCacheInfo(NamedTuple):
+    """Statistics for the cache used by :func:`icon`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _IconCache:
+    # An LRU cache of rendered icons. Not functools.lru_cache, so that the counters can
+    # be reported (and reset) along with the rest of the package's metrics, and so it's
+    # safe to use from renderers that run in other threads.
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._icons: "OrderedDict[Hashable, ht.HTML]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, make: Callable[[], ht.HTML]) -> ht.HTML:
+        with self._lock:
+            res = self._icons.get(key)
+            if res is not None:
+                self.hits += 1
+                self._icons.move_to_end(key)
+                return res
+            self.misses += 1
+
+        res = make()
+        with self._lock:
+            self._icons[key] = res
+            if len(self._icons) > self.maxsize:
+                self._icons.popitem(last=False)
+        return res
+
+    def info(self) -> IconCacheInfo:
+        with self._lock:
+            return IconCacheInfo(self.hits, self.misses, self.maxsize, len(self._icons))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._icons.clear()
+            self.hits = self.misses = 0
+
+
+_icon_cache = _IconCache(maxsize=256)
+
+
+def icon(
+    name: str,
+    style: Optional[str] = None,
+    *,
+    fill: Optional[str] = "currentColor",
+    height: Optional[str] = None,
+    width: Optional[str] = None,
+    **kwargs: Optional[str],
+) -> ht.HTML:
+    """A Font Awesome icon, as an inline SVG.
+
+    Like :func:`faicons.icon_svg` (which it uses), but the rendered SVG markup is
+    cached, so using the same icon over and over again (e.g. in a value box that's
+    re-rendered every second) costs little more than a dictionary lookup. The most
+    recently used 256 variations are kept; see :func:`icon_cache_info`.
+
+    Parameters
+    ----------
+    name
+        The icon's name, e.g. ``"clock"``.
+    style
+        The icon's style, e.g. ``"solid"`` or ``"regular"``; by default, the first style
+        that the icon has.
+    fill
+        The icon's fill color.
+    height
+        The icon's height, as a CSS length.
+    width
+        The icon's width, as a CSS length.
+    kwargs
+        Other arguments to :func:`faicons.icon_svg`, like ``margin_right`` or
+        ``title``.
+
+    Returns
+    -------
+        An :class:`HTML` string, which can be used wherever a :class:`Tag` can.
+    """
+    key = (name, style, fill, height, width, tuple(sorted(kwargs.items())))
+
+    def make() -> ht.HTML:
+        from faicons import icon_svg
+
+        svg = icon_svg(
+            name, style=style, fill=fill, height=height, width=width, **kwargs
+        )
+        return ht.HTML(svg.get_html_string(indent=0, eol=""))
+
+    return _icon_cache.get(key, make)
+
+
+def icon_cache_info() -> IconCacheInfo:
+    """The hit and miss counts, maximum size, and current size of :func:`icon`'s cache.
+
+    Returns
+    -------
+        An :class:`IconCacheInfo` named tuple.
+    """
+    return _icon_cache.info()
+
+
+def icon_refs(x: ht.TagChildArg) -> Set[IconRef]:
+    """Find the Font Awesome icons used by ``<i class="fas fa-...">``-style tags.
+
+    Looks through the tags' ``class`` attributes, and also through the ``class``
+    attributes found in any raw :class:`HTML` strings. Classes that aren't icons (like
+    ``fa-fw``), and icons that Font Awesome doesn't have, are ignored.
+    """
+    refs: Set[IconRef] = set()
+    _find_icon_refs(x, refs)
+    return refs
+
+
+def _find_icon_refs(x: object, refs: Set[IconRef]) -> None:
+    if is_tag(x):
+        classes = x.attrs.get("class")  # type: ignore[union-attr]
+        if classes:
+            _add_icon_refs(str(classes), refs)
+        _find_icon_refs(x.children, refs)  # type: ignore[union-attr]
+    elif isinstance(x, ht.HTML):
+        for m in _class_attr_re.finditer(str(x)):
+            _add_icon_refs(m.group(1) or m.group(2), refs)
+    elif is_tag_list(x):
+        for child in x:
+            _find_icon_refs(child, refs)
+
+
+def _add_icon_refs(classes: str, refs: Set[IconRef]) -> None:
+    names = classes.split()
+    styles = {_style_classes[x] for x in names if x in _style_classes}
+    if not styles:
+        return
+    for x in names:
+        if not x.startswith("fa-"):
+            continue
+        name = _resolve_icon_name(x[3:])
+        if name is None:
+            continue
+        for style in styles:
+            refs.add((style, name))
+            if name in _swapped_icons:
+                refs.add((style, _swapped_icons[name]))
+
+
+def _resolve_icon_name(name: str) -> Optional[str]:
+    from faicons import metadata
+
+    # faicons has Font Awesome 6's icon names; most of the version 5 names that were
+    # renamed (e.g. "times" is now "xmark") live on as aliases.
+    if name in metadata():
+        return name
+    return _icon_aliases().get(name)
+
+
+@lru_cache(maxsize=None)
+def _icon_aliases() -> Dict[str, str]:
+    from faicons import metadata
+
+    aliases: Dict[str, str] = {}
+    for name, icon in metadata().items():
+        for alias in icon.get("aliases", {}).get("names", []):
+            aliases[alias] = name
+    return aliases
+
+
+def icons_css(refs: Iterable[IconRef]) -> ht.HTML:
+    """CSS that draws the given icons (and only those) for Font Awesome's classes."""
+    return _icons_css(frozenset(refs))
+
+
+@lru_cache(maxsize=32)
+def _icons_css(refs: FrozenSet[IconRef]) -> ht.HTML:
+    from faicons import metadata
+
+    rules = [_base_css]
+    for style, name in sorted(refs):
+        svg = metadata()[name]["svg"].get(style)
+        if svg is None:
+            continue
+        selector = ",".join(
+            f".{cls}.fa-{alias}"
+            for cls, cls_style in _style_classes.items()
+            if cls_style == style
+            for alias in _class_names(name)
+        )
+        url = 'url("data:image/svg+xml,' + quote(svg["raw"], safe=" =:/,.-") + '")'
+        rules.append(
+            f"{selector}{{width:{svg['width'] / svg['height']:.4g}em;--sdb-fa-icon:{url}}}"
+        )
+    return ht.HTML("".join(rules))
+
+
+def _class_names(name: str) -> Tuple[str, ...]:
+    from faicons import metadata
+
+    # The class names that refer to an icon: its current name and its aliases
+    aliases = metadata()[name].get("aliases", {}).get("names", [])
+    return (name, *aliases)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Literal, Optional, Union
 
 import htmltools as ht
 from htmltools import tags
 from htmltools._core import Tag, Tagifiable, TagList, TagChildArg  # type: ignore
 
-from ._htmldeps import deps_adminlte, deps_shinydashboard
+from ._htmldeps import (
+    deps_adminlte,
+    deps_bootstrap,
+    deps_fontawesome,
+    deps_shinydashboard,
+)
+from ._icons import icon as cached_icon
+from ._icons import icon_refs, icons_css
+from ._metrics import RENDER_STATS_OUTPUT
+from ._purge import class_names, deps_adminlte_purged
+from ._sidebar import lazy_tab_contents
 
 
 def page(
@@ -16,6 +27,12 @@ def page(
     *,
     title: ht.TagChildArg = None,
     lang: Optional[str] = None,
+    cdn: bool = False,
+    icons: Literal["all", "subset"] = "all",
+    purge_css: Union[bool, Iterable[str]] = False,
+    direction: Literal["ltr", "rtl"] = "ltr",
+    dark: bool = False,
+    client_timing: bool = False,
 ) -> ht.Tag:
     """A shinydashboard page, for use as a Shiny app's UI.
 
@@ -32,6 +49,39 @@ def page(
         The contents of the ``<title>`` tag, which is used by the browser to label browser tabs and bookmarks.
     lang
         The ``lang`` attribute of the ``<html>`` tag; for example, ``"en"`` for English.
+    cdn
+        If ``True``, load Font Awesome and Bootstrap's JavaScript from the jsDelivr CDN.
+        By default, the copies bundled with this package are served along with the rest
+        of the app, so the page doesn't depend on any third-party servers.
+    icons
+        How to provide the Font Awesome icons used with ``<i class="fas fa-...">`` tags.
+        With ``"all"`` (the default), the complete Font Awesome stylesheet and webfonts
+        are loaded. With ``"subset"``, the page is scanned for the icons it uses, and
+        only those are included, inline, as a few KB of CSS (icons in lazy
+        :func:`nav_content` panes included). Icons that only appear in UI rendered
+        later by the server (and icons from :func:`icon`, which are always inline
+        SVGs) aren't part of the scan, so use ``"subset"`` only if dynamic UI doesn't
+        rely on Font Awesome's classes.
+    purge_css
+        If ``True``, serve a copy of AdminLTE's stylesheet with only the rules that can
+        apply to this page, rather than the whole ~240 KB. The classes in the page
+        (including in lazy :func:`nav_content` panes) are kept, along with every class
+        that shinydashboard's components (including :func:`render_value_box` and the
+        like) and AdminLTE's and Bootstrap's scripts can use. Pass a list of class names instead of ``True`` to keep those as well,
+        e.g. for classes in UI rendered with ``render.ui``. The purged stylesheet is
+        cached on disk (in the temp directory, or ``$SHINYDASHBOARD_CACHE_DIR``), so
+        it's only computed once for any given page.
+    direction
+        The text direction of the page. With ``"rtl"``, the page is laid out right to
+        left, using AdminLTE's right-to-left stylesheet.
+    dark
+        If ``True``, use AdminLTE's dark mode colors.
+    client_timing
+        If ``True``, time how long the dashboard takes, in the browser, to start up, to
+        switch tabs, and to render dynamic menus (with ``performance.mark()``, so they
+        also show up in the browser's developer tools). The timings are sent to the
+        server, which collects them for :func:`client_timings`; this needs
+        :func:`dashboard_server`.
 
     Returns
     -------
@@ -48,19 +98,103 @@ def page(
     ... )
     """
 
+    page_body = _body(
+        header=header,
+        sidebar=sidebar,
+        body=body,
+        client_timing=client_timing,
+    )
+    # What the page can show, including the lazy panes, whose contents are inserted
+    # later
+    scanned = (
+        ht.TagList(page_body, *lazy_tab_contents(page_body))
+        if icons == "subset" or purge_css
+        else page_body
+    )
     return tags.html(
-        _head(title=title),
-        _body(
-            header=header,
-            sidebar=sidebar,
-            body=body,
+        _head(
+            title=title,
+            cdn=cdn,
+            icons=icons_css(icon_refs(scanned)) if icons == "subset" else None,
+            direction=direction,
+            dark=dark,
+            adminlte=(
+                _purged_deps(scanned, purge_css, direction, dark) if purge_css else None
+            ),
         ),
+        page_body,
         lang=lang,
+        dir="rtl" if direction == "rtl" else None,
+    )
+
+
+def _head(
+    *,
+    title: ht.TagChildArg = None,
+    cdn: bool = False,
+    icons: Optional[ht.HTML] = None,
+    direction: Literal["ltr", "rtl"] = "ltr",
+    dark: bool = False,
+    adminlte: Optional[List[ht.HTMLDependency]] = None,
+) -> ht.Tag:
+    # The <head> is the same for every page with a given title, so when the title is a
+    # plain string (as it nearly always is), render its static markup once and reuse it;
+    # this matters for function-style UIs, which build the page on every request. The
+    # dependencies stay as objects so that Shiny can find and serve them.
+    #
+    # `icons` is the CSS for the page's subset of Font Awesome icons, which replaces the
+    # full Font Awesome stylesheet, and `adminlte` replaces the AdminLTE dependencies.
+    fontawesome = icons is None
+    icons_style = None if fontawesome else tags.style(icons)
+    if title is None or (isinstance(title, str) and not isinstance(title, ht.HTML)):
+        head = _head_html(title, cdn, fontawesome)
+    else:
+        head = _head_tags(title=title, cdn=cdn, fontawesome=fontawesome)
+    deps = _head_deps(cdn, fontawesome, direction, dark)
+    if adminlte is not None:
+        deps = [
+            *[x for x in deps if x.name == "font-awesome" or x.name == "bootstrap"],
+            *adminlte,
+            *[x for x in deps if x.name == "shinydashboard"],
+        ]
+    return tags.head(head, icons_style, deps)
+
+
+def _purged_deps(
+    page: ht.TagChild,
+    purge_css: Union[bool, Iterable[str]],
+    direction: Literal["ltr", "rtl"],
+    dark: bool,
+) -> List[ht.HTMLDependency]:
+    used = class_names(page)
+    if not isinstance(purge_css, bool):
+        used.update(purge_css)
+    return deps_adminlte_purged(used, direction, dark)
+
+
+@lru_cache(maxsize=32)
+def _head_html(title: Optional[str], cdn: bool, fontawesome: bool) -> ht.HTML:
+    return ht.HTML(
+        _head_tags(title=title, cdn=cdn, fontawesome=fontawesome).get_html_string()
     )
 
 
-def _head(*, title: ht.TagChildArg = None) -> ht.Tag:
-    return tags.head(
+@lru_cache(maxsize=None)
+def _head_deps(
+    cdn: bool, fontawesome: bool, direction: Literal["ltr", "rtl"], dark: bool
+) -> List[ht.HTMLDependency]:
+    deps: List[ht.HTMLDependency] = []
+    if fontawesome and not cdn:
+        deps.extend(deps_fontawesome())
+    if not cdn:
+        deps.extend(deps_bootstrap())
+    return [*deps, *deps_adminlte(direction, dark), *deps_shinydashboard()]
+
+
+def _head_tags(
+    *, title: ht.TagChildArg = None, cdn: bool = False, fontawesome: bool = True
+) -> ht.TagList:
+    return ht.TagList(
         tags.meta(charset="utf-8"),
         tags.meta(
             name="viewport",
@@ -68,21 +202,27 @@ def _head(*, title: ht.TagChildArg = None) -> ht.Tag:
         ),
         tags.meta({"http-equiv": "x-ua-compatible", "content": "ie=edge"}),
         tags.title(title),
-        deps_adminlte(),
-        deps_shinydashboard(),
-        tags.link(
-            rel="stylesheet",
-            href="https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@5.15.4/css/all.min.css",
-            integrity="sha256-mUZM63G8m73Mcidfrv5E+Y61y7a12O5mW4ezU3bxqW4=",
-            crossorigin="anonymous",
-        ),
-        tags.script(
-            {
-                "src": "https://cdn.jsdelivr.net/npm/bootstrap@5.2.0/dist/js/bootstrap.bundle.min.js",
-                "integrity": "sha384-A3rJD856KowSb7dwlZdYEkO39Gagi7vIsF0jrRAoQmDKKtQBHUuLZ9AsSv4jD4Xa",
-                "crossorigin": "anonymous",
-            }
-        ),
+        _cdn_fontawesome() if cdn and fontawesome else None,
+        _cdn_bootstrap() if cdn else None,
+    )
+
+
+def _cdn_fontawesome() -> ht.Tag:
+    return tags.link(
+        rel="stylesheet",
+        href="https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@5.15.4/css/all.min.css",
+        integrity="sha256-mUZM63G8m73Mcidfrv5E+Y61y7a12O5mW4ezU3bxqW4=",
+        crossorigin="anonymous",
+    )
+
+
+def _cdn_bootstrap() -> ht.Tag:
+    return tags.script(
+        {
+            "src": "https://cdn.jsdelivr.net/npm/bootstrap@5.2.2/dist/js/bootstrap.bundle.min.js",
+            "integrity": "sha384-OERcA2EqjJCMA+/3y+gxIOqMEjwtxJY7qPCqsdltbNJuaOe923+mo//f6V8Qbsw3",
+            "crossorigin": "anonymous",
+        }
     )
 
 
@@ -90,10 +230,13 @@ def _body(
     header: ht.TagChildArg = None,
     sidebar: ht.TagChildArg = None,
     body: ht.TagChildArg = None,
+    client_timing: bool = False,
 ) -> ht.Tag:
     return tags.body(
         {"class": "layout-fixed"},
         {"class": "remove-sidebar"} if sidebar is None else None,
+        # Read by timing.ts
+        {"data-client-timing": "1"} if client_timing else None,
         tags.div(
             {"class": "wrapper"},
             header,
@@ -108,6 +251,8 @@ def _body(
 def header(
     children: Optional[List[ht.TagChildArg]] = None,
     children_right: Optional[List[ht.TagChildArg]] = None,
+    *,
+    render_stats: bool = False,
 ) -> ht.Tag:
     """A header, for use in :func:`page`.
 
@@ -121,6 +266,11 @@ def header(
         A list of items to display on the left side of the header, like :func:`header_link`.
     children_right
         A list of items to display on the right side of the header, like :func:`menu_dropdown`.
+    render_stats
+        If ``True``, add a button on the right that opens a panel with the
+        :func:`output_stats` of the dashboard's outputs (which are slowest to render,
+        and send the most), refreshed every 2 seconds while it's open. For debugging;
+        it needs ``dashboard_server(render_stats=True)``.
 
     Returns
     -------
@@ -152,6 +302,49 @@ def header(
             tags.ul(
                 {"class": "navbar-nav ms-auto"},
                 children_right,
+                _render_stats_panel() if render_stats else None,
+            ),
+        ),
+    )
+
+
+def _render_stats_panel() -> ht.Tag:
+    # Filled in by dashboard_server(render_stats=True). Shiny doesn't render outputs
+    # that are hidden, so the stats are only sent while the dropdown is open.
+    return tags.li(
+        {"class": "nav-item dropdown"},
+        tags.a(
+            {
+                "class": "nav-link",
+                "data-bs-toggle": "dropdown",
+                "href": "#",
+                "role": "button",
+                "title": "Render stats",
+            },
+            cached_icon("gauge"),
+        ),
+        tags.div(
+            {
+                "class": "dropdown-menu dropdown-menu-lg dropdown-menu-end p-2",
+                "style": "max-width: none;",
+            },
+            tags.table(
+                {
+                    "id": RENDER_STATS_OUTPUT,
+                    "class": "shinydashboard-stats-output table table-sm "
+                    "table-striped small mb-0",
+                },
+                tags.thead(
+                    tags.tr(
+                        tags.th("Output"),
+                        tags.th({"class": "text-end"}, "Renders"),
+                        tags.th({"class": "text-end"}, "Suppressed"),
+                        tags.th({"class": "text-end"}, "Cached"),
+                        tags.th({"class": "text-end"}, "ms/render"),
+                        tags.th({"class": "text-end"}, "KB sent"),
+                    )
+                ),
+                tags.tbody(),
             ),
         ),
     )
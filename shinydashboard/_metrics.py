@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# The output that shows output_stats() in the panel of header(render_stats=True)
+RENDER_STATS_OUTPUT = "shinydashboard_render_stats"
+
+
+class RenderStats(NamedTuple):
+    """Counts of the updates made by shinydashboard's render decorators, across all
+    sessions."""
+
+    sent: int
+    """Renderings that were sent to the browser (in full, or as a patch)."""
+    suppressed: int
+    """Renderings that weren't sent, because they were the same as what the browser was
+    already showing."""
+
+
+class _Counters:
+    # Not itertools.count() and friends, since renderers can run in other threads
+    def __init__(self) -> None:
+        self.sent = 0
+        self.suppressed = 0
+        self._lock = threading.Lock()
+
+    def record(self, *, sent: int = 0, suppressed: int = 0) -> None:
+        with self._lock:
+            self.sent += sent
+            self.suppressed += suppressed
+
+    def stats(self) -> RenderStats:
+        with self._lock:
+            return RenderStats(self.sent, self.suppressed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.sent = self.suppressed = 0
+
+
+_counters = _Counters()
+
+
+class OutputStats(NamedTuple):
+    """Statistics for one output of shinydashboard's render decorators, across all
+    sessions; see :func:`output_stats`."""
+
+    renders: int
+    """Times the output was rendered."""
+    suppressed: int
+    """Renderings that weren't sent, because they were the same as what the browser was
+    already showing."""
+    cached: int
+    """Renderings whose value came from the output's ``cache``."""
+    seconds: float
+    """Total wall time spent rendering the output, including the decorated function."""
+    bytes: int
+    """Total size of the updates sent to the browser, as JSON."""
+
+
+# The output whose rendering is in progress, in this context
+_current_output: ContextVar[Optional[str]] = ContextVar(
+    "shinydashboard_current_output", default=None
+)
+
+
+class _OutputCounters:
+    # Per-output statistics; only recorded once enabled, since measuring the size of
+    # each update costs another serialization
+    def __init__(self) -> None:
+        self.enabled = False
+        self._stats: Dict[str, OutputStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        *,
+        renders: int = 0,
+        suppressed: int = 0,
+        cached: int = 0,
+        seconds: float = 0,
+        bytes: int = 0,
+    ) -> None:
+        with self._lock:
+            old = self._stats.get(name, _no_stats)
+            self._stats[name] = OutputStats(
+                old.renders + renders,
+                old.suppressed + suppressed,
+                old.cached + cached,
+                old.seconds + seconds,
+                old.bytes + bytes,
+            )
+
+    def record_current(self, *, suppressed: int = 0, cached: int = 0) -> None:
+        name = _current_output.get()
+        if self.enabled and name is not None:
+            self.record(name, suppressed=suppressed, cached=cached)
+
+    def stats(self) -> Dict[str, OutputStats]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_no_stats = OutputStats(0, 0, 0, 0.0, 0)
+
+_output_counters = _OutputCounters()
+
+
+class ClientTiming(NamedTuple):
+    """A histogram of how long an event took in the browsers showing the dashboard;
+    see :func:`client_timings`."""
+
+    count: int
+    """Number of times the event was timed."""
+    seconds: float
+    """Total duration of the events."""
+    buckets: Tuple[int, ...]
+    """Number of events that took at most each of :data:`TIMING_BUCKETS` seconds."""
+
+
+# The upper bounds (in seconds) of ClientTiming's buckets
+TIMING_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# The events that timing.ts reports. Others are ignored, since clients can send
+# anything.
+CLIENT_EVENTS = ("boot", "tab_switch", "ensure_tab", "menu_render")
+
+
+class _ClientTimings:
+    def __init__(self) -> None:
+        self._timings: Dict[str, ClientTiming] = {}
+        self._lock = threading.Lock()
+
+    def record(self, reports: object) -> None:
+        # `reports` is a batch of [event, milliseconds] pairs, from timing.ts
+        if not isinstance(reports, list):
+            return
+        for x in reports:
+            if not (isinstance(x, list) and len(x) == 2 and x[0] in CLIENT_EVENTS):
+                continue
+            event, ms = x
+            if not isinstance(ms, (int, float)) or not math.isfinite(ms) or ms < 0:
+                continue
+            seconds = ms / 1000
+            with self._lock:
+                old = self._timings.get(event, _no_timing)
+                self._timings[event] = ClientTiming(
+                    old.count + 1,
+                    old.seconds + seconds,
+                    tuple(
+                        n + (seconds <= le)
+                        for n, le in zip(old.buckets, TIMING_BUCKETS)
+                    ),
+                )
+
+    def timings(self) -> Dict[str, ClientTiming]:
+        with self._lock:
+            return dict(self._timings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+_no_timing = ClientTiming(0, 0.0, (0,) * len(TIMING_BUCKETS))
+
+_client_timings = _ClientTimings()
+
+
+def payload_size(value: Any) -> int:
+    """The size of an output's value, as sent to the browser."""
+    if value is None:
+        return 0
+    return len(json.dumps(value).encode("utf-8"))
+
+
+def render_stats() -> RenderStats:
+    """How many updates shinydashboard's render decorators have sent, and how many they
+    suppressed because the output hadn't changed.
+
+    Returns
+    -------
+        A :class:`RenderStats` named tuple.
+    """
+    return _counters.stats()
+
+
+def reset_render_stats() -> None:
+    """Reset the counts reported by :func:`render_stats` (and :func:`output_stats` and
+    :func:`client_timings`) to zero."""
+    _counters.clear()
+    _output_counters.clear()
+    _client_timings.clear()
+
+
+def enable_output_stats(enabled: bool = True) -> None:
+    """Start (or stop) recording the statistics reported by :func:`output_stats`.
+
+    They're off by default, since they cost a little time for each rendering.
+    ``dashboard_server(render_stats=True)`` turns them on.
+
+    Parameters
+    ----------
+    enabled
+        Whether to record the statistics.
+    """
+    _output_counters.enabled = enabled
+
+
+def output_stats() -> Dict[str, OutputStats]:
+    """Per-output statistics for shinydashboard's render decorators: how often each
+    output was rendered, how long that took, and how much was sent.
+
+    The outputs are identified by their ids, and the statistics of all sessions are
+    added up. They're only recorded after :func:`enable_output_stats` is called.
+
+    Returns
+    -------
+        A dictionary of :class:`OutputStats` named tuples, keyed by output id.
+    """
+    return _output_counters.stats()
+
+
+def client_timings() -> Dict[str, ClientTiming]:
+    """How long the dashboard has taken to do things in the browser, as reported by
+    pages made with ``page(client_timing=True)``, for all sessions.
+
+    The events are:
+
+    - ``"boot"``: from navigating to the page until its first tab is shown
+    - ``"tab_switch"``: from clicking a sidebar tab until its pane has been shown
+    - ``"ensure_tab"``: choosing the tab to show, when the page starts up or a sidebar
+      menu is rendered
+    - ``"menu_render"``: rendering a dynamic menu, e.g. from
+      :func:`render_menu_dropdown`
+
+    Returns
+    -------
+        A dictionary of :class:`ClientTiming` histograms, keyed by event.
+    """
+    return _client_timings.timings()
+
+
+# The metrics in output_stats_text(): the OutputStats field, and the metric's name and
+# help text
+_prometheus_metrics = [
+    ("renders", "shinydashboard_output_renders_total", "Renderings of the output."),
+    (
+        "suppressed",
+        "shinydashboard_output_suppressed_total",
+        "Renderings that weren't sent, since they hadn't changed.",
+    ),
+    (
+        "cached",
+        "shinydashboard_output_cached_total",
+        "Renderings whose value came from the cache.",
+    ),
+    (
+        "seconds",
+        "shinydashboard_output_render_seconds_total",
+        "Time spent rendering the output.",
+    ),
+    (
+        "bytes",
+        "shinydashboard_output_sent_bytes_total",
+        "Size of the updates sent for the output.",
+    ),
+]
+
+
+def output_stats_text() -> str:
+    """The statistics from :func:`output_stats` (and the histograms from
+    :func:`client_timings`), in the `Prometheus text format
+    <https://prometheus.io/docs/instrumenting/exposition_formats/>`_, e.g. for a
+    ``/metrics`` route.
+
+    Returns
+    -------
+        A string, with one sample per output for each metric.
+    """
+    stats = sorted(output_stats().items())
+    lines: List[str] = []
+    for field, metric, help in _prometheus_metrics:
+        lines.append(f"# HELP {metric} {help}")
+        lines.append(f"# TYPE {metric} counter")
+        for name, x in stats:
+            label = _label_value(name)
+            lines.append(f'{metric}{{output="{label}"}} {getattr(x, field)}')
+
+    timings = sorted(client_timings().items())
+    if timings:
+        metric = "shinydashboard_client_event_seconds"
+        lines.append(f"# HELP {metric} Time taken by events in the browser.")
+        lines.append(f"# TYPE {metric} histogram")
+    for event, t in timings:
+        for n, le in zip(t.buckets, TIMING_BUCKETS):
+            lines.append(f'{metric}_bucket{{event="{event}",le="{le}"}} {n}')
+        lines.append(f'{metric}_bucket{{event="{event}",le="+Inf"}} {t.count}')
+        lines.append(f'{metric}_sum{{event="{event}"}} {t.seconds}')
+        lines.append(f'{metric}_count{{event="{event}"}} {t.count}')
+    return "\n".join(lines) + "\n"
+
+
+def _label_value(x: str) -> str:
+    return x.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _stats_rows(stats: Dict[str, OutputStats]) -> List[List[Any]]:
+    # The rows of the render stats panel's table, which shinydashboard.js formats; the
+    # slowest outputs first
+    rows = sorted(stats.items(), key=lambda x: x[1].seconds, reverse=True)
+    return [[name, *x] for name, x in rows]
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple, Union, cast
+
+import htmltools as ht
+from htmltools import tags
+from shiny import reactive
+from shiny.session import Session
+
+from ._dropdown import menu_dropdown, render_menu_dropdown
+from ._icons import icon as cached_icon
+from ._server import _with_key, insert_menu_item, remove_menu_item, set_menu_badge
+from ._utils import MISSING, MISSING_TYPE
+
+# The key of a menu's "Load more" item
+_MORE_KEY = "more"
+
+
+class NotificationStore:
+    """A feed of notifications, shared by all sessions, that's shown in a
+    :func:`menu_dropdown`.
+
+    The store keeps the most recent ``capacity`` items; adding one more evicts the
+    oldest. Each session's menu shows the newest ``page_size`` items at first, plus a
+    "Load more" item that adds the next ``page_size`` older ones; new items are added
+    to the top of the menu (and the oldest shown removed) as they arrive, one at a time,
+    with :func:`insert_menu_item`. So the cost of a new notification, both on the
+    server and in the browser, doesn't grow with the number of notifications.
+
+    The menu's badge shows how many of the store's items the session hasn't seen;
+    they're marked as seen when the menu is opened.
+
+    Parameters
+    ----------
+    capacity
+        The maximum number of items to keep.
+    page_size
+        The number of items to show at first, and to add for each "Load more".
+    icon
+        The menu's icon; by default, a bell.
+    header
+        Content to display above the menu's items.
+    badge_status
+        The color of the badge that counts the unseen items.
+
+    Examples
+    --------
+    >>> alerts = sdb.NotificationStore(capacity=500)
+    >>> app_ui = sdb.page(
+    ...     sdb.header(children_right=[sdb.output_menu_dropdown("alerts")]), ...
+    ... )
+    >>> def server(input, output, session):
+    ...     sdb.dashboard_server(notifications={"alerts": alerts})
+    >>> # Then, from reactive code (e.g. an Effect that polls for alerts):
+    >>> alerts.add(sdb.item_notification("Disk almost full", time="now"))
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        *,
+        page_size: int = 10,
+        icon: Union[ht.TagChild, MISSING_TYPE] = MISSING,
+        header: Optional[ht.TagChild] = None,
+        badge_status: str = "warning",
+    ) -> None:
+        if capacity < 1 or page_size < 1:
+            raise ValueError("capacity and page_size must be at least 1")
+        self.capacity = capacity
+        self.page_size = page_size
+        self.icon = icon
+        self.header = header
+        self.badge_status = badge_status
+        # (key, item) pairs, oldest first; keys increase with each item added
+        self._items: Deque[Tuple[int, ht.TagChild]] = deque(maxlen=capacity)
+        self._last_key = -1
+        self._lock = threading.Lock()
+        # Changes whenever the items do, so that sessions can update their menus
+        self._version = reactive.Value(0)
+
+    def add(self, item: ht.TagChild) -> int:
+        """Add an item, such as an :func:`item_notification`, and return its key.
+
+        Call this from reactive code, such as a :class:`reactive.Effect`; the menus of
+        all the sessions are updated when the reactive environment is next flushed.
+        """
+        with self._lock:
+            self._last_key += 1
+            key = self._last_key
+            self._items.append((key, item))
+        self._bump()
+        return key
+
+    def clear(self) -> None:
+        """Remove all of the items."""
+        with self._lock:
+            self._items.clear()
+        self._bump()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _bump(self) -> None:
+        with reactive.isolate():
+            self._version.set(self._version() + 1)
+
+    def _newer(self, key: int) -> List[Tuple[int, ht.TagChild]]:
+        # The items added after `key`, oldest first
+        with self._lock:
+            res: List[Tuple[int, ht.TagChild]] = []
+            for x in reversed(self._items):
+                if x[0] <= key:
+                    break
+                res.append(x)
+        res.reverse()
+        return res
+
+    def _older(self, key: int, n: int) -> List[Tuple[int, ht.TagChild]]:
+        # The (up to) `n` newest items added before `key`, newest first
+        with self._lock:
+            res: List[Tuple[int, ht.TagChild]] = []
+            for x in reversed(self._items):
+                if len(res) == n:
+                    break
+                if x[0] < key:
+                    res.append(x)
+        return res
+
+    def _oldest_key(self) -> int:
+        with self._lock:
+            return self._items[0][0] if self._items else self._last_key + 1
+
+
+class _MenuState:
+    # What one session's menu is showing
+    def __init__(self, limit: int) -> None:
+        # The keys of the items shown, newest first
+        self.shown: Deque[int] = deque()
+        # How many items may be shown; grows with each "Load more"
+        self.limit = limit
+        # The newest key that the menu knows about, and the newest that was seen
+        self.newest = -1
+        self.seen = -1
+        self.has_more = False
+        self.unseen = 0
+        self.rendered = False
+
+
+def _serve_notifications(id: str, store: NotificationStore, session: Session) -> None:
+    state = _MenuState(store.page_size)
+
+    @session.output(id=id)
+    @render_menu_dropdown
+    def _render_menu():
+        # Rendered once per session; after that, the menu is changed in place
+        with store._lock:
+            state.newest = store._last_key
+        items = store._older(state.newest + 1, state.limit)
+        state.shown = deque(key for key, _ in items)
+        state.has_more = _has_more(store, state)
+        state.unseen = len(store._newer(state.seen))
+        state.rendered = True
+
+        children: List[ht.TagChild] = [_item(key, x) for key, x in items]
+        if state.has_more:
+            children.append(_more_item())
+        menu = menu_dropdown(
+            cached_icon("bell") if isinstance(store.icon, MISSING_TYPE) else store.icon,
+            *children,
+            badge_value=state.unseen or None,
+            badge_status=store.badge_status,
+            header=store.header,
+        )
+        return cast(ht.Tag, menu).add_class("shinydashboard-notifications")
+
+    @reactive.Effect
+    def _add_new_items():
+        store._version()
+        if not state.rendered:
+            return
+        with reactive.isolate():
+            for key, item in store._newer(state.newest):
+                insert_menu_item(id, _item(key, item), session=session)
+                state.shown.appendleft(key)
+                state.newest = key
+            # Drop the items that no longer fit, or that were evicted from the store
+            oldest = store._oldest_key()
+            while state.shown and (
+                len(state.shown) > state.limit or state.shown[-1] < oldest
+            ):
+                remove_menu_item(id, _item_key(state.shown.pop()), session=session)
+            _update_more(id, store, state, session)
+            _update_badge(id, store, state, session)
+
+    @reactive.Effect
+    @reactive.event(session.input[f"{id}_load_more"])
+    def _load_more():
+        if not state.rendered:
+            return
+        before = state.shown[-1] if state.shown else state.newest + 1
+        for key, item in store._older(before, store.page_size):
+            insert_menu_item(id, _item(key, item), position="last", session=session)
+            state.shown.append(key)
+        state.limit = max(state.limit, len(state.shown))
+        _update_more(id, store, state, session)
+
+    @reactive.Effect
+    @reactive.event(session.input[f"{id}_opened"])
+    def _mark_seen():
+        state.seen = state.newest
+        _update_badge(id, store, state, session)
+
+
+def _has_more(store: NotificationStore, state: _MenuState) -> bool:
+    return bool(state.shown) and store._oldest_key() < state.shown[-1]
+
+
+def _update_more(
+    id: str, store: NotificationStore, state: _MenuState, session: Session
+) -> None:
+    has_more = _has_more(store, state)
+    if has_more == state.has_more:
+        return
+    state.has_more = has_more
+    if has_more:
+        insert_menu_item(id, _more_item(), position="last", session=session)
+    else:
+        remove_menu_item(id, _MORE_KEY, session=session)
+
+
+def _update_badge(
+    id: str, store: NotificationStore, state: _MenuState, session: Session
+) -> None:
+    unseen = len(store._newer(state.seen))
+    if unseen == state.unseen:
+        return
+    state.unseen = unseen
+    set_menu_badge(id, unseen or None, status=store.badge_status, session=session)
+
+
+def _item_key(key: int) -> str:
+    return f"n{key}"
+
+
+def _item(key: int, item: ht.TagChild) -> ht.TagChild:
+    return _with_key(item, _item_key(key))
+
+
+def _more_item() -> ht.Tag:
+    # Handled by shinydashboard.js, which sets the "{id}_load_more" input
+    return tags.a(
+        "Load more",
+        href="#",
+        class_="dropdown-item dropdown-footer shinydashboard-menu-more",
+        data_menu_key=_MORE_KEY,
+    )
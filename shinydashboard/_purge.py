@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Literal, Set
+
+import htmltools as ht
+from htmltools import HTMLDependency
+
+from ._compress import compress_file
+from ._htmldeps import adminlte_stylesheets, dep_adminlte_js, registered
+from ._utils import is_tag, is_tag_list, package_file
+
+# Purged stylesheets are written here, one directory per content hash, and reused
+# across processes; set SHINYDASHBOARD_CACHE_DIR to keep them somewhere else.
+_cache_dir = os.environ.get(
+    "SHINYDASHBOARD_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "shinydashboard-cache"),
+)
+
+_class_attr_re = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_selector_class_re = re.compile(r"\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)")
+# Classes inside these pseudo-classes don't need to be present for the selector to
+# match (or only some of them do), so they're never a reason to drop a selector
+_lenient_pseudo_re = re.compile(r":(?:not|is|where|has)\([^()]*\)")
+_js_word_re = re.compile(r"[_a-zA-Z][_a-zA-Z0-9-]*")
+# The syntax that matters for finding rule boundaries
+_comments_re = re.compile(r"\s*(?:/\*.*?\*/\s*)*", re.S)
+_css_token_re = re.compile(
+    r"""[{};]|/\*.*?\*/|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'""", re.S
+)
+
+# At-rules whose blocks hold more rules, which are purged in turn; other at-rules
+# (@font-face, @keyframes, @page, ...) are kept as they are.
+_nested_at_rules = ("@media", "@supports", "@container", "@layer", "@document")
+
+# The scripts that add and remove classes in the browser; any word in them that names
+# a class is kept, e.g. "show", "collapsing" and "sidebar-open".
+_page_scripts = (
+    ("www/adminlte", "js/adminlte.min.js"),
+    ("www/bootstrap", "js/bootstrap.bundle.min.js"),
+    ("shinydashboard", "js/shinydashboard.js"),
+)
+
+_bootstrap_colors = (
+    "primary",
+    "secondary",
+    "success",
+    "info",
+    "warning",
+    "danger",
+    "light",
+    "dark",
+)
+
+
+def class_names(x: ht.TagChildArg) -> Set[str]:
+    """All of the class names used in a tag tree, including in raw :class:`HTML`."""
+    names: Set[str] = set()
+    _find_class_names(x, names)
+    return names
+
+
+def _find_class_names(x: object, names: Set[str]) -> None:
+    if is_tag(x):
+        classes = x.attrs.get("class")  # type: ignore[union-attr]
+        if classes:
+            names.update(str(classes).split())
+        _find_class_names(x.children, names)  # type: ignore[union-attr]
+    elif isinstance(x, ht.HTML):
+        for m in _class_attr_re.finditer(str(x)):
+            names.update((m.group(1) or m.group(2)).split())
+    elif is_tag_list(x):
+        for child in x:
+            _find_class_names(child, names)
+
+
+def deps_adminlte_purged(
+    used: Iterable[str],
+    direction: Literal["ltr", "rtl"] = "ltr",
+    dark: bool = False,
+) -> List[HTMLDependency]:
+    """Like :func:`deps_adminlte`, but with stylesheets that only have the rules that
+    can apply to a page using the ``used`` classes.
+
+    Besides ``used``, every class that shinydashboard's components can emit (including
+    from server-side renderers) and every class that the page's scripts can add is kept.
+    """
+    used = frozenset(used) | _always_used()
+    deps = [dep_adminlte_js()]
+    for name, subdir, href in adminlte_stylesheets(direction, dark):
+        css_file = purged_css(os.path.join(subdir, href), used)
+        deps.append(
+            registered(
+                HTMLDependency(
+                    name + "-purged",
+                    # The directory name is the content hash, so the URL changes with
+                    # the CSS
+                    "4.0.0-alpha.1+" + os.path.basename(os.path.dirname(css_file)),
+                    source={"subdir": os.path.dirname(css_file)},
+                    stylesheet={"href": os.path.basename(css_file)},
+                )
+            )
+        )
+    return deps
+
+
+@lru_cache(maxsize=32)
+def purged_css(path: str, used: FrozenSet[str]) -> str:
+    """Purge one of the package's stylesheets, returning the path of the cached result
+    on disk."""
+    with open(package_file(path), "rb") as f:
+        source = f.read()
+
+    key = hashlib.sha256(source)
+    key.update("\n".join(sorted(used)).encode("utf-8"))
+    out_dir = os.path.join(_cache_dir, "purged", key.hexdigest()[:16])
+    out_file = os.path.join(out_dir, os.path.basename(path))
+    if os.path.exists(out_file):
+        return out_file
+
+    css = purge_css(source.decode("utf-8"), used)
+    os.makedirs(out_dir, exist_ok=True)
+    # Write to a temporary file first, so that other processes never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(css)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, out_file)
+    compress_file(out_file)
+    return out_file
+
+
+def purge_css(css: str, used: Iterable[str]) -> str:
+    """Remove the style rules whose selectors all require a class that isn't ``used``.
+
+    Rules inside ``@media`` and similar blocks are purged too (and blocks left empty
+    are dropped); everything else is kept as it is.
+    """
+    out: List[str] = []
+    _purge_block(css, 0, set(used), out)
+    return "".join(out)
+
+
+def _purge_block(css: str, pos: int, used: Set[str], out: List[str]) -> int:
+    # Purges the rules from `pos` up to the end of the enclosing block, returning the
+    # position just after its closing brace (or the end of the stylesheet)
+    start = pos
+    while True:
+        prelude_start = start
+        m = _next_token(css, start, "{};")
+        if m is None:
+            out.append(css[prelude_start:])
+            return len(css)
+        token = m.group()
+        if token == "}":
+            out.append(css[prelude_start : m.start()])
+            return m.end()
+        if token == ";":
+            # A statement at-rule, like @charset or @import
+            out.append(css[prelude_start : m.end()])
+            start = m.end()
+            continue
+
+        # Comments before a rule (like the license) stay, even if the rule doesn't
+        comments = _comments_re.match(css, prelude_start, m.start())
+        assert comments is not None
+        out.append(comments.group())
+        prelude = css[comments.end() : m.start()]
+        stripped = prelude.strip()
+        if stripped.startswith(_nested_at_rules):
+            inner: List[str] = []
+            start = _purge_block(css, m.end(), used, inner)
+            if any(x.strip() for x in inner):
+                out.extend((prelude, "{", *inner, "}"))
+        elif stripped.startswith("@"):
+            start = _skip_block(css, m.end())
+            out.append(css[comments.end() : start])
+        else:
+            start = _skip_block(css, m.end())
+            selectors = [x for x in _split_selectors(prelude) if _keep(x, used)]
+            if selectors:
+                out.extend((",".join(selectors), css[m.start() : start]))
+
+
+def _next_token(css: str, pos: int, tokens: str):
+    while True:
+        m = _css_token_re.search(css, pos)
+        if m is None or (len(m.group()) == 1 and m.group() in tokens):
+            return m
+        pos = m.end()
+
+
+def _skip_block(css: str, pos: int) -> int:
+    depth = 1
+    while depth > 0:
+        m = _next_token(css, pos, "{}")
+        if m is None:
+            return len(css)
+        depth += 1 if m.group() == "{" else -1
+        pos = m.end()
+    return pos
+
+
+def _split_selectors(prelude: str) -> List[str]:
+    selectors: List[str] = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(prelude):
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            selectors.append(prelude[start:i])
+            start = i + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def _keep(selector: str, used: Set[str]) -> bool:
+    if "\\" in selector:
+        # Escaped characters in class names; not worth the trouble of parsing
+        return True
+    selector = _lenient_pseudo_re.sub("", selector)
+    return all(x in used for x in _selector_class_re.findall(selector))
+
+
+@lru_cache(maxsize=None)
+def _always_used() -> FrozenSet[str]:
+    return _component_classes() | _script_words()
+
+
+def _component_classes() -> FrozenSet[str]:
+    # Render one of (nearly) everything, to find the classes that the components emit.
+    # This covers what server-side renderers may send later, which isn't in the page.
+    from ._card import card
+    from ._dropdown import item_message, item_notification, menu_dropdown
+    from ._sidebar import sidebar, sidebar_menu_link, sidebar_submenu
+    from ._valuebox import info_box, value_box
+
+    samples = ht.TagList(
+        card("Title", "Contents", closeable=True, maximizable=True, width=6),
+        value_box("1", "Subtitle", icon="icon", href="#", footer="Footer", width=6),
+        value_box("1", gradient=True),
+        info_box("Title", "1", subtitle="Subtitle", href="#", fill=True, width=6),
+        info_box("Title", "1", gradient=True),
+        menu_dropdown(
+            "icon",
+            item_message("Sender", "Message", icon="icon", time="now", href="#"),
+            item_message("Sender", "Message"),
+            item_notification("Message", time="now", href="#"),
+            item_notification("Message"),
+            header="Header",
+        ),
+        sidebar(
+            "Title",
+            sidebar_submenu("Submenu", sidebar_menu_link("Link", "#")),
+        ),
+    )
+    names = class_names(samples)
+    for color in _bootstrap_colors:
+        names.update((f"bg-{color}", f"card-{color}"))
+    return frozenset(names)
+
+
+def _script_words() -> FrozenSet[str]:
+    words: Set[str] = set()
+    for subdir, path in _page_scripts:
+        with open(package_file(subdir, path), encoding="utf-8") as f:
+            words.update(_js_word_re.findall(f.read()))
+    return frozenset(words)
@@ -0,0 +1,880 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import math
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from inspect import iscoroutinefunction
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+import htmltools as ht
+from shiny import reactive, render
+from shiny.render.renderer import Renderer
+from shiny.session import require_active_session
+from shiny.types import SilentCancelOutputException
+
+from ._dropdown import output_menu_dropdown
+from ._metrics import _counters, _current_output, _output_counters, payload_size
+from ._utils import is_tag
+
+if TYPE_CHECKING:
+    from shiny import App, Session
+
+BoxFunc = Callable[[], Any]
+
+# A flattened rendering of a box: a skeleton string describing the structure of the
+# tag tree (tag names, attribute names, and which elements hold markup rather than
+# other elements), plus the values that fill it in. Slots are keyed by the path of
+# child element indices from the output container, e.g. "0.1.0" for the markup inside
+# an element, or "0@class" for an attribute.
+FlatBox = Tuple[str, Dict[str, str]]
+
+# The attribute that marks the tiles of a value box grid returned as a dict, with their
+# keys (see _grid_contents())
+TILE_KEY_ATTR = "data-tile-key"
+
+T = TypeVar("T")
+
+# Tasks started in the background, which the event loop only keeps weak references to;
+# each is held here until it's done
+_background_tasks: "Set[asyncio.Task[None]]" = set()
+
+
+def _start_background_task(coro: Awaitable[None]) -> None:
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+class RenderBox(Renderer[Any]):
+    """Renderer for :func:`value_box` and :func:`info_box` outputs.
+
+    The first rendering (and any rendering whose tag structure differs from the
+    previous one) is sent in full, like ``render.ui``. After that, only the slots whose
+    values changed are sent, as ``{"patch": {path: value}}``, and the box output
+    binding in shinydashboard.js applies them to the existing DOM.
+
+    Contents made of keyed tiles (elements with a ``data-tile-key`` attribute, like
+    the tiles of a grid returned as a dict) are matched up by key instead, and sent as
+    ``{"tiles": {"keys": [...], "insert": {key: html}, "patch": {key: patch}}}``: the
+    order of the keys, the tiles that are new (or whose structure changed) in full,
+    and the slots that changed in the others, by paths starting from the tile.
+
+    A rendering that's the same as what the client is already showing isn't sent at
+    all (see :func:`render_stats`).
+
+    ``contents`` turns the function's (non-``None``) result into the contents of the
+    output container; by default, the result is a box whose children are used.
+    ``output_ui`` makes the output container for a given id, for Shiny Express.
+
+    The function may also return a rendering that's already made, as the functions
+    made by :func:`broadcast_renderings` do.
+
+    With an ``executor``, the function runs in the event loop (and its reactive
+    context), and returns a function to call in the executor, without a reactive
+    context, which returns the box. The output is sent ``{"loading": true}`` while
+    that runs (the browser keeps showing the previous box, marked as loading), and
+    the output renders again with the result when it's ready, unless it's been
+    invalidated in the meantime.
+    """
+
+    def __init__(
+        self,
+        fn: Optional[BoxFunc] = None,
+        *,
+        contents: Optional[Callable[[Any], ht.TagList]] = None,
+        output_ui: Optional[Callable[[str], ht.Tag]] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._contents = contents or _box_contents
+        self._output_ui = output_ui
+        self._executor = executor
+        # With an executor: the function, run in a calculation of its own, so that
+        # it's only run again when its dependencies change
+        self._job_calc: Optional[Callable[[], Awaitable[Any]]] = None
+        # The executor's latest job, and the function it runs; the results of the
+        # jobs before it are discarded
+        self._job: Optional[asyncio.Future[Any]] = None
+        self._job_fn: Optional[Callable[[], Any]] = None
+        self._job_started = 0.0
+        # Set to each job when it's done, to render the output again
+        self._job_done: reactive.Value[Any] = reactive.Value(None)
+        # What the client is currently showing, if we know
+        self._last: Optional[_Rendering] = None
+        # The digest of the last rendering sent in full, while the client still shows it
+        self._sent: Optional[bytes] = None
+        # Registers the function (and, in Shiny Express, the output), so it comes last
+        super().__init__(fn)
+
+    def auto_output_ui(self) -> Optional[ht.Tag]:
+        if self._output_ui is None:
+            return None
+        return self._output_ui(self.output_id)
+
+    async def render(self) -> Optional[Dict[str, Any]]:
+        session = require_active_session(None)
+        name = session.ns(self.output_id)
+        if self._executor is not None:
+            return await self._render_job(self._executor, name)
+        return await _measure(name, self._render_and_send)
+
+    async def _render_and_send(self) -> Optional[Dict[str, Any]]:
+        try:
+            rendering = await _render_box(self.fn, self._contents)
+        except SilentCancelOutputException:
+            # The client keeps what it has
+            raise
+        except BaseException:
+            # The client will show an error (or nothing) in place of the box
+            self._last = self._sent = None
+            raise
+        return await self._send(rendering)
+
+    async def _send(self, rendering: Optional[_Rendering]) -> Optional[Dict[str, Any]]:
+        if rendering is None:
+            self._last = self._sent = None
+            return None
+
+        last = self._last
+        self._last = rendering
+
+        update = None if last is None else rendering.update_from(last)
+        if update is not None:
+            if not update:
+                raise _suppress()
+            self._sent = None
+            _counters.record(sent=1)
+            return update
+
+        self._sent = _unchanged(self._sent, rendering.digest)
+        return await rendering.payload()
+
+    async def _render_job(
+        self, executor: Executor, name: str
+    ) -> Optional[Dict[str, Any]]:
+        if self._job_calc is None:
+            fn = self.fn
+
+            async def run() -> Any:
+                return await fn()
+
+            self._job_calc = reactive.calc(run)
+        # Renders again when a job is done
+        self._job_done()
+        try:
+            job_fn = await self._job_calc()
+        except SilentCancelOutputException:
+            if self._cancel_job():
+                return {"loading": False}
+            raise
+        except BaseException:
+            self._cancel_job()
+            self._last = self._sent = None
+            raise
+
+        if job_fn is None:
+            self._cancel_job()
+            return await self._send(None)
+        if job_fn is not self._job_fn:
+            self._start_job(executor, job_fn)
+        job = cast("asyncio.Future[Any]", self._job)
+        if not job.done():
+            return {"loading": True}
+        return await _measure(name, lambda: self._job_result(job), self._job_started)
+
+    def _start_job(self, executor: Executor, job_fn: Any) -> None:
+        if is_tag(job_fn) or not callable(job_fn) or is_async_callable(job_fn):
+            raise TypeError(
+                "With an executor, the render function should return a function (that "
+                "isn't async) to call there, e.g. functools.partial(make_box, value)"
+            )
+        self._cancel_job()
+        loop = asyncio.get_running_loop()
+        # The executor runs it without a reactive context (or the session), so it
+        # can't read reactive values, which aren't thread-safe
+        job = loop.run_in_executor(executor, job_fn)
+        self._job = job
+        self._job_fn = job_fn
+        self._job_started = time.perf_counter()
+
+        def done(job: asyncio.Future[Any]) -> None:
+            if job is self._job:
+                _start_background_task(self._finish_job(job))
+
+        job.add_done_callback(done)
+
+    async def _finish_job(self, job: asyncio.Future[Any]) -> None:
+        async with reactive.lock():
+            if job is self._job:
+                self._job_done.set(job)
+                await reactive.flush()
+
+    def _cancel_job(self) -> bool:
+        # Forgets the current job, returning whether it was still running; if it
+        # hasn't started yet, it never will
+        job = self._job
+        self._job = self._job_fn = None
+        if job is None or job.done():
+            return False
+        job.cancel()
+        return True
+
+    async def _job_result(self, job: asyncio.Future[Any]) -> Optional[Dict[str, Any]]:
+        try:
+            res = job.result()
+            return await self._send(
+                None if res is None else _Rendering(self._contents(res).tagify())
+            )
+        except SilentCancelOutputException:
+            # Including when the result is what the client already shows
+            return {"loading": False}
+        except BaseException:
+            self._last = self._sent = None
+            raise
+
+
+class _Rendering:
+    # A box rendered for sending, which may be shared by many sessions' outputs
+    def __init__(self, children: ht.TagList) -> None:
+        self.children = children
+        self.tiles = flatten_tiles(children)
+        self.flat = None if self.tiles is not None else flatten_box(children)
+        html = children.get_html_string()
+        deps = children.get_dependencies()
+        self.digest = _digest([html, [[dep.name, str(dep.version)] for dep in deps]])
+        # Contents without HTML dependencies (the usual case) are the same for every
+        # session; the others are processed by each session, which serves their files
+        self._ui: Optional[Dict[str, Any]] = (
+            None if len(deps) > 0 else {"deps": [], "html": html}
+        )
+        # The last update computed, and (the flattened contents of) what it was from;
+        # usually, every output was showing the same rendering before this one
+        self._update: Optional[Tuple[object, Optional[Dict[str, Any]]]] = None
+
+    async def payload(self) -> Dict[str, Any]:
+        # The value to send in full, for the current session
+        if self._ui is not None:
+            return self._ui
+        return cast(Dict[str, Any], await _ui_renderer().transform(self.children))
+
+    def update_from(self, last: _Rendering) -> Optional[Dict[str, Any]]:
+        # The message that turns `last` into this rendering in the browser: empty if
+        # they're the same, and None if this one has to be sent in full
+        last_flat = last.tiles if last.tiles is not None else last.flat
+        if self._update is not None and self._update[0] is last_flat:
+            return self._update[1]
+        update: Optional[Dict[str, Any]] = None
+        if self.tiles is not None and last.tiles is not None:
+            tiles = diff_tiles(last.tiles, self.tiles)
+            update = {"tiles": tiles} if tiles else {}
+        elif self.flat is not None and last.flat is not None:
+            if self.flat[0] == last.flat[0]:
+                patch = diff_slots(last.flat[1], self.flat[1])
+                update = {"patch": patch} if patch else {}
+        self._update = (last_flat, update)
+        return update
+
+
+@functools.lru_cache(maxsize=None)
+def _ui_renderer() -> render.ui:
+    # Does what render.ui does with a function's result
+    return render.ui()
+
+
+async def _render_box(
+    fn: Callable[[], Awaitable[Any]], contents: Callable[[Any], ht.TagList]
+) -> Optional[_Rendering]:
+    res = await fn()
+    if res is None or isinstance(res, _Rendering):
+        return res
+    return _Rendering(contents(res).tagify())
+
+
+def broadcast_renderings(
+    fn: Callable[[], Any],
+    key: Hashable,
+    contents: Optional[Callable[[Any], ht.TagList]] = None,
+    same_closure: bool = False,
+) -> Callable[[], Awaitable[Optional[_Rendering]]]:
+    """Render a box once for all the sessions' outputs with the same key.
+
+    Wraps a render function (sync or async) in an async one that returns a rendering
+    of its result for :class:`RenderBox` (with ``contents``, like :class:`RenderBox`
+    would). The rendering is shared by all of an app's functions made with the same
+    ``key``; the first session's function renders it (in a reactive calculation that
+    belongs to no session, so it should only depend on reactive values shared by all
+    sessions), and when that session ends, the next one's takes over.
+
+    With ``same_closure``, the functions must also have the same closure variables,
+    or a :class:`ValueError` is raised: copies of a function that refer to different
+    objects (say, each session's own data) don't render the same box.
+    """
+    afn = wrap_async(fn)
+    shared: Optional[_Broadcast] = None
+
+    @functools.wraps(fn)
+    async def broadcast_fn() -> Optional[_Rendering]:
+        nonlocal shared
+        if shared is None:
+            session = require_active_session(None)
+            shared = _Broadcast.subscribe(
+                key, afn, contents or _box_contents, session, same_closure
+            )
+        return await shared.calc()
+
+    return broadcast_fn
+
+
+class _Broadcast:
+    # A box rendered once for the outputs with the same key, in all of an app's
+    # sessions, by one of their functions (which all do the same thing)
+    _instances: "WeakValueDictionary[Tuple[App, Hashable], _Broadcast]" = (
+        WeakValueDictionary()
+    )
+
+    def __init__(self, contents: Callable[[Any], ht.TagList]) -> None:
+        # The subscribed sessions' functions, in order; the first one is used
+        self.fns: List[Tuple[Session, Callable[[], Awaitable[Any]]]] = []
+
+        async def render() -> Optional[_Rendering]:
+            return await _render_box(self.fns[0][1], contents)
+
+        self.calc = cast(
+            Callable[[], Awaitable[Optional[_Rendering]]],
+            reactive.calc(render, session=None),
+        )
+
+    @classmethod
+    def subscribe(
+        cls,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        contents: Callable[[Any], ht.TagList],
+        session: Session,
+        same_closure: bool,
+    ) -> _Broadcast:
+        root = session.root_scope()
+        app_key = (root.app, key)
+        res = cls._instances.get(app_key)
+        if res is None:
+            res = cls._instances[app_key] = _Broadcast(contents)
+        elif same_closure and not _same_closure(res.fns[0][1], fn):
+            raise ValueError(
+                "Render functions with the same code but different closure variables "
+                "can't share a broadcast rendering; pass broadcast=<key> to choose "
+                "which ones share it"
+            )
+        res.fns.append((root, fn))
+        root.on_ended(lambda: res._unsubscribe(root, app_key))
+        return res
+
+    def _unsubscribe(self, session: Session, app_key: Tuple[App, Hashable]) -> None:
+        # Lets go of the session's functions (and what they refer to)
+        self.fns = [x for x in self.fns if x[0] is not session]
+        if not self.fns and self._instances.get(app_key) is self:
+            del self._instances[app_key]
+
+
+def _same_closure(a: Callable[..., Any], b: Callable[..., Any]) -> bool:
+    # Whether `a` and `b` (wrapped by wrap_async(), or not) refer to the same objects
+    a = getattr(a, "__wrapped__", a)
+    b = getattr(b, "__wrapped__", b)
+    cells_a = getattr(a, "__closure__", None) or ()
+    cells_b = getattr(b, "__closure__", None) or ()
+    return len(cells_a) == len(cells_b) and all(
+        _cell_contents(x) is _cell_contents(y) for x, y in zip(cells_a, cells_b)
+    )
+
+
+_empty_cell = object()
+
+
+def _cell_contents(cell: Any) -> Any:
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _empty_cell
+
+
+# The menu outputs of each (root) session that were changed in place by
+# insert_menu_item() and friends, so the browser no longer shows their last renderings
+_changed_menus: "WeakKeyDictionary[Session, Set[str]]" = WeakKeyDictionary()
+
+
+class RenderMenu(Renderer[ht.TagChild]):
+    """Renderer for :func:`menu_dropdown` outputs: ``render.ui``, except that a
+    rendering that's the same as the last one isn't sent."""
+
+    def __init__(self, fn: Optional[Callable[[], Any]] = None) -> None:
+        self._sent: Optional[bytes] = None
+        super().__init__(fn)
+
+    def auto_output_ui(self) -> ht.Tag:
+        return output_menu_dropdown(self.output_id)
+
+    async def render(self) -> Optional[Dict[str, Any]]:
+        session = require_active_session(None)
+        name = session.ns(self.output_id)
+        return await _measure(name, lambda: self._render_menu(session, name))
+
+    async def _render_menu(
+        self, session: Session, name: str
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            value = await self.fn()
+            ui = None if value is None else await _ui_renderer().transform(value)
+        except SilentCancelOutputException:
+            raise
+        except BaseException:
+            self._sent = None
+            raise
+        if ui is None:
+            self._sent = None
+            return None
+        changed = _changed_menus.get(session.root_scope())
+        if changed is not None and name in changed:
+            changed.discard(name)
+            self._sent = None
+        self._sent = _unchanged(self._sent, _digest(ui))
+        return cast(Dict[str, Any], ui)
+
+
+class RenderStatsRows(Renderer[List[List[Any]]]):
+    """Renderer for the panel of ``header(render_stats=True)``: the rows of its table,
+    as data, which aren't sent again if they haven't changed."""
+
+    def __init__(self, fn: Optional[Callable[[], Any]] = None) -> None:
+        self._sent: Optional[List[List[Any]]] = None
+        super().__init__(fn)
+
+    async def transform(self, value: List[List[Any]]) -> List[List[Any]]:
+        if value == self._sent:
+            # Not counted in render_stats(), which is about the dashboard's outputs
+            raise SilentCancelOutputException()
+        self._sent = value
+        return value
+
+
+def _digest(ui: Any) -> bytes:
+    return hashlib.blake2b(
+        json.dumps(ui, sort_keys=True).encode("utf-8"), digest_size=16
+    ).digest()
+
+
+def _unchanged(sent: Optional[bytes], digest: bytes) -> bytes:
+    # Suppresses a rendering if its digest is `sent`; otherwise, returns the digest
+    if digest == sent:
+        raise _suppress()
+    _counters.record(sent=1)
+    return digest
+
+
+def _suppress() -> SilentCancelOutputException:
+    # Leaves the output as the client already has it
+    _counters.record(suppressed=1)
+    _output_counters.record_current(suppressed=1)
+    return SilentCancelOutputException()
+
+
+async def _measure(
+    name: str, run: Callable[[], Awaitable[T]], start: Optional[float] = None
+) -> T:
+    # Runs (the rest of) an output's rendering, and records it in output_stats(), if
+    # they're enabled: the time since `start` (by default, now), and the size of the
+    # value to send
+    if not _output_counters.enabled:
+        return await run()
+    if start is None:
+        start = time.perf_counter()
+    token = _current_output.set(name)
+    value: Optional[T] = None
+    try:
+        value = await run()
+        return value
+    finally:
+        _current_output.reset(token)
+        _output_counters.record(
+            name,
+            renders=1,
+            seconds=time.perf_counter() - start,
+            bytes=payload_size(value),
+        )
+
+
+def rate_limit(
+    fn: Callable[[], T],
+    throttle_ms: Optional[float] = None,
+    delay_ms: Optional[float] = None,
+) -> Callable[[], T]:
+    """Limit how often a render function's result is rendered and sent.
+
+    Wraps a render function (sync or async) so that, when it's invalidated too soon,
+    it raises :class:`SilentCancelOutputException` (which leaves the output as it is)
+    and schedules itself to run again later, with ``reactive.invalidate_later()``.
+
+    With ``throttle_ms``, the output renders at most once per that many milliseconds:
+    right away if it hasn't rendered within the window, and otherwise once the window
+    is over, with whatever the latest values are then. The function isn't called in
+    between.
+
+    With ``delay_ms``, the output renders that many milliseconds after it's first
+    invalidated (except for its first rendering, which is immediate), with whatever
+    the latest values are then. The function isn't called while the output waits, so
+    nothing tracks its dependencies then: further changes are batched into the same
+    rendering, rather than restarting the wait as a debounce would, and under constant
+    changes the output renders once per ``delay_ms``.
+    """
+    if throttle_ms is not None and delay_ms is not None:
+        raise ValueError("Only one of throttle_ms and delay_ms can be used")
+    if throttle_ms is None and delay_ms is None:
+        return fn
+
+    # Time of the last rendering
+    last: Optional[float] = None
+    # With delay_ms, the time when the output is due to render, if it's waiting
+    due: Optional[float] = None
+
+    def wait() -> Optional[float]:
+        # How long until the output may render; None if it may render now
+        nonlocal last, due
+        now = time.monotonic()
+        if last is None:
+            pass
+        elif throttle_ms is not None:
+            if now < last + throttle_ms / 1000:
+                return last + throttle_ms / 1000 - now
+        elif due is None:
+            # The first change since the last rendering; render when the timer fires
+            due = now + cast(float, delay_ms) / 1000
+            return due - now
+        elif now < due:
+            # Invalidated early, e.g. by the output being shown again
+            return due - now
+        last = now
+        due = None
+        return None
+
+    def cancel(delay: float) -> SilentCancelOutputException:
+        reactive.invalidate_later(delay)
+        return SilentCancelOutputException()
+
+    if is_async_callable(fn):
+        afn = cast(Callable[[], Awaitable[Any]], fn)
+
+        @functools.wraps(fn)
+        async def rate_limited_async() -> Any:
+            delay = wait()
+            if delay is None:
+                return await afn()
+            raise cancel(delay)
+
+        return cast(Callable[[], T], rate_limited_async)
+
+    @functools.wraps(fn)
+    def rate_limited() -> T:
+        delay = wait()
+        if delay is None:
+            return fn()
+        raise cancel(delay)
+
+    return rate_limited
+
+
+# The most tiles that each app's cache keeps (see `cached()`)
+CACHE_SIZE = 256
+
+
+class _CacheEntry:
+    def __init__(self, value: Any, expires: float) -> None:
+        self.value = value
+        self.expires = expires
+        self.refreshing = False
+        # Changes when a refresh completes, so that the outputs showing the entry
+        # render it again
+        self.version = reactive.Value(0)
+
+    def bump(self) -> None:
+        with reactive.isolate():
+            self.version.set(self.version() + 1)
+
+
+_caches: "WeakKeyDictionary[App, OrderedDict[Hashable, _CacheEntry]]" = (
+    WeakKeyDictionary()
+)
+# The results being computed for each app's cache, on a miss, which the sessions that
+# miss the same key share
+_pending: "WeakKeyDictionary[App, Dict[Hashable, asyncio.Future[_CacheEntry]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def cached(
+    fn: Callable[[], Any],
+    key: Optional[Callable[[], Hashable]] = None,
+    ttl: Optional[float] = None,
+) -> Callable[[], Awaitable[Any]]:
+    """Share a render function's results among the sessions, stale-while-revalidate.
+
+    Wraps a render function (sync or async) in an async one that returns the result
+    cached for the function (by its code, so every session's copy of it shares the
+    cache) and ``key()``, which is called in the output's reactive context, so it may
+    depend on inputs. Only on a miss is the function called, right away, and once for
+    all the sessions that miss the same key at the same time. Each app's cache keeps
+    the ``CACHE_SIZE`` most recently used results.
+
+    Without a ``key``, the function mustn't have closure variables: the copies of a
+    function in different sessions have the same code, but they could refer to each
+    session's own data, which mustn't be shown to other sessions.
+
+    A result older than ``ttl`` seconds is still returned, but the function is called
+    again in the background, once for all the sessions; when it returns, the outputs
+    that showed the old result are invalidated, to render the new one. If it raises an
+    error, the old result is kept for another ``ttl``.
+
+    The function is called in the event loop, in isolation (with
+    ``reactive.isolate()``), so its result should only depend on the key.
+    """
+    if key is None and getattr(getattr(fn, "__code__", None), "co_freevars", ()):
+        raise ValueError(
+            "A cached render function with closure variables needs a key, e.g. "
+            "cache=lambda: input.region(), for the things its result depends on"
+        )
+    code = getattr(fn, "__code__", fn)
+    afn = wrap_async(fn)
+
+    async def produce() -> Any:
+        with reactive.isolate():
+            return await afn()
+
+    async def fill(
+        entries: OrderedDict[Hashable, _CacheEntry], k: Hashable
+    ) -> _CacheEntry:
+        value = await produce()
+        entry = _CacheEntry(value, math.inf if ttl is None else time.monotonic() + ttl)
+        _cache_put(entries, k, entry)
+        return entry
+
+    async def refresh(
+        entries: OrderedDict[Hashable, _CacheEntry], k: Hashable, entry: _CacheEntry
+    ) -> None:
+        try:
+            value = await produce()
+        except Exception:
+            traceback.print_exc()
+            value = entry.value
+        async with reactive.lock():
+            entry.refreshing = False
+            entry.expires = time.monotonic() + cast(float, ttl)
+            if entry.value is value:
+                return
+            entry.value = value
+            if k not in entries:
+                # Evicted in the meantime; it's the most recent result again
+                _cache_put(entries, k, entry)
+            entry.bump()
+            await reactive.flush()
+
+    @functools.wraps(fn)
+    async def cached_fn() -> Any:
+        app = require_active_session(None).root_scope().app
+        entries = _caches.setdefault(app, OrderedDict())
+        k = (code, None if key is None else key())
+        entry = entries.get(k)
+        if entry is None:
+            pending = _pending.setdefault(app, {})
+            job = pending.get(k)
+            if job is None:
+                job = pending[k] = asyncio.ensure_future(fill(entries, k))
+                # Once it's done, the entry is in the cache (or, if the function
+                # raised an error, the next miss tries again)
+                job.add_done_callback(lambda _: pending.pop(k, None))
+            else:
+                _output_counters.record_current(cached=1)
+            # Shielded, so that one output being cancelled doesn't cancel the others
+            entry = await asyncio.shield(job)
+        else:
+            entries.move_to_end(k)
+            _output_counters.record_current(cached=1)
+        entry.version()
+        now = time.monotonic()
+        if ttl is not None:
+            if now >= entry.expires and not entry.refreshing:
+                entry.refreshing = True
+                _start_background_task(refresh(entries, k, entry))
+            # Check back when the entry expires (or, if it's being refreshed, in
+            # case that fails)
+            reactive.invalidate_later(
+                entry.expires - now if entry.expires > now else ttl
+            )
+        return entry.value
+
+    return cached_fn
+
+
+def _cache_put(
+    entries: OrderedDict[Hashable, _CacheEntry], k: Hashable, entry: _CacheEntry
+) -> None:
+    entries[k] = entry
+    entries.move_to_end(k)
+    while len(entries) > CACHE_SIZE:
+        entries.popitem(last=False)
+
+
+def is_async_callable(fn: Callable[..., Any]) -> bool:
+    return iscoroutinefunction(fn) or iscoroutinefunction(
+        getattr(fn, "__call__", None)
+    )
+
+
+def wrap_async(fn: Callable[[], Any]) -> Callable[[], Awaitable[Any]]:
+    """An async version of `fn`, which may already be async."""
+    if is_async_callable(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def fn_async() -> Any:
+        return fn()
+
+    return fn_async
+
+
+@functools.lru_cache(maxsize=None)
+def thread_pool() -> ThreadPoolExecutor:
+    """The thread pool shared by the renderers with ``executor="thread"``."""
+    return ThreadPoolExecutor(thread_name_prefix="shinydashboard")
+
+
+@functools.lru_cache(maxsize=None)
+def process_pool() -> ProcessPoolExecutor:
+    """The process pool shared by the renderers with ``executor="process"``."""
+    # Its worker processes are only started when it's first used
+    return ProcessPoolExecutor()
+
+
+def _box_contents(res: ht.Tag) -> ht.TagList:
+    return res.children
+
+
+def flatten_box(children: ht.TagList) -> Optional[FlatBox]:
+    """Flatten tagified output contents into a :data:`FlatBox`.
+
+    Returns ``None`` if the contents can't be patched in place (i.e. they carry HTML
+    dependencies, or aren't made of elements), in which case they should always be
+    sent in full.
+    """
+    if len(children.get_dependencies()) > 0:
+        return None
+    skeleton: List[str] = []
+    slots: Dict[str, str] = {}
+    if not _flatten(children, "", skeleton, slots):
+        return None
+    return "".join(skeleton), slots
+
+
+def _flatten(
+    nodes: Sequence[ht.TagChild],
+    prefix: str,
+    skeleton: List[str],
+    slots: Dict[str, str],
+) -> bool:
+    # Only runs of elements can be addressed by path; anything else (text, or markup
+    # mixed with text) is handled by the caller as a single slot.
+    if not all(is_tag(x) for x in nodes):
+        return False
+
+    for i, node in enumerate(cast(List[ht.Tag], list(nodes))):
+        path = prefix + str(i)
+        skeleton.append("<" + node.name)
+        for key, val in node.attrs.items():
+            skeleton.append(" " + key)
+            slots[path + "@" + key] = str(val)
+
+        kids = node.children
+        if len(kids) == 0:
+            skeleton.append("/>")
+        elif _flatten(kids, path + ".", skeleton, slots):
+            skeleton.append("</>")
+        else:
+            skeleton.append(">*</>")
+            slots[path] = kids.get_html_string(
+                _escape_strings=node.name not in ("script", "style")
+            )
+    return True
+
+
+def diff_slots(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, str]:
+    """The slots of ``new`` whose values differ from ``old``."""
+    return {k: v for k, v in new.items() if old.get(k) != v}
+
+
+# A tile of keyed output contents: its flattened rendering (with paths starting from
+# the tile, as "0"), and its HTML
+FlatTile = Tuple[FlatBox, str]
+
+
+def flatten_tiles(children: ht.TagList) -> Optional[Dict[str, FlatTile]]:
+    """Flatten tagified output contents made of keyed tiles, by key, in order.
+
+    Returns ``None`` if the contents aren't all elements with distinct keys (in their
+    ``data-tile-key`` attributes), or carry HTML dependencies.
+    """
+    nodes = list(children)
+    if len(nodes) == 0 or not all(is_tag(x) for x in nodes):
+        return None
+    if len(children.get_dependencies()) > 0:
+        return None
+    tiles: Dict[str, FlatTile] = {}
+    for node in cast(List[ht.Tag], nodes):
+        key = node.attrs.get(TILE_KEY_ATTR)
+        if key is None or key in tiles:
+            return None
+        skeleton: List[str] = []
+        slots: Dict[str, str] = {}
+        _flatten([node], "", skeleton, slots)
+        tiles[str(key)] = (("".join(skeleton), slots), node.get_html_string())
+    return tiles
+
+
+def diff_tiles(old: Dict[str, FlatTile], new: Dict[str, FlatTile]) -> Dict[str, Any]:
+    """What changed from the keyed tiles ``old`` to ``new``: the keys, in order, the
+    HTML of the tiles to insert (or replace), and the slots to patch in the others.
+    Empty if nothing changed."""
+    insert: Dict[str, str] = {}
+    patch: Dict[str, Dict[str, str]] = {}
+    for key, (flat, html) in new.items():
+        last = old.get(key)
+        if last is None or last[0][0] != flat[0]:
+            insert[key] = html
+        else:
+            tile_patch = diff_slots(last[0][1], flat[1])
+            if tile_patch:
+                patch[key] = tile_patch
+    keys = list(new)
+    if not insert and not patch and keys == list(old):
+        return {}
+    res: Dict[str, Any] = {"keys": keys}
+    if insert:
+        res["insert"] = insert
+    if patch:
+        res["patch"] = patch
+    return res
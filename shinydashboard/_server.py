@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Set, Union, cast
+
+import htmltools as ht
+from shiny import reactive, ui
+from shiny.session import Session, require_active_session
+
+from ._metrics import (
+    RENDER_STATS_OUTPUT,
+    _client_timings,
+    _stats_rows,
+    enable_output_stats,
+    output_stats,
+)
+from ._render import RenderStatsRows, _changed_menus
+from ._sidebar import lazy_tab
+from ._utils import is_tag
+
+if TYPE_CHECKING:
+    from ._notifications import NotificationStore
+
+# Input set by shinydashboard.js when a lazy nav_content() pane is first shown
+LAZY_TAB_INPUT = "shinydashboard_lazy_tab"
+
+# Input set by shinydashboard.js with batches of timings, for page(client_timing=True)
+TIMING_INPUT = "shinydashboard_timing"
+
+# Custom message handled by shinydashboard.js, to change a menu_dropdown() in place
+MENU_MESSAGE = "shinydashboard-menu"
+
+
+def dashboard_server(
+    session: Optional[Session] = None,
+    *,
+    notifications: Optional[Dict[str, NotificationStore]] = None,
+    render_stats: bool = False,
+) -> None:
+    """Server-side logic for shinydashboard features that need the server's help.
+
+    Call this once from your Shiny server function if your dashboard uses any of:
+
+    - :func:`nav_content` with ``lazy=True``
+    - :class:`NotificationStore`
+    - :func:`header` with ``render_stats=True``
+    - :func:`page` with ``client_timing=True``
+
+    Parameters
+    ----------
+    session
+        The Shiny session. If ``None``, the currently active session is used.
+    notifications
+        A dictionary whose keys are the ids of :func:`output_menu_dropdown` outputs,
+        and whose values are the :class:`NotificationStore` objects to show in them.
+    render_stats
+        If ``True``, record :func:`output_stats` (see :func:`enable_output_stats`), and
+        show them in the panel of ``header(render_stats=True)``.
+    """
+    session = require_active_session(session).root_scope()
+
+    if notifications:
+        from ._notifications import _serve_notifications
+
+        for id, store in notifications.items():
+            _serve_notifications(id, store, session)
+
+    if render_stats:
+        _serve_render_stats(session)
+
+    @reactive.Effect
+    @reactive.event(session.input[TIMING_INPUT])
+    def _record_timings():
+        _client_timings.record(session.input[TIMING_INPUT]())
+
+    # Tabs that have already been inserted into this session's page
+    loaded: Set[str] = set()
+
+    @reactive.Effect
+    @reactive.event(session.input[LAZY_TAB_INPUT])
+    def _insert_lazy_tab():
+        # The token of the pane in this session's page; see nav_content()
+        token: str = session.input[LAZY_TAB_INPUT]()
+        tab = lazy_tab(token)
+        if token in loaded or tab is None:
+            return
+        loaded.add(token)
+        tab_name, contents = tab
+        ui.insert_ui(
+            contents,
+            selector=f"#shinydash-tab-{tab_name}",
+            where="afterBegin",
+            session=session,
+        )
+
+
+def _serve_render_stats(session: Session) -> None:
+    enable_output_stats()
+
+    # Only the numbers are sent, every couple of seconds while the panel is open; the
+    # table is filled in by shinydashboard.js
+    @session.output(id=RENDER_STATS_OUTPUT)
+    @RenderStatsRows
+    def _render_stats():
+        reactive.invalidate_later(2)
+        return _stats_rows(output_stats())
+
+
+def insert_menu_item(
+    id: str,
+    item: ht.TagChild,
+    *,
+    key: Optional[str] = None,
+    position: Literal["first", "last"] = "first",
+    session: Optional[Session] = None,
+) -> None:
+    """Add an item to a :func:`menu_dropdown`, without rendering the rest of it again.
+
+    Only the new item is sent to the browser, which inserts it (with a divider) among
+    the menu's other items. If the menu's badge counts its items (i.e. its
+    ``badge_value`` is ``"auto"``), the count is updated too.
+
+    Parameters
+    ----------
+    id
+        The id of the :func:`output_menu_dropdown` (or of a :func:`menu_dropdown`
+        with an ``id``).
+    item
+        The item to add, e.g. an :func:`item_notification` or :func:`item_message`.
+    key
+        A key that identifies the item, so that it can be removed with
+        :func:`remove_menu_item`. An item with the same key that's already in the menu
+        is replaced.
+    position
+        Whether to add the item before the menu's other items (the default, as suits a
+        feed of notifications) or after them.
+    session
+        The Shiny session. If ``None``, the currently active session is used.
+
+    Note
+    ----
+    A menu that's rendered again by :func:`render_menu_dropdown` replaces what was
+    added to it (or removed from it) in place.
+    """
+    session = require_active_session(session)
+    if key is not None:
+        item = _with_key(item, key)
+
+    contents = ht.TagList(item)
+    deps = contents.get_dependencies()
+    if deps:
+        # The item's HTML dependencies are sent ahead of it, by themselves
+        ui.insert_ui(
+            ht.TagList(*deps), selector="body", where="beforeEnd", session=session
+        )
+
+    _send_menu_message(
+        id,
+        {
+            "op": "insert",
+            "content": {"html": contents.get_html_string(), "deps": []},
+            "key": key,
+            "position": position,
+        },
+        session,
+    )
+
+
+def remove_menu_item(id: str, key: str, *, session: Optional[Session] = None) -> None:
+    """Remove an item that was added by :func:`insert_menu_item` from a menu.
+
+    Parameters
+    ----------
+    id
+        The id of the :func:`output_menu_dropdown` (or of a :func:`menu_dropdown`
+        with an ``id``).
+    key
+        The ``key`` that the item was inserted with. If the menu has no such item,
+        nothing happens.
+    session
+        The Shiny session. If ``None``, the currently active session is used.
+    """
+    _send_menu_message(id, {"op": "remove", "key": key}, session)
+
+
+def set_menu_badge(
+    id: str,
+    value: Optional[Union[int, Literal["auto"]]],
+    *,
+    status: Optional[str] = None,
+    session: Optional[Session] = None,
+) -> None:
+    """Change the badge that overlays a :func:`menu_dropdown`'s icon.
+
+    Parameters
+    ----------
+    id
+        The id of the :func:`output_menu_dropdown` (or of a :func:`menu_dropdown`
+        with an ``id``).
+    value
+        The number to display; ``"auto"`` to display the number of items in the menu
+        (and keep it up to date); or ``None`` to remove the badge.
+    status
+        The badge's new background color, e.g. ``"danger"``; by default, it's left as
+        it is.
+    session
+        The Shiny session. If ``None``, the currently active session is used.
+    """
+    _send_menu_message(
+        id,
+        {
+            "op": "badge",
+            "value": None if value is None else str(value),
+            "status": status,
+        },
+        session,
+    )
+
+
+def _with_key(item: ht.TagChild, key: str) -> ht.Tag:
+    if not is_tag(item):
+        raise TypeError("A menu item with a `key` must be a Tag")
+    item = copy.copy(cast(ht.Tag, item))
+    item.attrs["data-menu-key"] = key
+    return item
+
+
+def _send_menu_message(
+    id: str,
+    message: Dict[str, object],
+    session: Optional[Session] = None,
+) -> None:
+    # Like ui.insert_ui(), the message is sent once the outputs have been updated, so
+    # that it applies to the menu as rendered in the same flush (if it was)
+    session = require_active_session(session)
+    name = session.ns(id)
+    _changed_menus.setdefault(session.root_scope(), set()).add(name)
+    data: Dict[str, object] = {"id": name, **message}
+
+    async def callback() -> None:
+        await session.send_custom_message(MENU_MESSAGE, data)
+
+    session.on_flushed(callback, once=True)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+import secrets
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
 import htmltools as ht
 from htmltools import tags
-from ._utils import wrap_with_tag
-from faicons import icon_svg
+from ._icons import icon as cached_icon
+from ._utils import MISSING, MISSING_TYPE, is_tag, is_tag_list, wrap_with_tag
 
 from htmltools._core import Tag, TagAttrArg, Tagifiable  # type: ignore
 
@@ -62,7 +64,7 @@ def sidebar_menu_tab(
     title: ht.TagChild,
     tab_name: str,
     *,
-    icon: ht.TagChild = icon_svg("circle", style="regular"),
+    icon: Union[ht.TagChild, MISSING_TYPE] = MISSING,
 ) -> ht.Tag:
     """A :func:`sidebar` menu item that performs tab navigation. Each ``sidebar_menu_tab`` must have a matching :func:`nav_content` in the page's body.
 
@@ -73,13 +75,16 @@ def sidebar_menu_tab(
     tab_name
         An ID-style string (alphanumeric plus underscore characters, no spaces) that must match the ``tab_name`` of a :func:`nav_content` call elsewhere on the page.
     icon
-        An icon to display alongside the title.
+        An icon to display alongside the title. The default is a hollow circle.
 
     Returns
     -------
         A :class:`Tag` object, suitable for inclusion in :func:`sidebar`.
     """
 
+    if isinstance(icon, MISSING_TYPE):
+        icon = cached_icon("circle", style="regular")
+
     # id of the pane we're controlling
     content_id = f"shinydash-tab-{tab_name}"
     # id of the current element
@@ -108,7 +113,7 @@ def sidebar_menu_link(
     title: ht.TagChild,
     href: str,
     *,
-    icon: ht.TagChild = icon_svg("circle", style="regular"),
+    icon: Union[ht.TagChild, MISSING_TYPE] = MISSING,
     **kwargs: TagAttrArg,
 ) -> ht.Tag:
     """A :func:`sidebar` menu item that navigates away from the Shiny app, to an external URL.
@@ -120,7 +125,7 @@ def sidebar_menu_link(
     href
         The URL to link to.
     icon
-        An icon to display alongside the title.
+        An icon to display alongside the title. The default is a hollow circle.
     kwargs
         Additional HTML attributes to apply to the ``<a>`` tag that is generated. (Use ``class_=`` instead of ``class=``.)
 
@@ -129,6 +134,9 @@ def sidebar_menu_link(
         A :class:`Tag` object, suitable for inclusion in :func:`sidebar`.
     """
 
+    if isinstance(icon, MISSING_TYPE):
+        icon = cached_icon("circle", style="regular")
+
     return tags.li(
         {"class": "nav-item", "role": "presentation"},
         tags.a(
@@ -142,8 +150,46 @@ def sidebar_menu_link(
     )
 
 
+# The tab_name and contents of lazy nav_content() panes, keyed by a token that's unique
+# to each pane that's made (so to each rendering of a page), and which the pane carries
+# in its data-lazy-tab attribute. The contents are rendered into a session's page on
+# demand by dashboard_server(), the first time the tab is shown. Only the most recently
+# made (or shown) panes are kept.
+_lazy_tabs: "OrderedDict[str, Tuple[str, ht.TagList]]" = OrderedDict()
+_max_lazy_tabs = 10000
+
+
+def lazy_tab(token: str) -> Optional[Tuple[str, ht.TagList]]:
+    """The tab_name and contents of the lazy :func:`nav_content` pane with a given
+    token, if it's known."""
+    res = _lazy_tabs.get(token)
+    if res is not None:
+        _lazy_tabs.move_to_end(token)
+    return res
+
+
+def lazy_tab_contents(x: object) -> List[ht.TagList]:
+    """The contents of the lazy :func:`nav_content` panes in a tag tree, which aren't
+    in the tree itself."""
+    res: List[ht.TagList] = []
+    _find_lazy_tabs(x, res)
+    return res
+
+
+def _find_lazy_tabs(x: object, res: List[ht.TagList]) -> None:
+    if is_tag(x):
+        token = x.attrs.get("data-lazy-tab")  # type: ignore[union-attr]
+        tab = None if token is None else lazy_tab(str(token))
+        if tab is not None:
+            res.append(tab[1])
+        _find_lazy_tabs(x.children, res)  # type: ignore[union-attr]
+    elif is_tag_list(x):
+        for child in x:  # type: ignore[union-attr]
+            _find_lazy_tabs(child, res)
+
+
 def nav_content(
-    tab_name: str, *args: ht.TagChildArg, **kwargs: ht.TagAttrArg
+    tab_name: str, *args: ht.TagChildArg, lazy: bool = False, **kwargs: ht.TagAttrArg
 ) -> ht.Tag:
     """A container for putting content that should be shown only when a corresponding
     :func:`sidebar_menu_tab` is selected.
@@ -157,6 +203,14 @@ def nav_content(
         the same page.
     args
         The contents of this container.
+    lazy
+        If ``True``, the contents are left out of the initial page; they're rendered
+        and inserted by the server the first time the tab is shown, and kept in the page
+        for later visits. Outputs inside a lazy tab don't do any work until then.
+        Requires :func:`dashboard_server` to be called from the Shiny server function.
+        Each call keeps its own copy of the contents (so a page made for each request
+        can have different contents in each), until 10,000 newer lazy panes have been
+        made.
     kwargs
         Additional HTML attributes to apply to the ``<div>`` tag that is generated. (Do not provide ``id=``. Use ``class_=`` instead of ``class=``.)
 
@@ -165,12 +219,20 @@ def nav_content(
         A :class:`Tag` object, suitable for inclusion in :func:`navset`.
     """
     id = f"shinydash-tab-{tab_name}"
+    token = None
+    if lazy:
+        token = secrets.token_urlsafe(12)
+        _lazy_tabs[token] = (tab_name, ht.TagList(*args))
+        while len(_lazy_tabs) > _max_lazy_tabs:
+            _lazy_tabs.popitem(last=False)
+        args = ()
     return ht.div(
         {
             "id": id,
             "class": "tab-pane",
             "role": "tabpanel",
             "aria-labelledby": id + "-tab",
+            "data-lazy-tab": token,
         },
         *args,
         **kwargs,
@@ -207,7 +269,7 @@ def navset(*tabs: ht.TagChildArg, **kwargs: ht.TagAttrArg):
 def sidebar_submenu(
     title: ht.TagChild,
     *args: ht.TagChild,
-    icon: ht.TagChild = icon_svg("circle", style="solid"),
+    icon: Union[ht.TagChild, MISSING_TYPE] = MISSING,
     expanded: bool = False,
 ) -> ht.Tag:
     """A :func:`sidebar` menu item that displays a collapsible submenu, which can
@@ -221,7 +283,7 @@ def sidebar_submenu(
         :func:`sidebar_menu_tab` and :func:`sidebar_menu_link` objects that comprise the
         submenu.
     icon
-        An icon to display alongside the title.
+        An icon to display alongside the title. The default is a filled circle.
     expanded
         If ``True``, the submenu should default to its expanded state.
 
@@ -229,6 +291,9 @@ def sidebar_submenu(
     -------
         A :class:`Tag` object, suitable for inclusion in :func:`sidebar`.
     """
+    if isinstance(icon, MISSING_TYPE):
+        icon = cached_icon("circle", style="solid")
+
     return tags.li(
         {"class": "nav-item" + (" menu-open" if expanded else "")},
         tags.a(
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Union, cast
+
+import htmltools as ht
+from htmltools import html_escape
+
+from ._icons import icon as cached_icon
+from ._utils import MISSING, MISSING_TYPE, bg_classes, col_classes, is_tag, join
+
+# These functions write the same markup as value_box(), info_box() and card() would,
+# straight from their arguments, without building (and then walking) a tree of tags.
+# The markup is compact: it's what the components' get_html_string() writes, without
+# the indentation and line breaks that htmltools puts between elements.
+
+# Elements that htmltools writes as <br/> when they're empty
+_void_tags = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "command",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "keygen",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+
+# Elements whose text htmltools doesn't escape
+_raw_text_tags = {"script", "style"}
+
+_maximize_button = (
+    '<button type="button" class="btn btn-tool" data-lte-toggle="card-maximize">'
+    '<i class="fas fa-expand"></i></button>'
+)
+_close_button = (
+    '<button type="button" class="btn btn-tool" data-lte-dismiss="card-remove">'
+    '<i class="fas fa-times"></i></button>'
+)
+
+
+def value_box_html(
+    value: ht.TagChild,
+    subtitle: Optional[ht.TagChild] = None,
+    *,
+    icon: Optional[ht.TagChild] = None,
+    color: str = "light",
+    width: Optional[int] = None,
+    href: Optional[str] = None,
+    footer: Optional[ht.TagChild] = None,
+    gradient: bool = False,
+    class_: Optional[str] = None,
+) -> ht.HTML:
+    """A :func:`value_box`, as an HTML string.
+
+    Takes the same arguments as :func:`value_box`, and writes the same markup (minus
+    the whitespace between elements), but several times faster, since no tags are
+    built. Useful when many boxes are rendered just to be serialized, e.g. for
+    ``render.ui`` outputs or generated reports.
+
+    The arguments' tags are rendered as usual; they must not carry HTML dependencies,
+    which a string can't, or a :class:`ValueError` is raised.
+
+    Returns
+    -------
+        An :class:`HTML` string, which can be used wherever a :class:`Tag` can.
+    """
+    if isinstance(subtitle, str) and not isinstance(subtitle, ht.HTML):
+        subtitle_html = "<p>" + html_escape(subtitle) + "</p>"
+    else:
+        subtitle_html = _child_html(subtitle)
+
+    container = "div" if href is None else "a"
+    parts = [
+        '<div class="',
+        col_classes(width),
+        '"><',
+        container,
+        _attr_html("class", join("small-box", bg_classes(color, gradient), class_)),
+        _attr_html("href", href),
+        ">",
+    ]
+    if icon is not None:
+        parts += ['<div class="icon"><div class="icon-inner">', _child_html(icon)]
+        parts.append("</div></div>")
+    parts += ['<div class="inner"><h3>', _child_html(value), "</h3>", subtitle_html]
+    parts.append("</div>")
+    if icon is not None:
+        parts.append('<div class="clearfix"></div>')
+    if footer is not None:
+        parts += ['<div class="small-box-footer">', _child_html(footer), "</div>"]
+    parts += ["</", container, "></div>"]
+    return ht.HTML("".join(parts))
+
+
+def info_box_html(
+    title: ht.TagChild,
+    value: ht.TagChild,
+    *,
+    subtitle: Optional[ht.TagChild] = None,
+    icon: Union[ht.TagChild, MISSING_TYPE] = MISSING,
+    color: str = "secondary",
+    width: Optional[int] = None,
+    href: Optional[str] = None,
+    fill: bool = False,
+    gradient: bool = False,
+    class_: Optional[str] = None,
+) -> ht.HTML:
+    """An :func:`info_box`, as an HTML string.
+
+    Takes the same arguments as :func:`info_box`, and writes the same markup; see
+    :func:`value_box_html`.
+
+    Returns
+    -------
+        An :class:`HTML` string, which can be used wherever a :class:`Tag` can.
+    """
+    if isinstance(icon, MISSING_TYPE):
+        icon = cached_icon("thumbs-up")
+
+    if isinstance(subtitle, str) and not isinstance(subtitle, ht.HTML):
+        subtitle_html = "<div>" + html_escape(subtitle) + "</div>"
+    else:
+        subtitle_html = _child_html(subtitle)
+
+    bg = bg_classes(color, gradient)
+    container = "div" if href is None else "a"
+    parts = [
+        '<div class="',
+        col_classes(width),
+        '"><',
+        container,
+        _attr_html("class", join("info-box", bg if fill else None, class_)),
+        _attr_html("href", href),
+        "><span",
+        _attr_html(
+            "class",
+            join("info-box-icon", join("shadow-sm", bg) if not fill else None),
+        ),
+        ">",
+        _child_html(icon),
+        '</span><div class="info-box-content"><span class="info-box-text">',
+        _child_html(title),
+        '</span><span class="info-box-number">',
+        _child_html(value),
+        "</span>",
+        subtitle_html,
+        "</div></",
+        container,
+        "></div>",
+    ]
+    return ht.HTML("".join(parts))
+
+
+def card_html(
+    title: Optional[ht.TagChild] = None,
+    *args: ht.TagChild,
+    color: str = "light",
+    width: Optional[int] = None,
+    closeable: bool = False,
+    maximizable: bool = False,
+) -> ht.HTML:
+    """A :func:`card`, as an HTML string.
+
+    Takes the same arguments as :func:`card`, and writes the same markup; see
+    :func:`value_box_html`.
+
+    Returns
+    -------
+        An :class:`HTML` string, which can be used wherever a :class:`Tag` can.
+    """
+    tools = (_maximize_button if maximizable else "") + (
+        _close_button if closeable else ""
+    )
+
+    parts = [
+        '<div class="',
+        col_classes(width),
+        '"><div',
+        _attr_html("class", f"card card-{color}"),
+        ">",
+    ]
+    if title is not None or tools:
+        parts += ['<div class="card-header"><h3 class="card-title">', _child_html(title)]
+        parts += ['</h3><div class="card-tools">', tools, "</div></div>"]
+    parts.append('<div class="card-body">')
+    parts += [_child_html(x) for x in args]
+    parts.append("</div></div></div>")
+    return ht.HTML("".join(parts))
+
+
+def _attr_html(name: str, value: Optional[str]) -> str:
+    if value is None:
+        return ""
+    if not isinstance(value, ht.HTML):
+        value = html_escape(str(value), attr=True)
+    return f' {name}="{value}"'
+
+
+def _child_html(x: ht.TagChildArg) -> str:
+    # The common cases (text, numbers, and the HTML strings from icon()) are written
+    # directly; anything else goes through htmltools
+    if x is None:
+        return ""
+    if isinstance(x, ht.HTML):
+        return str(x)
+    if isinstance(x, str):
+        return html_escape(x)
+    if isinstance(x, (int, float)):
+        return str(x)
+    return str(_compact_html(x))
+
+
+def _compact_html(x: ht.TagChildArg) -> ht.HTML:
+    """Render tags like ``get_html_string()``, but without the whitespace that it puts
+    between elements."""
+    nodes = ht.TagList(x).tagify()
+    if len(nodes.get_dependencies()) > 0:
+        raise ValueError(
+            "Content with HTML dependencies can't be rendered as an HTML string; "
+            "use value_box(), info_box() or card() instead"
+        )
+    out: List[str] = []
+    _write_compact(nodes, True, out)
+    return ht.HTML("".join(out))
+
+
+def _write_compact(nodes: Sequence[object], escape: bool, out: List[str]) -> None:
+    # Takes tagified nodes, which (from htmltools 0.6) aren't ht.Tag objects
+    for x in nodes:
+        if is_tag(x):
+            tag = cast(ht.Tag, x)
+            out.append("<" + tag.name)
+            for key, val in tag.attrs.items():
+                out.append(_attr_html(key, val))
+            kids = [k for k in tag.children if not isinstance(k, ht.MetadataNode)]
+            if len(kids) == 0 and tag.name in _void_tags:
+                out.append("/>")
+                continue
+            out.append(">")
+            _write_compact(kids, tag.name not in _raw_text_tags, out)
+            out.append("</" + tag.name + ">")
+        elif isinstance(x, ht.MetadataNode):
+            continue
+        elif isinstance(x, ht.HTML) or not escape:
+            out.append(str(x))
+        else:
+            out.append(html_escape(str(x)))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import Callable, List, Optional, TypeVar, Union
 
 import htmltools as ht
@@ -8,6 +9,40 @@ from htmltools import tags
 T = TypeVar("T")
 
 
+class MISSING_TYPE:
+    """The type of :data:`MISSING`, the default for arguments whose default values are
+    only computed when they're needed."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = MISSING_TYPE()
+
+
+# htmltools 0.6 and up tagify tags into separate classes, and its TagList (like its
+# HTML) is a UserList (UserString) rather than a list (str); so these are checked for
+# with is_tag() and is_tag_list(), rather than isinstance(x, ht.Tag) or isinstance(x,
+# list)
+_tag_classes = tuple(
+    getattr(ht, name) for name in ("Tag", "TagifiedTag") if hasattr(ht, name)
+)
+_tag_list_classes = (list, tuple) + tuple(
+    getattr(ht, name) for name in ("TagList", "TagifiedTagList") if hasattr(ht, name)
+)
+
+
+def is_tag(x: object) -> bool:
+    """Whether `x` is a tag, tagified or not"""
+    return isinstance(x, _tag_classes)
+
+
+def is_tag_list(x: object) -> bool:
+    """Whether `x` is a list of tag children: a TagList (tagified or not), list or
+    tuple"""
+    return isinstance(x, _tag_list_classes)
+
+
 def wrap_with_col(width: Optional[int], x: ht.TagChild) -> ht.Tag:
     return tags.div(x, class_=col_classes(width))
 
@@ -50,3 +85,8 @@ def insert_dividers(lst: List[T], divider: T) -> List[T]:
             res.append(divider)
         res.append(el)
     return res
+
+
+def package_file(*path: str) -> str:
+    """The path of a file that's installed as part of this package"""
+    return os.path.join(os.path.dirname(__file__), *path)
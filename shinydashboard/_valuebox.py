@@ -1,15 +1,37 @@
 from __future__ import annotations
 
-import functools
-from inspect import iscoroutinefunction
-from typing import Awaitable, Callable, Optional, Union
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import htmltools as ht
-from faicons import icon_svg
 from htmltools import tags
-from shiny import render, ui
+from ._icons import icon as cached_icon
+from ._utils import (
+    MISSING,
+    MISSING_TYPE,
+    bg_classes,
+    col_classes,
+    join,
+    wrap_with_col,
+    wrap_with_tag,
+)
 
-from ._utils import bg_classes, col_classes, join, wrap_with_col, wrap_with_tag
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from ._render import RenderBox
 
 
 def value_box(
@@ -40,7 +62,7 @@ def value_box(
     subtitle
         Subtitle text, usually describing the value.
     icon
-        An icon to display prominently, likely from :func:`icon_svg`.
+        An icon to display prominently, likely from :func:`icon`.
     color
         A `Bootstrap color <https://getbootstrap.com/docs/5.2/customize/color/>`_, e.g.
         ``"light"`` (the default), ``"dark"``, ``"success"``, etc.
@@ -131,16 +153,25 @@ def output_value_box(id: str, width: Optional[int] = None) -> ht.Tag:
     -------
         A :class:`Tag` object, to be included somewhere in the :func:`body`.
     """
-    return ui.output_ui(
-        id,
-        container=ht.div,
-        class_="value-box-output " + col_classes(width),
+    return tags.div(
+        id=id,
+        class_="shinydashboard-box-output value-box-output " + col_classes(width),
     )
 
 
+BoxRenderFunc = Callable[[], Union[Optional[ht.Tag], Awaitable[Optional[ht.Tag]]]]
+
+
 def render_value_box(
-    fn: Callable[[], Union[Optional[ht.Tag], Awaitable[Optional[ht.Tag]]]]
-):
+    fn: Optional[BoxRenderFunc] = None,
+    *,
+    throttle_ms: Optional[float] = None,
+    delay_ms: Optional[float] = None,
+    broadcast: Union[bool, Hashable] = False,
+    executor: Union[None, Literal["thread", "process"], Executor] = None,
+    cache: Union[bool, Callable[[], Hashable]] = False,
+    ttl: Optional[float] = None,
+) -> Union[RenderBox, Callable[[BoxRenderFunc], RenderBox]]:
     """A Shiny render decorator for dynamic :func:`value_box` outputs.
 
     Here's an example of an value box renderer that would go into the Shiny server
@@ -158,28 +189,99 @@ def render_value_box(
             return sdb.value_box(
                 current_time.strftime("%I:%M:%S %p"),
                 "Current time",
-                icon=faicons.icon_svg("clock"),
+                icon=sdb.icon("clock"),
                 color="success",
             )
 
+    After the first rendering, only the parts of the value box that changed (its
+    value, subtitle, color, icon, etc.) are sent to the browser, and they're updated in
+    place; if the structure of the value box changes, it's sent in full.
+
     Note that like all Shiny render decorators, ``@render_value_box`` must be *below*
     (or maybe you think of it as *inside*) the ``@output`` decorator.
 
     This example would require a matching ``output_value_box("valueBox1")`` to appear in
     the Shiny UI definition. See :func:`output_value_box` for more information.
 
+    A rendering that's the same as the one already shown isn't sent again (see
+    :func:`render_stats`). For value boxes that are invalidated very often, use
+    ``@render_value_box(throttle_ms=...)`` or ``@render_value_box(delay_ms=...)``
+    to render (and send) them less often.
+
     Parameters
     ----------
     fn
         A user-defined function to decorate; its name should match with the
         corresponding :func:`output_value_box` in the UI. The function should return
         either a :func:`value_box` object, or ``None``.
+    throttle_ms
+        If given, render the value box at most once per this many milliseconds. When
+        it's invalidated sooner, it's rendered once the time is up, with the latest
+        values.
+    delay_ms
+        If given, wait this many milliseconds after the value box's dependencies
+        first change before rendering it, with the latest values. The function isn't
+        called while it waits, so the changes in the meantime are batched into that
+        rendering, rather than restarting the wait (as a debounce would).
+    broadcast
+        If ``True``, the value box is the same for every session: it may only depend on
+        reactive values shared by all sessions (i.e. created outside of the server
+        function), and not on a session's inputs. Then the function is called, and its
+        result rendered, just once each time it changes, rather than once per
+        session. The sessions' copies of the function are told apart by their code,
+        so they must also refer to the same objects (from their closures), or an error
+        is raised. To share one rendering among different functions (or to keep apart
+        the renderings of functions with the same code), pass a key, such as a
+        string, instead. ``throttle_ms`` and ``delay_ms`` still apply to each
+        session's output separately.
+    executor
+        If ``"thread"``, make the value box in a shared thread pool; if ``"process"``,
+        in a shared process pool (or pass a :class:`concurrent.futures.Executor` to
+        use that), rather than in the event loop, so that slow work doesn't hold up
+        the other outputs and sessions. Then the function itself runs in the event
+        loop, as usual, to read the inputs and reactive values it needs, and must
+        return a function (with no arguments) that makes the value box from them, to
+        call in the executor, rather than the value box itself; e.g.
+        ``return functools.partial(make_box, input.region())``. That one runs without
+        a reactive context, so it can't read reactive values. With ``"process"``, it
+        and its arguments are pickled, as is the value box it returns, so it must be
+        a function defined at the top level of a module (or a ``functools.partial``
+        of one), rather than a lambda or a nested function. Until it returns, the
+        browser keeps showing the previous value box, dimmed, and if the value box is
+        invalidated in the meantime, the stale result is discarded (or the call
+        skipped, if it hasn't started). This can't be combined with ``throttle_ms``,
+        ``delay_ms`` or ``broadcast``.
+    cache
+        If ``True``, cache the function's result, and share it among the sessions:
+        the function is only called when the cache doesn't have a result for it yet.
+        To cache a result per, say, selected region, pass a function that returns the
+        key to cache it under instead, e.g. ``cache=lambda: input.region()``. That's
+        called reactively, while the value box function is called in isolation, so
+        its result should only depend on the key. With ``True``, the function can't
+        refer to variables of the server function (such as ``input``), since its
+        result would be shared with sessions whose variables differ; give a key
+        instead. Each app's cache keeps the 256 most recently used results.
+    ttl
+        With ``cache``, the number of seconds after which a result is refreshed. An
+        expired result is still shown right away, while the function is called
+        again in the background (once for all the sessions); then the new value box
+        is sent to the sessions that showed the old one. By default, results don't
+        expire.
 
     Returns
     -------
         A decorated function that must be further decorated with ``@output``.
     """
-    return render_children(fn)
+    return render_children(
+        fn,
+        output_ui=output_value_box,
+        throttle_ms=throttle_ms,
+        delay_ms=delay_ms,
+        broadcast=broadcast,
+        executor=executor,
+        cache=cache,
+        ttl=ttl,
+    )
 
 
 def info_box(
@@ -187,7 +289,7 @@ def info_box(
     value: ht.TagChild,
     *,
     subtitle: Optional[ht.TagChild] = None,
-    icon: ht.TagChild = icon_svg("thumbs-up"),
+    icon: Union[ht.TagChild, MISSING_TYPE] = MISSING,
     color: str = "secondary",
     width: Optional[int] = None,
     href: Optional[str] = None,
@@ -218,7 +320,7 @@ def info_box(
     subtitle
         Explanatory text that appears below the value.
     icon
-        An icon to display prominently, likely from :func:`icon_svg`. The default is a
+        An icon to display prominently, likely from :func:`icon`. The default is a
         thumbs-up icon.
     color
         A `Bootstrap color <https://getbootstrap.com/docs/5.2/customize/color/>`_, e.g.
@@ -244,6 +346,9 @@ def info_box(
     -------
         A :class:`Tag` object, suitable for inclusion in a :func:`row`.
     """
+    if isinstance(icon, MISSING_TYPE):
+        icon = cached_icon("thumbs-up")
+
     subtitle = wrap_with_tag(subtitle, tags.div)
 
     if href is None:
@@ -313,16 +418,22 @@ def output_info_box(id: str, width: Optional[int] = None) -> ht.Tag:
     -------
         A :class:`Tag` object, to be included somewhere in the :func:`body`.
     """
-    return ui.output_ui(
-        id,
-        container=ht.div,
-        class_="info-box-output " + col_classes(width),
+    return tags.div(
+        id=id,
+        class_="shinydashboard-box-output info-box-output " + col_classes(width),
     )
 
 
 def render_info_box(
-    fn: Callable[[], Union[Optional[ht.Tag], Awaitable[Optional[ht.Tag]]]]
-):
+    fn: Optional[BoxRenderFunc] = None,
+    *,
+    throttle_ms: Optional[float] = None,
+    delay_ms: Optional[float] = None,
+    broadcast: Union[bool, Hashable] = False,
+    executor: Union[None, Literal["thread", "process"], Executor] = None,
+    cache: Union[bool, Callable[[], Hashable]] = False,
+    ttl: Optional[float] = None,
+) -> Union[RenderBox, Callable[[BoxRenderFunc], RenderBox]]:
     """A Shiny render decorator for dynamic :func:`info_box` outputs.
 
     Here's an example of an info box renderer that would go into the Shiny server
@@ -341,54 +452,303 @@ def render_info_box(
                 "Current time",
                 current_time.strftime("%I:%M:%S %p"),
                 subtitle=str(current_time.tzinfo),
-                icon=faicons.icon_svg("clock"),
+                icon=sdb.icon("clock"),
                 color="warning",
             )
 
+    After the first rendering, only the parts of the info box that changed (its
+    value, subtitle, color, icon, etc.) are sent to the browser, and they're updated in
+    place; if the structure of the info box changes, it's sent in full.
+
     Note that like all Shiny render decorators, ``@render_info_box`` must be *below* (or
     maybe you think of it as *inside*) the ``@output`` decorator.
 
     This example would require a matching ``output_info_box("infoBox1")`` to appear in
     the Shiny UI definition. See :func:`output_info_box` for more information.
 
+    A rendering that's the same as the one already shown isn't sent again (see
+    :func:`render_stats`). For info boxes that are invalidated very often, use
+    ``@render_info_box(throttle_ms=...)`` or ``@render_info_box(delay_ms=...)`` to
+    render (and send) them less often.
+
     Parameters
     ----------
     fn
         A user-defined function to decorate; its name should match with the
         corresponding :func:`output_info_box` in the UI. The function should return
         either an :func:`info_box` object, or ``None``.
+    throttle_ms
+        If given, render the info box at most once per this many milliseconds. When
+        it's invalidated sooner, it's rendered once the time is up, with the latest
+        values.
+    delay_ms
+        If given, wait this many milliseconds after the info box's dependencies
+        first change before rendering it, with the latest values. The function isn't
+        called while it waits, so the changes in the meantime are batched into that
+        rendering, rather than restarting the wait (as a debounce would).
+    broadcast
+        If ``True``, the info box is the same for every session: it may only depend on
+        reactive values shared by all sessions (i.e. created outside of the server
+        function), and not on a session's inputs. Then the function is called, and its
+        result rendered, just once each time it changes, rather than once per
+        session. The sessions' copies of the function are told apart by their code,
+        so they must also refer to the same objects (from their closures), or an error
+        is raised. To share one rendering among different functions (or to keep apart
+        the renderings of functions with the same code), pass a key, such as a
+        string, instead. ``throttle_ms`` and ``delay_ms`` still apply to each
+        session's output separately.
+    executor
+        If ``"thread"``, make the info box in a shared thread pool; if ``"process"``,
+        in a shared process pool (or pass a :class:`concurrent.futures.Executor` to
+        use that), rather than in the event loop, so that slow work doesn't hold up
+        the other outputs and sessions. Then the function itself runs in the event
+        loop, as usual, to read the inputs and reactive values it needs, and must
+        return a function (with no arguments) that makes the info box from them, to
+        call in the executor, rather than the info box itself; e.g.
+        ``return functools.partial(make_box, input.region())``. That one runs without
+        a reactive context, so it can't read reactive values. With ``"process"``, it
+        and its arguments are pickled, as is the info box it returns, so it must be
+        a function defined at the top level of a module (or a ``functools.partial``
+        of one), rather than a lambda or a nested function. Until it returns, the
+        browser keeps showing the previous info box, dimmed, and if the info box is
+        invalidated in the meantime, the stale result is discarded (or the call
+        skipped, if it hasn't started). This can't be combined with ``throttle_ms``,
+        ``delay_ms`` or ``broadcast``.
+    cache
+        If ``True``, cache the function's result, and share it among the sessions:
+        the function is only called when the cache doesn't have a result for it yet.
+        To cache a result per, say, selected region, pass a function that returns the
+        key to cache it under instead, e.g. ``cache=lambda: input.region()``. That's
+        called reactively, while the info box function is called in isolation, so
+        its result should only depend on the key. With ``True``, the function can't
+        refer to variables of the server function (such as ``input``), since its
+        result would be shared with sessions whose variables differ; give a key
+        instead. Each app's cache keeps the 256 most recently used results.
+    ttl
+        With ``cache``, the number of seconds after which a result is refreshed. An
+        expired result is still shown right away, while the function is called
+        again in the background (once for all the sessions); then the new info box
+        is sent to the sessions that showed the old one. By default, results don't
+        expire.
+
+    Returns
+    -------
+        A decorated function that must be further decorated with ``@output``.
+    """
+    return render_children(
+        fn,
+        output_ui=output_info_box,
+        throttle_ms=throttle_ms,
+        delay_ms=delay_ms,
+        broadcast=broadcast,
+        executor=executor,
+        cache=cache,
+        ttl=ttl,
+    )
+
+
+# A tile in a value box grid: a value_box() or info_box(), or a dict of arguments for
+# value_box()
+Tile = Union[ht.Tag, Dict[str, Any]]
+Tiles = Union[Sequence[Tile], Mapping[str, Tile]]
+
+
+def output_value_box_grid(id: str) -> ht.Tag:
+    """The UI side of a dynamically rendered grid of value boxes and/or info boxes.
+
+    Use this instead of many :func:`output_value_box` and :func:`output_info_box`
+    outputs when the boxes are all computed from the same data; see
+    :func:`render_value_box_grid`.
+
+    Parameters
+    ----------
+    id
+        The identifier for the output; must match the name of your corresponding
+        server-side rendering function (see :func:`render_value_box_grid`).
+
+    Returns
+    -------
+        A :class:`Tag` object (a Bootstrap row), to be included somewhere in the
+        :func:`body`.
+    """
+    return tags.div(
+        id=id,
+        class_="shinydashboard-box-output value-box-grid-output row",
+    )
+
+
+GridRenderFunc = Callable[[], Union[Optional[Tiles], Awaitable[Optional[Tiles]]]]
+
+
+def render_value_box_grid(
+    fn: Optional[GridRenderFunc] = None,
+    *,
+    throttle_ms: Optional[float] = None,
+    delay_ms: Optional[float] = None,
+    broadcast: Union[bool, Hashable] = False,
+    executor: Union[None, Literal["thread", "process"], Executor] = None,
+    cache: Union[bool, Callable[[], Hashable]] = False,
+    ttl: Optional[float] = None,
+) -> Union[RenderBox, Callable[[GridRenderFunc], RenderBox]]:
+    """A Shiny render decorator for a grid of value boxes and/or info boxes.
+
+    The function returns all of the grid's tiles at once, as a list, or as a dict whose
+    values are the tiles (in order). Each tile is either a :func:`value_box` or
+    :func:`info_box` object (give them a ``width`` to lay them out in columns), or a
+    dict of arguments for :func:`value_box`. For example::
+
+        @output
+        @sdb.render_value_box_grid
+        def serverTiles():
+            stats = server_stats()
+            return [
+                dict(value=s.load, subtitle=s.name, color=s.status, width=3)
+                for s in stats
+            ]
+
+    The whole grid is updated with a single message, however many tiles it has. After
+    the first rendering, only the parts of the tiles that changed are sent, and the
+    browser applies them to all of the tiles in one pass. When the tiles are returned
+    as a dict, they're matched up by key: adding, removing or reordering tiles only
+    sends the tiles that are new (or whose structure changed), and the rest are moved
+    into place. With a list, they're matched up by position, so if the number of
+    tiles, or the structure of any of them, changes, the grid is sent in full.
+
+    This example would require a matching ``output_value_box_grid("serverTiles")`` to
+    appear in the Shiny UI definition.
+
+    Parameters
+    ----------
+    fn
+        A user-defined function to decorate; its name should match with the
+        corresponding :func:`output_value_box_grid` in the UI. The function should
+        return the tiles, or ``None``.
+    throttle_ms
+        If given, render the grid at most once per this many milliseconds; see
+        :func:`render_value_box`.
+    delay_ms
+        If given, wait this many milliseconds after the grid's dependencies first
+        change before rendering it; see :func:`render_value_box`.
+    broadcast
+        If ``True`` (or a key), render the grid once for all sessions; see
+        :func:`render_value_box`.
+    executor
+        If ``"thread"`` or ``"process"`` (or an executor), make the tiles there,
+        rather than in the event loop: the function returns a function that makes
+        them; see :func:`render_value_box`.
+    cache
+        If ``True`` (or a function that returns a key), cache the grid's tiles, and
+        share them among the sessions; see :func:`render_value_box`.
+    ttl
+        With ``cache``, the number of seconds after which the tiles are refreshed (in
+        the background); see :func:`render_value_box`.
 
     Returns
     -------
         A decorated function that must be further decorated with ``@output``.
     """
-    return render_children(fn)
+    return render_children(
+        fn,
+        _grid_contents,
+        output_ui=output_value_box_grid,
+        throttle_ms=throttle_ms,
+        delay_ms=delay_ms,
+        broadcast=broadcast,
+        executor=executor,
+        cache=cache,
+        ttl=ttl,
+    )
+
+
+def _grid_contents(tiles: Tiles) -> ht.TagList:
+    if isinstance(tiles, Mapping):
+        return ht.TagList(*[_keyed_tile(k, tile) for k, tile in tiles.items()])
+    return ht.TagList(*[_tile(tile) for tile in tiles])
+
+
+def _tile(tile: Tile) -> ht.Tag:
+    return value_box(**tile) if isinstance(tile, dict) else tile
+
+
+def _keyed_tile(key: str, tile: Tile) -> ht.Tag:
+    # The key lets the browser tell which tile is which when tiles are added, removed
+    # or reordered (see RenderBox)
+    res = copy.copy(_tile(tile))
+    res.attrs = copy.copy(res.attrs)
+    res.attrs["data-tile-key"] = str(key)
+    return res
 
 
 def render_children(
-    fn: Callable[[], Union[Optional[ht.Tag], Awaitable[Optional[ht.Tag]]]]
-):
-    if iscoroutinefunction(fn) or (
-        hasattr(fn, "__call__") and iscoroutinefunction(getattr(fn, "__call__"))
-    ):
-
-        @functools.wraps(fn)
-        async def fn_async() -> Optional[ht.TagChildArg]:
-            res: Optional[ht.Tag] = await fn()  # type: ignore
-            if res is None:
-                return res
-            else:
-                return res.children
-
-        return render.ui(fn_async)
-    else:
+    fn: Optional[Callable[[], Any]],
+    contents: Optional[Callable[[Any], ht.TagList]] = None,
+    *,
+    output_ui: Optional[Callable[[str], ht.Tag]] = None,
+    throttle_ms: Optional[float] = None,
+    delay_ms: Optional[float] = None,
+    broadcast: Union[bool, Hashable] = False,
+    executor: Union[None, Literal["thread", "process"], Executor] = None,
+    cache: Union[bool, Callable[[], Hashable]] = False,
+    ttl: Optional[float] = None,
+) -> Any:
+    if fn is None:
+        # Used as @render_*(...), with arguments
+        def decorator(fn: Callable[[], Any]) -> RenderBox:
+            return render_children(
+                fn,
+                contents,
+                output_ui=output_ui,
+                throttle_ms=throttle_ms,
+                delay_ms=delay_ms,
+                broadcast=broadcast,
+                executor=executor,
+                cache=cache,
+                ttl=ttl,
+            )
 
-        @functools.wraps(fn)
-        def fn_sync() -> Optional[ht.TagList]:
-            res: Optional[ht.Tag] = fn()  # type: ignore
-            if res is None:
-                return res
-            else:
-                return res.children
+        return decorator
+
+    # Imported here, since it needs shiny, which is slow to import and not needed for
+    # static UI
+    from ._render import (
+        RenderBox,
+        broadcast_renderings,
+        cached,
+        rate_limit,
+        process_pool,
+        thread_pool,
+    )
+
+    # By default, broadcast outputs are shared by the sessions' copies of a function,
+    # which have the same code (and must refer to the same objects)
+    key: Optional[Hashable] = None
+    if broadcast is True:
+        key = getattr(fn, "__code__", fn)
+    elif broadcast is not False:
+        key = broadcast
+
+    if ttl is not None and cache is False:
+        raise ValueError("ttl can only be used with cache")
+    if cache is not False:
+        if executor is not None or key is not None:
+            raise ValueError("cache can't be combined with executor or broadcast")
+        fn = cached(fn, None if cache is True else cache, ttl)
+
+    if executor is not None:
+        if throttle_ms is not None or delay_ms is not None or key is not None:
+            raise ValueError(
+                "executor can't be combined with throttle_ms, delay_ms or broadcast"
+            )
+        if executor == "thread":
+            executor = thread_pool()
+        elif executor == "process":
+            executor = process_pool()
+        return RenderBox(
+            fn, contents=contents, output_ui=output_ui, executor=executor
+        )
 
-        return render.ui(fn_sync)
+    if key is not None:
+        fn = broadcast_renderings(fn, key, contents, same_closure=broadcast is True)
+    # Rate limited per session, even when the rendering is shared
+    fn = rate_limit(fn, throttle_ms, delay_ms)
+    return RenderBox(fn, contents=contents, output_ui=output_ui)
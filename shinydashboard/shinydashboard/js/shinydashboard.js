@@ -1,37 +1,202 @@
 (() => {
+  // timing.ts
+  var pending = [];
+  var flushing = false;
+  function timingEnabled() {
+    return document.body !== null && document.body.hasAttribute("data-client-timing") && typeof performance !== "undefined" && typeof performance.mark === "function";
+  }
+  function timingStart(event) {
+    if (!timingEnabled()) {
+      return null;
+    }
+    performance.mark("shinydashboard:" + event + ":start");
+    return performance.now();
+  }
+  function timingEnd(event, start) {
+    if (start === null) {
+      return;
+    }
+    var ms = performance.now() - start;
+    try {
+      performance.measure(
+        "shinydashboard:" + event,
+        "shinydashboard:" + event + ":start"
+      );
+    } catch (e) {
+    }
+    report(event, ms);
+    performance.clearMarks("shinydashboard:" + event + ":start");
+    performance.clearMeasures("shinydashboard:" + event);
+  }
+  function timingBoot() {
+    if (!timingEnabled()) {
+      return;
+    }
+    performance.measure("shinydashboard:boot");
+    report("boot", performance.now());
+    performance.clearMeasures("shinydashboard:boot");
+  }
+  function report(event, ms) {
+    pending.push([event, ms]);
+    if (!flushing) {
+      flushing = true;
+      setTimeout(flush, 1e3);
+    }
+  }
+  function flush() {
+    if (!Shiny.shinyapp || !Shiny.shinyapp.isConnected()) {
+      $(document).one("shiny:connected", flush);
+      return;
+    }
+    flushing = false;
+    var batch = pending;
+    pending = [];
+    Shiny.setInputValue("shinydashboard_timing", batch, { priority: "event" });
+  }
+
   // tabs.ts
+  var tabLinkSelector = ".nav-sidebar a[data-bs-toggle='tab']";
+  var SidebarTabs = class {
+    constructor() {
+      this.links = null;
+      this.active = null;
+      this.activeTarget = null;
+      this.startLink = null;
+      this.$selectedInput = null;
+    }
+    index() {
+      if (this.links === null) {
+        this.links = /* @__PURE__ */ new Map();
+        this.add(document);
+      }
+      return this.links;
+    }
+    add(scope) {
+      var links = this.index();
+      scope.querySelectorAll(tabLinkSelector).forEach((link) => {
+        var target = link.getAttribute("data-bs-target");
+        if (target === null) {
+          return;
+        }
+        links.set(target, link);
+        if (target === this.activeTarget) {
+          this.active = link;
+        }
+        if (link.getAttribute("data-start-selected") === "1") {
+          this.startLink = link;
+        }
+      });
+      var $input = $(scope).find(".sidebarMenuSelectedTabItem");
+      if ($input.length !== 0) {
+        this.$selectedInput = $input;
+      }
+    }
+    remove(scope) {
+      var links = this.links;
+      if (links === null) {
+        return;
+      }
+      scope.querySelectorAll(tabLinkSelector).forEach((link) => {
+        var target = link.getAttribute("data-bs-target");
+        if (target !== null && links.get(target) === link) {
+          links.delete(target);
+        }
+        if (link === this.active) {
+          this.active = null;
+        }
+        if (link === this.startLink) {
+          this.startLink = null;
+        }
+      });
+      if (this.$selectedInput && scope.contains(this.$selectedInput[0])) {
+        this.$selectedInput = null;
+      }
+    }
+    linkToShow() {
+      var links = this.index();
+      var link = this.activeTarget === null ? void 0 : links.get(this.activeTarget);
+      if (link !== void 0) {
+        return link;
+      }
+      return this.startLink || document.querySelector(tabLinkSelector);
+    }
+    shown(link) {
+      var links = this.index();
+      var target = link.getAttribute("data-bs-target");
+      if (target !== null && links.get(target) !== link) {
+        links.set(target, link);
+      }
+      var old = this.active;
+      if (old !== null && old !== link) {
+        old.classList.remove("active");
+        old.setAttribute("aria-selected", "false");
+        if (this.activeTarget !== null && this.activeTarget !== target) {
+          var pane = document.querySelector(this.activeTarget);
+          if (pane !== null) {
+            pane.classList.remove("active", "show");
+          }
+        }
+      }
+      this.active = link;
+      this.activeTarget = target;
+      var $obj = this.$selectedInput;
+      if ($obj === null) {
+        return;
+      }
+      var inputBinding = $obj.data("shiny-input-binding");
+      if (typeof inputBinding !== "undefined") {
+        inputBinding.setValue($obj, link.getAttribute("data-value"));
+        $obj.trigger("change");
+      }
+    }
+    setInitialValue(link) {
+      if (this.$selectedInput) {
+        this.$selectedInput.attr("data-value", link.getAttribute("data-value"));
+      }
+    }
+  };
+  var sidebarTabs = new SidebarTabs();
   function deactivateOtherTabs() {
-    var $tablinks = $(
-      ".nav-sidebar a[data-toggle='tab'],.nav-sidebar li.treeview > a"
-    );
-    $tablinks.not($(this)).parent("li").removeClass("active");
-    var $obj = $(".sidebarMenuSelectedTabItem");
-    var inputBinding = $obj.data("shiny-input-binding");
-    if (typeof inputBinding !== "undefined") {
-      inputBinding.setValue($obj, $(this).attr("data-value"));
-      $obj.trigger("change");
+    sidebarTabs.shown(this);
+  }
+  $(document).on("shown.bs.tab", tabLinkSelector, deactivateOtherTabs);
+  function requestLazyTab() {
+    var $pane = $($(this).attr("data-bs-target"));
+    if (!$pane.is("[data-lazy-tab]") || $pane.attr("data-lazy-state")) {
+      return;
+    }
+    $pane.attr("data-lazy-state", "requested");
+    var send = () => Shiny.setInputValue("shinydashboard_lazy_tab", $pane.attr("data-lazy-tab"), {
+      priority: "event"
+    });
+    if (Shiny.shinyapp && Shiny.shinyapp.isConnected()) {
+      send();
+    } else {
+      $(document).one("shiny:connected", send);
     }
   }
-  $(document).on(
-    "shown.bs.tab",
-    '.nav-sidebar a[data-toggle="tab"]',
-    deactivateOtherTabs
-  );
+  $(document).on("shown.bs.tab", tabLinkSelector, requestLazyTab);
   function ensureActivatedTab() {
-    var $tablinks = $(".nav-sidebar a[data-bs-toggle='tab']");
-    var $startTab = $tablinks.filter("[data-start-selected='1']");
-    if ($startTab.length === 0) {
-      $startTab = $tablinks.first();
-    }
-    if ($startTab.length !== 0) {
-      $startTab.tab("show");
-      $(".sidebarMenuSelectedTabItem").attr(
-        "data-value",
-        $startTab.attr("data-value")
-      );
+    var start = timingStart("ensure_tab");
+    var link = sidebarTabs.linkToShow();
+    if (link !== null) {
+      $(link).tab("show");
+      sidebarTabs.setInitialValue(link);
     }
+    timingEnd("ensure_tab", start);
   }
-  document.addEventListener("DOMContentLoaded", () => ensureActivatedTab());
+  document.addEventListener("DOMContentLoaded", () => {
+    ensureActivatedTab();
+    timingBoot();
+  });
+  var tabSwitchStart = null;
+  $(document).on("show.bs.tab", tabLinkSelector, () => {
+    tabSwitchStart = timingStart("tab_switch");
+  });
+  $(document).on("shown.bs.tab", tabLinkSelector, () => {
+    timingEnd("tab_switch", tabSwitchStart);
+    tabSwitchStart = null;
+  });
 
   // output_binding_menu.ts
   var menuOutputBinding = new Shiny.OutputBinding();
@@ -49,7 +214,10 @@
       var dependencies = [];
       if (data === null) {
         return;
-      } else if (typeof data === "string") {
+      }
+      var start = timingStart("menu_render");
+      sidebarTabs.remove(el);
+      if (typeof data === "string") {
         html = data;
       } else if (typeof data === "object") {
         html = data.html;
@@ -60,12 +228,312 @@
       el.className = "shinydashboard-menu-output shiny-bound-output " + $html.attr("class");
       Shiny.initializeInputs(el);
       Shiny.bindAll(el);
+      sidebarTabs.add(el);
       if ($(el).hasClass("sidebar-menu"))
         ensureActivatedTab();
+      timingEnd("menu_render", start);
     }
   });
   Shiny.outputBindings.register(
     menuOutputBinding,
     "shinydashboard.menuOutputBinding"
   );
+
+  // output_binding_box.ts
+  var boxCopies = {};
+  function applyPatch(root, patch, live) {
+    for (var key in patch) {
+      var [path, attr] = key.split("@");
+      var node = void 0;
+      var parent = root;
+      for (var idx of path.split(".")) {
+        node = parent.children[parseInt(idx)];
+        if (!node) {
+          return;
+        }
+        parent = node;
+      }
+      if (attr !== void 0) {
+        node.setAttribute(attr, patch[key]);
+      } else if (live) {
+        Shiny.renderContent(node, { html: patch[key], deps: [] });
+      } else {
+        node.innerHTML = patch[key];
+      }
+    }
+  }
+  function applyTiles(root, update, live) {
+    var tiles = {};
+    for (var child of Array.from(root.children)) {
+      var key = child.getAttribute("data-tile-key");
+      if (key !== null) {
+        tiles[key] = child;
+      }
+    }
+    var insert = update.insert || {};
+    var patch = update.patch || {};
+    var template = document.createElement("template");
+    update.keys.forEach(function(key2, i) {
+      var tile = tiles[key2];
+      delete tiles[key2];
+      if (insert[key2] !== void 0) {
+        if (tile !== void 0) {
+          removeTile(tile, live);
+        }
+        template.innerHTML = insert[key2];
+        tile = template.content.firstElementChild;
+        root.insertBefore(tile, root.children[i] || null);
+        if (live) {
+          Shiny.initializeInputs(tile);
+          Shiny.bindAll(tile);
+        }
+        return;
+      }
+      if (tile === void 0) {
+        return;
+      }
+      if (patch[key2] !== void 0) {
+        applyPatch({ children: [tile] }, patch[key2], live);
+      }
+      if (root.children[i] !== tile) {
+        root.insertBefore(tile, root.children[i] || null);
+      }
+    });
+    for (var key in tiles) {
+      removeTile(tiles[key], live);
+    }
+  }
+  function removeTile(tile, live) {
+    if (live) {
+      Shiny.unbindAll(tile, true);
+    }
+    tile.remove();
+  }
+  function applyUpdate(root, data, live) {
+    if (data.patch !== void 0) {
+      applyPatch(root, data.patch, live);
+    } else {
+      applyTiles(root, data.tiles, live);
+    }
+  }
+  var boxOutputBinding = new Shiny.OutputBinding();
+  $.extend(boxOutputBinding, {
+    find: function(scope) {
+      return $(scope).find(".shinydashboard-box-output");
+    },
+    onValueError: function(el, err) {
+      el.classList.remove("shinydashboard-loading");
+      delete boxCopies[el.id];
+      Shiny.unbindAll(el);
+      this.renderError(el, err);
+    },
+    renderValue: function(el, data) {
+      var state = boxCopies[el.id];
+      if (data !== null && data.loading !== void 0) {
+        if (state !== void 0 && state.el !== el) {
+          state.el = el;
+          Shiny.renderContent(el, { html: state.copy.innerHTML, deps: [] });
+        }
+        el.classList.toggle("shinydashboard-loading", data.loading);
+        return;
+      }
+      el.classList.remove("shinydashboard-loading");
+      if (data === null || data.patch === void 0 && data.tiles === void 0) {
+        Shiny.renderContent(el, data);
+        if (data === null) {
+          delete boxCopies[el.id];
+        } else {
+          var copy = document.createElement("template");
+          copy.innerHTML = data.html;
+          boxCopies[el.id] = { el, copy };
+        }
+        return;
+      }
+      if (state === void 0) {
+        return;
+      }
+      applyUpdate(state.copy.content, data, false);
+      if (state.el === el) {
+        applyUpdate(el, data, true);
+      } else {
+        state.el = el;
+        Shiny.renderContent(el, { html: state.copy.innerHTML, deps: [] });
+      }
+    }
+  });
+  Shiny.outputBindings.register(
+    boxOutputBinding,
+    "shinydashboard.boxOutputBinding"
+  );
+  // menu_items.ts
+  function menuItems(menu) {
+    return Array.from(menu.children).filter(
+      (x) => x.classList.contains("dropdown-item") && !x.classList.contains("dropdown-header") && !x.classList.contains("dropdown-footer")
+    );
+  }
+  function menuDivider() {
+    var divider = document.createElement("div");
+    divider.className = "dropdown-divider";
+    return divider;
+  }
+  function isDivider(x) {
+    return x !== null && x.classList.contains("dropdown-divider");
+  }
+  function findMenuItem(menu, key) {
+    return menu.querySelector(
+      ':scope > [data-menu-key="' + CSS.escape(key) + '"]'
+    );
+  }
+  function removeMenuItem(menu, key) {
+    var item = findMenuItem(menu, key);
+    if (item === null) {
+      return;
+    }
+    if (isDivider(item.previousElementSibling)) {
+      item.previousElementSibling.remove();
+    } else if (isDivider(item.nextElementSibling)) {
+      item.nextElementSibling.remove();
+    }
+    Shiny.unbindAll(item, true);
+    item.remove();
+  }
+  async function insertMenuItem(menu, msg) {
+    if (msg.key) {
+      removeMenuItem(menu, msg.key);
+    }
+    var items = menuItems(menu);
+    var header = menu.querySelector(":scope > .dropdown-header");
+    var footer = menu.querySelector(":scope > .dropdown-footer");
+    if (msg.position === "last" && footer !== null) {
+      await Shiny.renderContent(footer, msg.content, "beforeBegin");
+      footer.before(menuDivider());
+    } else if (msg.position === "last" && menu.lastElementChild !== null) {
+      await Shiny.renderContent(menu, msg.content, "beforeEnd");
+      menu.lastElementChild.before(menuDivider());
+    } else if (items.length > 0) {
+      var first = items[0];
+      await Shiny.renderContent(first, msg.content, "beforeBegin");
+      first.before(menuDivider());
+    } else if (header !== null) {
+      await Shiny.renderContent(header, msg.content, "afterEnd");
+      header.after(menuDivider());
+    } else {
+      await Shiny.renderContent(menu, msg.content, "afterBegin");
+      if (menu.children.length > 1) {
+        menu.firstElementChild.after(menuDivider());
+      }
+    }
+  }
+  function setMenuBadge(el, msg) {
+    var link = el.querySelector(":scope > .nav-link");
+    if (link === null) {
+      return;
+    }
+    var badge = link.querySelector(":scope > .navbar-badge");
+    if (msg.value === null) {
+      if (badge !== null)
+        badge.remove();
+      return;
+    }
+    if (badge === null) {
+      badge = document.createElement("span");
+      badge.className = "navbar-badge badge bg-primary";
+      link.appendChild(badge);
+    }
+    if (msg.status) {
+      badge.className = badge.className.replace(/(^|\s)bg-\S+/g, "");
+      badge.classList.add("bg-" + msg.status);
+    }
+    if (msg.value === "auto") {
+      badge.setAttribute("data-badge", "auto");
+    } else {
+      badge.removeAttribute("data-badge");
+      badge.textContent = msg.value;
+    }
+  }
+  function countMenuItems(el, menu) {
+    var badge = el.querySelector(':scope > .nav-link > [data-badge="auto"]');
+    if (badge !== null) {
+      badge.textContent = String(menuItems(menu).length);
+    }
+  }
+  async function handleMenuMessage(msg) {
+    var el = document.getElementById(msg.id);
+    var menu = el && el.querySelector(":scope > .dropdown-menu");
+    if (!menu) {
+      return;
+    }
+    if (msg.op === "insert") {
+      await insertMenuItem(menu, msg);
+    } else if (msg.op === "remove") {
+      removeMenuItem(menu, msg.key);
+    } else if (msg.op === "badge") {
+      setMenuBadge(el, msg);
+    }
+    countMenuItems(el, menu);
+  }
+  var menuMessages = Promise.resolve();
+  Shiny.addCustomMessageHandler("shinydashboard-menu", function(msg) {
+    menuMessages = menuMessages.then(() => handleMenuMessage(msg)).catch((err) => console.error(err));
+  });
+  $(document).on(
+    "shown.bs.dropdown",
+    ".shinydashboard-notifications",
+    function() {
+      Shiny.setInputValue(this.id + "_opened", true, { priority: "event" });
+    }
+  );
+  document.addEventListener(
+    "click",
+    function(e) {
+      var target = e.target;
+      var more = target.closest && target.closest(".shinydashboard-menu-more");
+      var menu = more && more.closest(".shinydashboard-notifications");
+      if (!menu) {
+        return;
+      }
+      e.preventDefault();
+      e.stopPropagation();
+      Shiny.setInputValue(menu.id + "_load_more", true, { priority: "event" });
+    },
+    true
+  );
+
+  // output_binding_stats.ts
+  function statsCell(text, numeric) {
+    var td = document.createElement("td");
+    if (numeric)
+      td.className = "text-end";
+    td.textContent = text;
+    return td;
+  }
+  var statsOutputBinding = new Shiny.OutputBinding();
+  $.extend(statsOutputBinding, {
+    find: function(scope) {
+      return $(scope).find(".shinydashboard-stats-output");
+    },
+    renderValue: function(el, data) {
+      var tbody = el.querySelector("tbody");
+      if (tbody === null)
+        return;
+      var rows = (data === null ? [] : data).map((row) => {
+        var [id, renders, suppressed, cached, seconds, bytes] = row;
+        var tr = document.createElement("tr");
+        tr.append(
+          statsCell(id, false),
+          statsCell(String(renders), true),
+          statsCell(String(suppressed), true),
+          statsCell(String(cached), true),
+          statsCell(renders ? (seconds * 1e3 / renders).toFixed(1) : "", true),
+          statsCell((bytes / 1024).toFixed(1), true)
+        );
+        return tr;
+      });
+      tbody.replaceChildren(...rows);
+    }
+  });
+  Shiny.outputBindings.register(
+    statsOutputBinding,
+    "shinydashboard.statsOutputBinding"
+  );
 })();
@@ -1,2 +1,5 @@
 import "./tabs";
 import "./output_binding_menu";
+import "./output_binding_box";
+import "./menu_items";
+import "./output_binding_stats";
@@ -0,0 +1,177 @@
+// In-place menu_dropdown() changes
+// ------------------------------------------------------------------
+// Handles the messages sent by insert_menu_item(), remove_menu_item() and
+// set_menu_badge(), which add or remove one item of a menu (or change its
+// badge) without the rest of the menu being sent again. Items added with a
+// key carry it as a data-menu-key attribute. A badge whose value is "auto"
+// has data-badge="auto", and counts the menu's items whenever they change.
+// A menu's footer (like the "Load more" item of a NotificationStore's menu)
+// stays at the bottom.
+type MenuMessage = {
+  id: string;
+  op: "insert" | "remove" | "badge";
+  content?: { html: string; deps: any[] };
+  key?: string | null;
+  position?: "first" | "last";
+  value?: string | null;
+  status?: string | null;
+};
+
+function menuItems(menu: Element): Element[] {
+  return Array.from(menu.children).filter(
+    (x) =>
+      x.classList.contains("dropdown-item") &&
+      !x.classList.contains("dropdown-header") &&
+      !x.classList.contains("dropdown-footer")
+  );
+}
+
+function menuDivider(): HTMLElement {
+  var divider = document.createElement("div");
+  divider.className = "dropdown-divider";
+  return divider;
+}
+
+function isDivider(x: Element | null): boolean {
+  return x !== null && x.classList.contains("dropdown-divider");
+}
+
+function findMenuItem(menu: Element, key: string): Element | null {
+  return menu.querySelector(
+    ':scope > [data-menu-key="' + CSS.escape(key) + '"]'
+  );
+}
+
+function removeMenuItem(menu: Element, key: string) {
+  var item = findMenuItem(menu, key);
+  if (item === null) {
+    return;
+  }
+  // Take one of the dividers around the item with it
+  if (isDivider(item.previousElementSibling)) {
+    item.previousElementSibling.remove();
+  } else if (isDivider(item.nextElementSibling)) {
+    item.nextElementSibling.remove();
+  }
+  Shiny.unbindAll(item, true);
+  item.remove();
+}
+
+async function insertMenuItem(menu: Element, msg: MenuMessage) {
+  if (msg.key) {
+    removeMenuItem(menu, msg.key);
+  }
+  var items = menuItems(menu);
+  var header = menu.querySelector(":scope > .dropdown-header");
+  var footer = menu.querySelector(":scope > .dropdown-footer");
+  if (msg.position === "last" && footer !== null) {
+    await Shiny.renderContent(footer as HTMLElement, msg.content, "beforeBegin");
+    footer.before(menuDivider());
+  } else if (msg.position === "last" && menu.lastElementChild !== null) {
+    await Shiny.renderContent(menu as HTMLElement, msg.content, "beforeEnd");
+    menu.lastElementChild.before(menuDivider());
+  } else if (items.length > 0) {
+    var first = items[0];
+    await Shiny.renderContent(first as HTMLElement, msg.content, "beforeBegin");
+    first.before(menuDivider());
+  } else if (header !== null) {
+    await Shiny.renderContent(header as HTMLElement, msg.content, "afterEnd");
+    header.after(menuDivider());
+  } else {
+    await Shiny.renderContent(menu as HTMLElement, msg.content, "afterBegin");
+    if (menu.children.length > 1) {
+      menu.firstElementChild.after(menuDivider());
+    }
+  }
+}
+
+function setMenuBadge(el: HTMLElement, msg: MenuMessage) {
+  var link = el.querySelector(":scope > .nav-link");
+  if (link === null) {
+    return;
+  }
+  var badge = link.querySelector(":scope > .navbar-badge") as HTMLElement;
+  if (msg.value === null) {
+    if (badge !== null) badge.remove();
+    return;
+  }
+  if (badge === null) {
+    badge = document.createElement("span");
+    badge.className = "navbar-badge badge bg-primary";
+    link.appendChild(badge);
+  }
+  if (msg.status) {
+    badge.className = badge.className.replace(/(^|\s)bg-\S+/g, "");
+    badge.classList.add("bg-" + msg.status);
+  }
+  if (msg.value === "auto") {
+    badge.setAttribute("data-badge", "auto");
+  } else {
+    badge.removeAttribute("data-badge");
+    badge.textContent = msg.value;
+  }
+}
+
+function countMenuItems(el: HTMLElement, menu: Element) {
+  var badge = el.querySelector(':scope > .nav-link > [data-badge="auto"]');
+  if (badge !== null) {
+    badge.textContent = String(menuItems(menu).length);
+  }
+}
+
+async function handleMenuMessage(msg: MenuMessage) {
+  var el = document.getElementById(msg.id);
+  var menu = el && el.querySelector(":scope > .dropdown-menu");
+  if (!menu) {
+    return;
+  }
+  if (msg.op === "insert") {
+    await insertMenuItem(menu, msg);
+  } else if (msg.op === "remove") {
+    removeMenuItem(menu, msg.key);
+  } else if (msg.op === "badge") {
+    setMenuBadge(el, msg);
+  }
+  countMenuItems(el, menu);
+}
+
+// Inserting may have to wait for an item's HTML dependencies to load; messages
+// are handled one at a time, so that they apply in the order they were sent
+var menuMessages: Promise<void> = Promise.resolve();
+
+Shiny.addCustomMessageHandler("shinydashboard-menu", function (msg: MenuMessage) {
+  menuMessages = menuMessages
+    .then(() => handleMenuMessage(msg))
+    .catch((err) => console.error(err));
+});
+
+// NotificationStore menus
+// ------------------------------------------------------------------
+// Tell the server when the menu is opened (so its items count as seen), and
+// when its "Load more" item is clicked. The click is handled while capturing,
+// so that it doesn't reach Bootstrap's handler, which would close the menu.
+$(document).on(
+  "shown.bs.dropdown",
+  ".shinydashboard-notifications",
+  function () {
+    Shiny.setInputValue(this.id + "_opened", true, { priority: "event" });
+  }
+);
+
+document.addEventListener(
+  "click",
+  function (e: MouseEvent) {
+    var target = e.target as Element;
+    var more = target.closest && target.closest(".shinydashboard-menu-more");
+    var menu = more && more.closest(".shinydashboard-notifications");
+    if (!menu) {
+      return;
+    }
+    e.preventDefault();
+    e.stopPropagation();
+    Shiny.setInputValue(menu.id + "_load_more", true, { priority: "event" });
+  },
+  true
+);
+
+export {};
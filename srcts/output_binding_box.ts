@@ -0,0 +1,173 @@
+import { BindScope } from "rstudio-shiny/srcts/types/src/shiny/bind";
+import { ErrorsMessageValue } from "rstudio-shiny/srcts/types/src/shiny/shinyapp";
+
+// boxOutputBinding
+// ------------------------------------------------------------------
+// Output binding for output_value_box() and output_info_box(). The server
+// sends a box in full the first time (and whenever its structure changes),
+// and after that only the slots that changed, as {patch: {path: value}}. A
+// path is a series of child element indices starting from the output element,
+// e.g. "0.1.0" for the markup inside that element, or "0@class" for one of
+// its attributes.
+//
+// A grid whose tiles are keyed (with data-tile-key attributes) is instead
+// updated with {tiles: {keys, insert, patch}}: the keys of its tiles in order,
+// the HTML of the tiles that are new or replaced, and patches for the others,
+// whose paths start from the tile (as "0"). Tiles that aren't in the keys are
+// removed, and the rest are moved into place.
+//
+// Shiny replays the last value it received when an output is re-bound, and
+// that may be a patch; so for each output we keep an inert copy of its
+// contents, patched in lockstep with the real DOM, to rebuild from.
+//
+// An output whose function runs in an executor is sent {loading: true} when
+// it's invalidated, and {loading: false} if it then turns out unchanged; the
+// box stays as it is, with the shinydashboard-loading class in between.
+type Patch = { [path: string]: string };
+type TileUpdate = {
+  keys: string[];
+  insert?: { [key: string]: string };
+  patch?: { [key: string]: Patch };
+};
+
+var boxCopies: { [id: string]: { el: HTMLElement; copy: HTMLTemplateElement } } =
+  {};
+
+function applyPatch(root: ParentNode, patch: Patch, live: boolean) {
+  for (var key in patch) {
+    var [path, attr] = key.split("@");
+    var node: Element | undefined = undefined;
+    var parent = root;
+    for (var idx of path.split(".")) {
+      node = parent.children[parseInt(idx)];
+      if (!node) {
+        return;
+      }
+      parent = node;
+    }
+    if (attr !== undefined) {
+      node.setAttribute(attr, patch[key]);
+    } else if (live) {
+      Shiny.renderContent(node, { html: patch[key], deps: [] });
+    } else {
+      node.innerHTML = patch[key];
+    }
+  }
+}
+
+function applyTiles(root: ParentNode, update: TileUpdate, live: boolean) {
+  var tiles: { [key: string]: Element } = {};
+  for (var child of Array.from(root.children)) {
+    var key = child.getAttribute("data-tile-key");
+    if (key !== null) {
+      tiles[key] = child;
+    }
+  }
+  var insert = update.insert || {};
+  var patch = update.patch || {};
+  var template = document.createElement("template");
+  update.keys.forEach(function (key, i) {
+    var tile: Element | undefined = tiles[key];
+    delete tiles[key];
+    if (insert[key] !== undefined) {
+      if (tile !== undefined) {
+        removeTile(tile, live);
+      }
+      template.innerHTML = insert[key];
+      tile = template.content.firstElementChild as Element;
+      root.insertBefore(tile, root.children[i] || null);
+      if (live) {
+        Shiny.initializeInputs(tile as HTMLElement);
+        Shiny.bindAll(tile as HTMLElement);
+      }
+      return;
+    }
+    if (tile === undefined) {
+      return;
+    }
+    if (patch[key] !== undefined) {
+      applyPatch(
+        { children: [tile] } as unknown as ParentNode,
+        patch[key],
+        live
+      );
+    }
+    if (root.children[i] !== tile) {
+      root.insertBefore(tile, root.children[i] || null);
+    }
+  });
+  for (var key in tiles) {
+    removeTile(tiles[key], live);
+  }
+}
+
+function removeTile(tile: Element, live: boolean) {
+  if (live) {
+    Shiny.unbindAll(tile as HTMLElement, true);
+  }
+  tile.remove();
+}
+
+function applyUpdate(root: ParentNode, data: any, live: boolean) {
+  if (data.patch !== undefined) {
+    applyPatch(root, data.patch, live);
+  } else {
+    applyTiles(root, data.tiles, live);
+  }
+}
+
+var boxOutputBinding = new Shiny.OutputBinding();
+$.extend(boxOutputBinding, {
+  find: function (scope: BindScope) {
+    return $(scope).find(".shinydashboard-box-output");
+  },
+  onValueError: function (el: HTMLElement, err: ErrorsMessageValue) {
+    el.classList.remove("shinydashboard-loading");
+    delete boxCopies[el.id];
+    Shiny.unbindAll(el);
+    this.renderError(el, err);
+  },
+  renderValue: function (el: HTMLElement, data: any) {
+    var state = boxCopies[el.id];
+    if (data !== null && data.loading !== undefined) {
+      if (state !== undefined && state.el !== el) {
+        state.el = el;
+        Shiny.renderContent(el, { html: state.copy.innerHTML, deps: [] });
+      }
+      el.classList.toggle("shinydashboard-loading", data.loading);
+      return;
+    }
+    el.classList.remove("shinydashboard-loading");
+
+    if (
+      data === null ||
+      (data.patch === undefined && data.tiles === undefined)
+    ) {
+      Shiny.renderContent(el, data);
+      if (data === null) {
+        delete boxCopies[el.id];
+      } else {
+        var copy = document.createElement("template");
+        copy.innerHTML = data.html;
+        boxCopies[el.id] = { el, copy };
+      }
+      return;
+    }
+
+    if (state === undefined) {
+      return;
+    }
+    applyUpdate(state.copy.content, data, false);
+    if (state.el === el) {
+      applyUpdate(el, data, true);
+    } else {
+      // This is a newly bound element; rebuild it from the copy
+      state.el = el;
+      Shiny.renderContent(el, { html: state.copy.innerHTML, deps: [] });
+    }
+  },
+});
+Shiny.outputBindings.register(
+  boxOutputBinding,
+  "shinydashboard.boxOutputBinding"
+);
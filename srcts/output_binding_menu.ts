@@ -1,6 +1,7 @@
 import { BindScope } from "rstudio-shiny/srcts/types/src/shiny/bind";
 import { ErrorsMessageValue } from "rstudio-shiny/srcts/types/src/shiny/shinyapp";
-import { ensureActivatedTab, deactivateOtherTabs } from "./tabs";
+import { ensureActivatedTab, sidebarTabs } from "./tabs";
+import { timingEnd, timingStart } from "./timing";
 
 // menuOutputBinding
 // ------------------------------------------------------------------
@@ -23,7 +24,10 @@ $.extend(menuOutputBinding, {
     var dependencies = [];
     if (data === null) {
       return;
-    } else if (typeof data === "string") {
+    }
+    var start = timingStart("menu_render");
+    sidebarTabs.remove(el);
+    if (typeof data === "string") {
       html = data;
     } else if (typeof data === "object") {
       html = data.html;
@@ -41,7 +45,9 @@ $.extend(menuOutputBinding, {
 
     Shiny.initializeInputs(el);
     Shiny.bindAll(el);
+    sidebarTabs.add(el);
     if ($(el).hasClass("sidebar-menu")) ensureActivatedTab(); // eslint-disable-line
+    timingEnd("menu_render", start);
   },
 });
 Shiny.outputBindings.register(
@@ -0,0 +1,46 @@
+import { BindScope } from "rstudio-shiny/srcts/types/src/shiny/bind";
+
+// statsOutputBinding
+// ------------------------------------------------------------------
+// Output binding for the render stats panel of header(render_stats=True).
+// The server sends only the numbers, every couple of seconds while the panel
+// is open: a row per output, as [id, renders, suppressed, cached, seconds,
+// bytes], slowest first. The table's header is part of the page; its body is
+// filled in here.
+type StatsRow = [string, number, number, number, number, number];
+
+function statsCell(text: string, numeric: boolean): HTMLTableCellElement {
+  var td = document.createElement("td");
+  if (numeric) td.className = "text-end";
+  td.textContent = text;
+  return td;
+}
+
+var statsOutputBinding = new Shiny.OutputBinding();
+$.extend(statsOutputBinding, {
+  find: function (scope: BindScope) {
+    return $(scope).find(".shinydashboard-stats-output");
+  },
+  renderValue: function (el: HTMLElement, data: StatsRow[] | null) {
+    var tbody = el.querySelector("tbody");
+    if (tbody === null) return;
+    var rows = (data === null ? [] : data).map((row) => {
+      var [id, renders, suppressed, cached, seconds, bytes] = row;
+      var tr = document.createElement("tr");
+      tr.append(
+        statsCell(id, false),
+        statsCell(String(renders), true),
+        statsCell(String(suppressed), true),
+        statsCell(String(cached), true),
+        statsCell(renders ? ((seconds * 1000) / renders).toFixed(1) : "", true),
+        statsCell((bytes / 1024).toFixed(1), true)
+      );
+      return tr;
+    });
+    tbody.replaceChildren(...rows);
+  },
+});
+Shiny.outputBindings.register(
+  statsOutputBinding,
+  "shinydashboard.statsOutputBinding"
+);
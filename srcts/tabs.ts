@@ -1,62 +1,200 @@
-// This function handles a special case in the AdminLTE sidebar: when there
-// is a sidebar-menu with items, and one of those items has sub-items, and
-// they are used for tab navigation. Normally, if one of the items is
-// selected and then a sub-item is clicked, both the item and sub-item will
-// retain the "active" class, so they will both be highlighted. This happens
-// because they're not designed to be used together for tab panels. This
-// code ensures that only one item will have the "active" class.
-export function deactivateOtherTabs() {
-  // Find all tab links under sidebar-menu even if they don't have a
-  // tabName (which is why the second selector is necessary)
-  var $tablinks = $(
-    ".nav-sidebar a[data-toggle='tab']," + ".nav-sidebar li.treeview > a"
-  );
-
-  // If any other items are active, deactivate them
-  $tablinks.not($(this)).parent("li").removeClass("active");
-
-  // Trigger event for the tabItemInputBinding
-  var $obj = $(".sidebarMenuSelectedTabItem");
-  var inputBinding = $obj.data("shiny-input-binding");
-  if (typeof inputBinding !== "undefined") {
-    inputBinding.setValue($obj, $(this).attr("data-value"));
-    $obj.trigger("change");
+import { timingBoot, timingEnd, timingStart } from "./timing";
+
+var tabLinkSelector = ".nav-sidebar a[data-bs-toggle='tab']";
+
+// The state of the sidebar's tab links: which one is active, and the links
+// indexed by the pane they show (their data-bs-target). The index is built the
+// first time it's needed, and updated as menu outputs are rendered (see
+// output_binding_menu.ts), so that switching tabs doesn't have to search the
+// page, however big the sidebar is.
+class SidebarTabs {
+  private links: Map<string, HTMLElement> | null = null;
+  // The link of the pane that's shown, and the pane's selector
+  private active: HTMLElement | null = null;
+  private activeTarget: string | null = null;
+  private startLink: HTMLElement | null = null;
+  private $selectedInput: JQuery<HTMLElement> | null = null;
+
+  private index(): Map<string, HTMLElement> {
+    if (this.links === null) {
+      this.links = new Map();
+      this.add(document);
+    }
+    return this.links;
+  }
+
+  // Index the tab links in newly rendered content. If the pane that's shown
+  // has a new link, it becomes the active one.
+  add(scope: ParentNode) {
+    var links = this.index();
+    scope.querySelectorAll<HTMLElement>(tabLinkSelector).forEach((link) => {
+      var target = link.getAttribute("data-bs-target");
+      if (target === null) {
+        return;
+      }
+      links.set(target, link);
+      if (target === this.activeTarget) {
+        this.active = link;
+      }
+      if (link.getAttribute("data-start-selected") === "1") {
+        this.startLink = link;
+      }
+    });
+    var $input = $(scope).find(".sidebarMenuSelectedTabItem");
+    if ($input.length !== 0) {
+      this.$selectedInput = $input;
+    }
+  }
+
+  // Forget the tab links in content that's about to be replaced
+  remove(scope: Element) {
+    var links = this.links;
+    if (links === null) {
+      return;
+    }
+    scope.querySelectorAll<HTMLElement>(tabLinkSelector).forEach((link) => {
+      var target = link.getAttribute("data-bs-target");
+      if (target !== null && links.get(target) === link) {
+        links.delete(target);
+      }
+      if (link === this.active) {
+        this.active = null;
+      }
+      if (link === this.startLink) {
+        this.startLink = null;
+      }
+    });
+    if (this.$selectedInput && scope.contains(this.$selectedInput[0])) {
+      this.$selectedInput = null;
+    }
+  }
+
+  // The link to show when no tab has been shown yet (or its link is gone):
+  // the one with `data-start-selected`, or if there's none, the first one.
+  // Otherwise, the link of the pane that's shown.
+  linkToShow(): HTMLElement | null {
+    var links = this.index();
+    var link =
+      this.activeTarget === null ? undefined : links.get(this.activeTarget);
+    if (link !== undefined) {
+      return link;
+    }
+    return (
+      this.startLink || document.querySelector<HTMLElement>(tabLinkSelector)
+    );
+  }
+
+  // When a tab's link has been shown, deactivate the previous one. Bootstrap
+  // only does that within a list of links, so when one of the sidebar's items
+  // is selected and then a sub-item is clicked (or vice versa), both items
+  // (and their panes) would stay active otherwise, because they're not
+  // designed to be used together for tab panels.
+  shown(link: HTMLElement) {
+    var links = this.index();
+    var target = link.getAttribute("data-bs-target");
+    if (target !== null && links.get(target) !== link) {
+      // Added to the page some other way, e.g. by insert_ui()
+      links.set(target, link);
+    }
+
+    var old = this.active;
+    if (old !== null && old !== link) {
+      old.classList.remove("active");
+      old.setAttribute("aria-selected", "false");
+      if (this.activeTarget !== null && this.activeTarget !== target) {
+        var pane = document.querySelector(this.activeTarget);
+        if (pane !== null) {
+          pane.classList.remove("active", "show");
+        }
+      }
+    }
+    this.active = link;
+    this.activeTarget = target;
+
+    // Trigger event for the tabItemInputBinding
+    var $obj = this.$selectedInput;
+    if ($obj === null) {
+      return;
+    }
+    var inputBinding = $obj.data("shiny-input-binding");
+    if (typeof inputBinding !== "undefined") {
+      inputBinding.setValue($obj, link.getAttribute("data-value"));
+      $obj.trigger("change");
+    }
+  }
+
+  // Indirectly set the value of the Shiny input, by setting an attribute on
+  // the html element it is bound to. (The inputBinding's setValue() method
+  // can't be used when the page is starting up, before Shiny has fully
+  // initialized.)
+  setInitialValue(link: HTMLElement) {
+    if (this.$selectedInput) {
+      this.$selectedInput.attr("data-value", link.getAttribute("data-value"));
+    }
   }
 }
 
-$(document).on(
-  "shown.bs.tab",
-  '.nav-sidebar a[data-toggle="tab"]',
-  deactivateOtherTabs
-);
+export var sidebarTabs = new SidebarTabs();
+
+export function deactivateOtherTabs(this: HTMLElement) {
+  sidebarTabs.shown(this);
+}
+
+$(document).on("shown.bs.tab", tabLinkSelector, deactivateOtherTabs);
 
-// When document is ready, if there is a sidebar menu with no activated tabs,
-// activate the one specified by `data-start-selected`, or if that's not
-// present, the first one.
+// Lazy nav_content() panes are sent to the browser empty. The first time one
+// is shown, ask the server (see dashboard_server()) to render its contents;
+// they stay in the page after that, so later visits are free.
+export function requestLazyTab() {
+  var $pane = $($(this).attr("data-bs-target"));
+  if (!$pane.is("[data-lazy-tab]") || $pane.attr("data-lazy-state")) {
+    return;
+  }
+  $pane.attr("data-lazy-state", "requested");
+
+  var send = () =>
+    Shiny.setInputValue("shinydashboard_lazy_tab", $pane.attr("data-lazy-tab"), {
+      priority: "event",
+    });
+  // The initial tab is shown before Shiny has connected
+  if (Shiny.shinyapp && Shiny.shinyapp.isConnected()) {
+    send();
+  } else {
+    $(document).one("shiny:connected", send);
+  }
+}
+
+$(document).on("shown.bs.tab", tabLinkSelector, requestLazyTab);
+
+// When document is ready (or a sidebar menu has been rendered), if there is a
+// sidebar menu with no activated tabs, activate the one specified by
+// `data-start-selected`, or if that's not present, the first one.
 export function ensureActivatedTab() {
-  var $tablinks = $(".nav-sidebar a[data-bs-toggle='tab']");
-
-  // If there's a `data-start-selected` attribute and we can find a tab with
-  // that name, activate it.
-  var $startTab = $tablinks.filter("[data-start-selected='1']");
-  if ($startTab.length === 0) {
-    // If no tab starts selected, use the first one, if present
-    $startTab = $tablinks.first();
-  }
-
-  // If there are no tabs, $startTab.length will be 0.
-  if ($startTab.length !== 0) {
-    $startTab.tab("show");
-
-    // This is indirectly setting the value of the Shiny input by setting
-    // an attribute on the html element it is bound to. We cannot use the
-    // inputBinding's setValue() method here because this is called too
-    // early (before Shiny has fully initialized)
-    $(".sidebarMenuSelectedTabItem").attr(
-      "data-value",
-      $startTab.attr("data-value")
-    );
+  var start = timingStart("ensure_tab");
+  var link = sidebarTabs.linkToShow();
+
+  // If there are no tabs, link will be null.
+  if (link !== null) {
+    $(link).tab("show");
+    sidebarTabs.setInitialValue(link);
   }
+  timingEnd("ensure_tab", start);
 }
 
-document.addEventListener("DOMContentLoaded", () => ensureActivatedTab());
+document.addEventListener("DOMContentLoaded", () => {
+  ensureActivatedTab();
+  timingBoot();
+});
+
+// Time tab switches: from when a tab starts to be shown, until it has been
+// shown (after Bootstrap's fade) and the handlers above have run.
+var tabSwitchStart: number | null = null;
+
+$(document).on("show.bs.tab", tabLinkSelector, () => {
+  tabSwitchStart = timingStart("tab_switch");
+});
+
+$(document).on("shown.bs.tab", tabLinkSelector, () => {
+  timingEnd("tab_switch", tabSwitchStart);
+  tabSwitchStart = null;
+});
@@ -0,0 +1,76 @@
+// Performance marks for the dashboard's boot, tab switches and menu renders,
+// on pages made with page(client_timing=True). They show up in the browser's
+// performance tools as "shinydashboard:*" measures, and the durations are sent
+// to the server (see dashboard_server()) in batches, as the
+// "shinydashboard_timing" input: a list of [event, milliseconds] pairs. The
+// marks and measures are cleared once they're reported, so that they don't
+// pile up in the performance timeline of a page that stays open for days.
+
+var pending: Array<[string, number]> = [];
+var flushing = false;
+
+function timingEnabled(): boolean {
+  return (
+    document.body !== null &&
+    document.body.hasAttribute("data-client-timing") &&
+    typeof performance !== "undefined" &&
+    typeof performance.mark === "function"
+  );
+}
+
+// Start timing an event; pass the result to timingEnd() when it's over.
+export function timingStart(event: string): number | null {
+  if (!timingEnabled()) {
+    return null;
+  }
+  performance.mark("shinydashboard:" + event + ":start");
+  return performance.now();
+}
+
+export function timingEnd(event: string, start: number | null) {
+  if (start === null) {
+    return;
+  }
+  var ms = performance.now() - start;
+  try {
+    performance.measure(
+      "shinydashboard:" + event,
+      "shinydashboard:" + event + ":start"
+    );
+  } catch (e) {
+    // The start mark was cleared, e.g. by other code on the page
+  }
+  report(event, ms);
+  performance.clearMarks("shinydashboard:" + event + ":start");
+  performance.clearMeasures("shinydashboard:" + event);
+}
+
+// The time from navigation to now, when the dashboard has shown its first tab
+export function timingBoot() {
+  if (!timingEnabled()) {
+    return;
+  }
+  performance.measure("shinydashboard:boot");
+  report("boot", performance.now());
+  performance.clearMeasures("shinydashboard:boot");
+}
+
+function report(event: string, ms: number) {
+  pending.push([event, ms]);
+  if (!flushing) {
+    flushing = true;
+    setTimeout(flush, 1000);
+  }
+}
+
+function flush() {
+  // The page boots before Shiny has connected
+  if (!Shiny.shinyapp || !Shiny.shinyapp.isConnected()) {
+    $(document).one("shiny:connected", flush);
+    return;
+  }
+  flushing = false;
+  var batch = pending;
+  pending = [];
+  Shiny.setInputValue("shinydashboard_timing", batch, { priority: "event" });
+}
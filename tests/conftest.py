@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from shiny import App, Inputs, Outputs, Session, reactive, ui
+from shiny._connection import MockConnection
+
+# Shiny's reactive graph (and its lock) lives as long as the process, and is bound to
+# the event loop that it first runs in; so the async tests all run in this one loop
+_loop = asyncio.new_event_loop()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> Optional[bool]:
+    if not asyncio.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    argnames = pyfuncitem._fixtureinfo.argnames
+    args = {name: pyfuncitem.funcargs[name] for name in argnames}
+    _loop.run_until_complete(pyfuncitem.obj(**args))
+    return True
+
+
+class RecordingConnection(MockConnection):
+    """A connection that keeps the messages the server sends."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: List[Dict[str, Any]] = []
+
+    async def send(self, message: str) -> None:
+        self.messages.append(json.loads(message))
+
+
+class SessionDriver:
+    """Runs a Shiny session of `app`, over a connection that's driven by the test, in
+    place of a browser."""
+
+    def __init__(self, app: App) -> None:
+        self.app = app
+        self.conn = RecordingConnection()
+        self.session = self.app._create_session(self.conn)
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self, *outputs: str, **inputs: object) -> None:
+        """Start the session, with the given outputs shown (outputs that aren't shown
+        aren't rendered) and input values."""
+        for name in outputs:
+            inputs[f".clientdata_output_{name}_hidden"] = False
+        self._task = asyncio.create_task(self.session._run())
+        await self.send({"method": "init", "data": inputs})
+
+    async def set_inputs(self, **inputs: object) -> None:
+        await self.send({"method": "update", "data": inputs})
+
+    async def send(self, message: Dict[str, object]) -> None:
+        # The session handles a message (and flushes) while holding the reactive lock
+        self.conn.cause_receive(json.dumps(message))
+        while not self.conn._queue.empty():
+            await asyncio.sleep(0)
+        await self.settle()
+
+    async def settle(self) -> None:
+        async with reactive.lock():
+            pass
+        # Let the messages queued by the flush go out
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def wait_for(self, condition: Callable[[], bool], timeout: float = 5) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for the session")
+            await asyncio.sleep(0.01)
+        await self.settle()
+
+    async def close(self) -> None:
+        self.conn.cause_disconnect()
+        if self._task is not None:
+            await self._task
+
+    def values(self, name: str) -> List[Any]:
+        """The values sent for output `name`, in order."""
+        return [
+            msg["values"][name]
+            for msg in self.conn.messages
+            if name in msg.get("values", {})
+        ]
+
+    def errors(self, name: str) -> List[Any]:
+        return [
+            msg["errors"][name]
+            for msg in self.conn.messages
+            if name in msg.get("errors", {})
+        ]
+
+    def custom(self, type: str) -> List[Any]:
+        return [
+            msg["custom"][type]
+            for msg in self.conn.messages
+            if type in msg.get("custom", {})
+        ]
+
+
+@pytest.fixture
+def session_driver():
+    """Makes :class:`SessionDriver` objects for the app with a given server function
+    (the same app for the same function), and closes their sessions after the test."""
+    drivers: List[SessionDriver] = []
+    apps: Dict[Callable[[Inputs, Outputs, Session], None], App] = {}
+
+    def make(server: Callable[[Inputs, Outputs, Session], None]) -> SessionDriver:
+        if server not in apps:
+            apps[server] = App(ui.page_fluid(), server)
+        driver = SessionDriver(apps[server])
+        drivers.append(driver)
+        return driver
+
+    yield make
+    for driver in drivers:
+        _loop.run_until_complete(driver.close())
@@ -0,0 +1,143 @@
+import asyncio
+import gzip
+import os
+
+import pytest
+from htmltools import HTMLDependency
+from shiny import App, ui
+
+import shinydashboard as sdb
+from shinydashboard._htmldeps import deps_shinydashboard, registered
+
+
+def request(app, path, accept_encoding=None, method="GET"):
+    """Sends one request to an ASGI app, returning its status, headers and body."""
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode("latin-1")))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("latin-1"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 80),
+    }
+    messages = []
+    received = []
+
+    async def receive():
+        if not received:
+            received.append(True)
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Then wait for the response to be sent, as a connected client would
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.new_event_loop().run_until_complete(app(scope, receive, send))
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    res_headers = {
+        k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]
+    }
+    return start["status"], res_headers, body
+
+
+@pytest.fixture
+def assets(tmp_path):
+    css = "".join(f".rule-{i} {{ color: red; }}\n" for i in range(200))
+    (tmp_path / "style.css").write_text(css)
+    (tmp_path / "plain.css").write_text(css)
+    sdb.compress_assets([str(tmp_path)])
+    os.remove(tmp_path / "plain.css.gz")
+    if os.path.exists(tmp_path / "plain.css.br"):
+        os.remove(tmp_path / "plain.css.br")
+
+    dep = registered(
+        HTMLDependency(
+            "test-assets",
+            "1.0.0+0123456789ab",
+            source={"subdir": str(tmp_path)},
+            stylesheet={"href": "style.css"},
+        )
+    )
+    app = sdb.serve_precompressed(App(ui.page_fluid(dep), None))
+    return app, "/lib/" + dep.source_path_map(lib_prefix=None)["href"], css
+
+
+def test_serves_the_accepted_encoding(assets):
+    app, lib, css = assets
+    status, headers, body = request(app, lib + "/style.css", "deflate, gzip;q=0.5")
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-type"].startswith("text/css")
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert gzip.decompress(body).decode() == css
+
+
+def test_falls_back_to_the_original(assets):
+    app, lib, css = assets
+
+    # The browser doesn't accept any of the encodings
+    status, headers, body = request(app, lib + "/style.css", "gzip;q=0, deflate")
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert body.decode() == css
+
+    # There's no compressed copy
+    status, headers, body = request(app, lib + "/plain.css", "gzip, br")
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert body.decode() == css
+
+
+def test_ignores_out_of_date_copies(assets, tmp_path):
+    app, lib, css = assets
+    mtime = os.path.getmtime(tmp_path / "style.css")
+    for ext in (".gz", ".br"):
+        if os.path.exists(tmp_path / ("style.css" + ext)):
+            os.utime(tmp_path / ("style.css" + ext), (mtime - 10, mtime - 10))
+
+    status, headers, body = request(app, lib + "/style.css", "gzip, br")
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert body.decode() == css
+
+
+def test_head_request(assets):
+    app, lib, _ = assets
+    status, headers, body = request(app, lib + "/style.css", "gzip", method="HEAD")
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert body == b""
+
+
+def test_passes_other_requests_to_the_app(assets):
+    app, lib, _ = assets
+    assert request(app, lib + "/missing.css", "gzip")[0] == 404
+    assert request(app, lib + "/../style.css", "gzip")[0] == 404
+    assert request(app, "/", "gzip")[0] == 200
+
+
+def test_serves_the_package_dependencies():
+    page = sdb.page(sdb.header(), sdb.sidebar("Test"), sdb.body(), title="Test")
+    app = sdb.serve_precompressed(App(page, None))
+    [dep] = deps_shinydashboard()
+    href = dep.source_path_map(lib_prefix=None)["href"]
+
+    status, headers, body = request(app, f"/lib/{href}/js/shinydashboard.js")
+    assert status == 200
+    assert headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert body.startswith(b"(() => {")
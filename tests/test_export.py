@@ -0,0 +1,49 @@
+import re
+
+import htmltools as ht
+from htmltools import tags
+
+import shinydashboard as sdb
+
+
+def sample_page() -> ht.Tag:
+    return sdb.page(
+        sdb.header(),
+        sdb.sidebar(
+            "Title",
+            sdb.sidebar_menu_tab("Tab", "tab", icon=tags.i(class_="fas fa-cog")),
+        ),
+        sdb.body(
+            sdb.navset(
+                sdb.nav_content(
+                    "tab", sdb.value_box("42", "Orders"), sdb.info_box("Users", "7")
+                )
+            ),
+            sdb.navset(sdb.nav_content("lazy", sdb.value_box("43"), lazy=True)),
+        ),
+        title="Report",
+    )
+
+
+def test_export_html():
+    ui = sample_page()
+    html = sdb.export_html(ui)
+
+    assert "<title>Report</title>" in html
+    for selector in (".wrapper", ".main-sidebar", ".brand-link", ".small-box"):
+        assert re.search(re.escape(selector) + r"[{,: ]", html), selector
+    assert ".info-box" in html
+    assert ".fas.fa-cog{" in html or ".fas.fa-cog," in html
+    # Lazy panes are exported with their contents
+    assert "<h3>43</h3>" in html
+    assert "data-lazy-tab" not in html
+    assert "data-lazy-tab" in ht.HTMLDocument(ui).render()["html"]
+    # Everything is inline
+    assert not re.search(r"""(?:href|src)=["'](?!#|data:|javascript:)""", html)
+
+
+def test_export_html_without_purging(tmp_path):
+    path = tmp_path / "report.html"
+    html = sdb.export_html(sample_page(), str(path), purge_css=False, minify=False)
+    assert path.read_text(encoding="utf-8") == html
+    assert len(html) > len(sdb.export_html(sample_page()))
@@ -0,0 +1,37 @@
+from htmltools import HTML, HTMLDocument, TagList, tags
+
+import shinydashboard as sdb
+from shinydashboard._icons import icon_refs
+
+
+def test_icon_refs_in_page():
+    page = sdb.page(body=sdb.body(tags.i(class_="fas fa-cog")))
+    # Renamed in Font Awesome 6
+    assert icon_refs(page) == {("solid", "gear")}
+    assert icon_refs(page.tagify()) == {("solid", "gear")}
+
+
+def test_icon_subset_includes_lazy_tabs():
+    page = sdb.page(
+        sdb.header(),
+        sdb.sidebar("Title", sdb.sidebar_menu_tab("Tab", "tab")),
+        sdb.body(
+            sdb.navset(sdb.nav_content("tab", tags.i(class_="fas fa-bell"), lazy=True))
+        ),
+        icons="subset",
+    )
+    html = HTMLDocument(page).render()["html"]
+    assert "fa-bell" not in html.split("<body")[1]
+    assert ".fa-bell" in html.split("<body")[0]
+
+
+def test_icon_refs_in_html():
+    x = TagList(HTML('<i class="far fa-bell"></i>'), [tags.i(class_="fab fa-github")])
+    assert icon_refs(x) == {("regular", "bell"), ("brands", "github")}
+
+
+def test_icon_refs_include_swapped_icons():
+    assert icon_refs(tags.i(class_="fas fa-plus")) == {
+        ("solid", "plus"),
+        ("solid", "minus"),
+    }
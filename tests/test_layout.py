@@ -0,0 +1,34 @@
+import os
+
+import htmltools as ht
+
+import shinydashboard as sdb
+from shinydashboard._layout import _head_deps, _head_html
+
+
+def render_page(**kwargs: object) -> str:
+    return ht.HTMLDocument(sdb.page(**kwargs)).render()["html"]
+
+
+def test_page_head_is_not_escaped():
+    html = render_page(title="Dashboard")
+    assert "<title>Dashboard</title>" in html
+    assert '<meta name="viewport"' in html
+    assert "&lt;" not in html
+
+
+def test_page_title_is_escaped():
+    html = render_page(title="A & B")
+    assert "<title>A &amp; B</title>" in html
+
+
+def test_page_shell_cache():
+    warm = ht.HTMLDocument(sdb.page(title="Dashboard")).render()
+    _head_html.cache_clear()
+    _head_deps.cache_clear()
+    cold = ht.HTMLDocument(sdb.page(title="Dashboard")).render()
+    assert warm["html"] == cold["html"]
+
+    # The dependencies are served from the package's directories
+    for dep in cold["dependencies"]:
+        assert os.path.isdir(dep.source_path_map()["source"])
@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+from shiny import reactive
+
+import shinydashboard as sdb
+from shinydashboard._metrics import (
+    RENDER_STATS_OUTPUT,
+    _client_timings,
+    _output_counters,
+)
+
+
+async def set_value(value: reactive.Value, x: object) -> None:
+    async with reactive.lock():
+        value.set(x)
+        await reactive.flush()
+
+
+@pytest.fixture
+def stats():
+    sdb.reset_render_stats()
+    sdb.enable_output_stats()
+    yield
+    sdb.enable_output_stats(False)
+    sdb.reset_render_stats()
+
+
+async def test_output_stats(stats, session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_value_box
+        def users():
+            return sdb.value_box(str(n() // 2), "Users")
+
+    driver = session_driver(server)
+    await driver.start("users")
+    await set_value(n, 2)
+    await set_value(n, 3)
+
+    x = sdb.output_stats()["users"]
+    assert x.renders == 3
+    # 3 // 2 == 2 // 2
+    assert x.suppressed == 1
+    assert x.cached == 0
+    assert x.seconds > 0
+    full, patch = driver.values("users")
+    assert x.bytes == len(json.dumps(full)) + len(json.dumps(patch))
+
+
+def test_output_stats_text(stats):
+    _output_counters.record("users", renders=3, suppressed=1, seconds=0.5, bytes=100)
+    _output_counters.record('mod-"a\\b"\n', renders=1)
+    _client_timings.record([["boot", 20], ["tab_switch", 3], ["unknown", 1]])
+
+    lines = sdb.output_stats_text().splitlines()
+    assert lines[:2] == [
+        "# HELP shinydashboard_output_renders_total Renderings of the output.",
+        "# TYPE shinydashboard_output_renders_total counter",
+    ]
+    # The outputs are sorted, and their ids escaped
+    assert lines[2:4] == [
+        'shinydashboard_output_renders_total{output="mod-\\"a\\\\b\\"\\n"} 1',
+        'shinydashboard_output_renders_total{output="users"} 3',
+    ]
+    for sample in [
+        'shinydashboard_output_suppressed_total{output="users"} 1',
+        'shinydashboard_output_cached_total{output="users"} 0',
+        'shinydashboard_output_render_seconds_total{output="users"} 0.5',
+        'shinydashboard_output_sent_bytes_total{output="users"} 100',
+        "# TYPE shinydashboard_client_event_seconds histogram",
+        'shinydashboard_client_event_seconds_bucket{event="boot",le="0.01"} 0',
+        'shinydashboard_client_event_seconds_bucket{event="boot",le="0.025"} 1',
+        'shinydashboard_client_event_seconds_bucket{event="boot",le="+Inf"} 1',
+        'shinydashboard_client_event_seconds_sum{event="boot"} 0.02',
+        'shinydashboard_client_event_seconds_count{event="tab_switch"} 1',
+    ]:
+        assert sample in lines
+    assert not any("unknown" in line for line in lines)
+
+
+def test_header_render_stats_panel():
+    html = str(sdb.header(render_stats=True))
+    assert f'<table id="{RENDER_STATS_OUTPUT}"' in html
+    assert "shinydashboard-stats-output" in html
+    assert "<th>Output</th>" in html
+    assert RENDER_STATS_OUTPUT not in str(sdb.header())
+
+
+async def test_render_stats_panel_sends_data(stats, session_driver):
+    def server(input, output, session):
+        sdb.dashboard_server(render_stats=True)
+
+        @sdb.render_value_box
+        def users():
+            return sdb.value_box("1", "Users")
+
+    driver = session_driver(server)
+    await driver.start("users")
+    assert driver.values(RENDER_STATS_OUTPUT) == []
+    # The panel is opened
+    await driver.set_inputs(
+        **{f".clientdata_output_{RENDER_STATS_OUTPUT}_hidden": False}
+    )
+
+    [[row]] = driver.values(RENDER_STATS_OUTPUT)
+    assert row[:4] == ["users", 1, 0, 0]
+    assert row[4] > 0
+    assert row[5] == sdb.output_stats()["users"].bytes
+
+    # It's rendered again every 2 seconds, but not sent while the stats stay the same
+    await asyncio.sleep(2.2)
+    await driver.settle()
+    assert len(driver.values(RENDER_STATS_OUTPUT)) == 1
@@ -0,0 +1,82 @@
+import re
+
+from shiny import reactive
+
+import shinydashboard as sdb
+from shinydashboard._server import MENU_MESSAGE
+
+
+async def add(store: sdb.NotificationStore, *messages: str) -> None:
+    async with reactive.lock():
+        for message in messages:
+            store.add(sdb.item_notification(message))
+        await reactive.flush()
+
+
+class MenuChanges:
+    """The menu messages sent to a session, in short form."""
+
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.count = 0
+
+    def new(self):
+        """The changes made since the last call."""
+        messages = self.driver.custom(MENU_MESSAGE)[self.count :]
+        self.count += len(messages)
+        return [_change(msg) for msg in messages]
+
+
+def _change(msg):
+    if msg["op"] == "badge":
+        return ("badge", msg["value"])
+    if msg["op"] == "insert":
+        key = re.search(r'data-menu-key="(\w+)"', msg["content"]["html"]).group(1)
+        return ("insert", key, msg["position"])
+    return ("remove", msg["key"], None)
+
+
+async def test_notification_store(session_driver):
+    store = sdb.NotificationStore(4, page_size=2)
+
+    def server(input, output, session):
+        sdb.dashboard_server(notifications={"alerts": store})
+
+    await add(store, "zero", "one", "two")
+    driver = session_driver(server)
+    changes = MenuChanges(driver)
+    await driver.start("alerts")
+
+    # The newest page of items, with "Load more", and all of them unseen
+    [menu] = driver.values("alerts")
+    html = menu["html"]
+    assert html.index('data-menu-key="n2"') < html.index('data-menu-key="n1"')
+    assert 'data-menu-key="n0"' not in html
+    assert "Load more" in html
+    assert 'badge bg-warning">3</span>' in html
+    assert changes.new() == []
+
+    # The last item is loaded, which is the last one there is
+    await driver.set_inputs(alerts_load_more=1)
+    assert changes.new() == [("insert", "n0", "last"), ("remove", "more", None)]
+
+    # New items go at the top; the store evicts the oldest of them
+    await add(store, "three", "four")
+    assert len(store) == 4
+    assert changes.new() == [
+        ("insert", "n3", "first"),
+        ("insert", "n4", "first"),
+        # Three items fit in the menu, now
+        ("remove", "n0", None),
+        ("remove", "n1", None),
+        ("insert", "more", "last"),
+        ("badge", "4"),
+    ]
+
+    # Opening the menu marks the items as seen
+    await driver.set_inputs(alerts_opened=1)
+    assert changes.new() == [("badge", None)]
+    await add(store, "five")
+    assert changes.new()[-1] == ("badge", "1")
+    await driver.set_inputs(alerts_opened=2)
+    assert changes.new() == [("badge", None)]
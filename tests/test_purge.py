@@ -0,0 +1,75 @@
+import htmltools as ht
+
+import shinydashboard as sdb
+from shinydashboard import _purge
+from shinydashboard._utils import package_file
+
+SELECTORS = (".wrapper", ".main-sidebar", ".brand-link", ".small-box", ".info-box")
+
+
+def sample_page(**kwargs: object) -> ht.Tag:
+    return sdb.page(
+        sdb.header(),
+        sdb.sidebar("Title", sdb.sidebar_menu_link("Link", "#")),
+        sdb.body(sdb.value_box("1"), sdb.info_box("Title", "2")),
+        **kwargs,
+    )
+
+
+def test_class_names_in_page():
+    page = sample_page()
+    names = _purge.class_names(page)
+    assert names == _purge.class_names(page.tagify())
+    assert {"wrapper", "main-sidebar", "brand-link", "small-box", "info-box"} <= names
+
+
+def test_class_names_in_html():
+    x = ht.TagList(ht.HTML("<div class='a b'></div>"), [ht.tags.span(class_="c")])
+    assert _purge.class_names(x) == {"a", "b", "c"}
+
+
+def test_purged_css_keeps_page_selectors(tmp_path, monkeypatch):
+    with open(package_file("www/adminlte/css/adminlte.min.css"), encoding="utf-8") as f:
+        css = f.read()
+    # Only the page's own classes, without the ones that are always kept
+    purged = _purge.purge_css(css, _purge.class_names(sample_page()))
+    assert len(purged) < len(css) / 2
+    for selector in SELECTORS:
+        assert selector + "{" in purged or selector + "," in purged
+
+    monkeypatch.setattr(_purge, "_cache_dir", str(tmp_path))
+    _purge.purged_css.cache_clear()
+    html = ht.HTMLDocument(sample_page(purge_css=True)).render()
+    deps = [dep for dep in html["dependencies"] if dep.name.endswith("-purged")]
+    assert len(deps) == 1
+    source = deps[0].source
+    with open(f"{source['subdir']}/adminlte.min.css", encoding="utf-8") as f:
+        purged = f.read()
+    for selector in SELECTORS:
+        assert selector in purged
+
+
+def test_purged_css_keeps_lazy_tab_selectors(tmp_path, monkeypatch):
+    monkeypatch.setattr(_purge, "_cache_dir", str(tmp_path))
+    _purge.purged_css.cache_clear()
+
+    def purged(lazy):
+        page = sdb.page(
+            sdb.header(),
+            sdb.sidebar("Title", sdb.sidebar_menu_tab("Tab", "tab")),
+            sdb.body(
+                sdb.navset(
+                    sdb.nav_content(
+                        "tab", ht.tags.p("Error", class_="text-danger"), lazy=lazy
+                    )
+                )
+            ),
+            purge_css=True,
+        )
+        html = ht.HTMLDocument(page).render()
+        [dep] = [dep for dep in html["dependencies"] if dep.name.endswith("-purged")]
+        with open(f"{dep.source['subdir']}/adminlte.min.css", encoding="utf-8") as f:
+            return f.read()
+
+    assert ".text-danger{" in purged(lazy=False)
+    assert ".text-danger{" in purged(lazy=True)
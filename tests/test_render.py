@@ -0,0 +1,396 @@
+import asyncio
+import functools
+import os
+import re
+import threading
+
+import pytest
+from shiny import reactive
+from shiny.session import session_context
+
+import shinydashboard as sdb
+from shinydashboard._render import _Broadcast, _background_tasks, cached
+
+
+async def set_value(value: reactive.Value, x: object) -> None:
+    async with reactive.lock():
+        value.set(x)
+        await reactive.flush()
+
+
+async def test_render_value_box_patches(session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_value_box
+        def box():
+            return sdb.value_box(str(n()), "Users", color="success")
+
+    driver = session_driver(server)
+    await driver.start("box")
+    await set_value(n, 2)
+    await set_value(n, 2)
+
+    full, patch = driver.values("box")
+    assert full["deps"] == []
+    assert '<div class="small-box bg-success">' in full["html"]
+    assert "<h3>1</h3>" in full["html"]
+    # Only the value changed
+    assert patch == {"patch": {"0.0.0": "2"}}
+
+
+async def test_render_info_box_resends_changed_structure(session_driver):
+    subtitle = reactive.Value(None)
+
+    def server(input, output, session):
+        @sdb.render_info_box
+        def box():
+            return sdb.info_box("Title", "1", subtitle=subtitle())
+
+    driver = session_driver(server)
+    await driver.start("box")
+    await set_value(subtitle, "Subtitle")
+
+    first, second = driver.values("box")
+    assert 'class="info-box-text"' in first["html"]
+    assert "Subtitle" not in first["html"]
+    assert "<div>Subtitle</div>" in second["html"]
+
+
+async def test_render_value_box_async_and_none(session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_value_box
+        async def box():
+            if n() == 0:
+                return None
+            return sdb.value_box(str(n()))
+
+    driver = session_driver(server)
+    await driver.start("box")
+    await set_value(n, 0)
+    await set_value(n, 3)
+
+    first, cleared, third = driver.values("box")
+    assert "<h3>1</h3>" in first["html"]
+    assert cleared is None
+    # Sent in full, since the browser no longer has the box
+    assert "<h3>3</h3>" in third["html"]
+
+
+async def test_render_value_box_delay_defers_the_call(session_driver):
+    n = reactive.Value(1)
+    calls = []
+
+    def server(input, output, session):
+        @sdb.render_value_box(delay_ms=50)
+        def box():
+            calls.append(n())
+            return sdb.value_box(str(n()))
+
+    driver = session_driver(server)
+    await driver.start("box")
+    await set_value(n, 2)
+    await set_value(n, 3)
+    assert calls == [1]
+
+    await driver.wait_for(lambda: len(driver.values("box")) == 2)
+    assert calls == [1, 3]
+    assert driver.values("box")[1] == {"patch": {"0.0.0": "3"}}
+
+
+async def test_render_value_box_throttle_coalesces_changes(session_driver):
+    n = reactive.Value(1)
+    calls = []
+
+    def server(input, output, session):
+        @sdb.render_value_box(throttle_ms=100)
+        def box():
+            calls.append(n())
+            return sdb.value_box(str(n()))
+
+    driver = session_driver(server)
+    await driver.start("box")
+    for i in (2, 3, 4):
+        await set_value(n, i)
+    assert calls == [1]
+
+    # Rendered once the window is over, with only the last of the values
+    await driver.wait_for(lambda: len(driver.values("box")) == 2)
+    assert calls == [1, 4]
+    assert driver.values("box")[1] == {"patch": {"0.0.0": "4"}}
+
+
+async def test_render_value_box_in_executor(session_driver):
+    n = reactive.Value(1)
+    threads = []
+
+    def make_box(value):
+        threads.append(threading.current_thread().name)
+        return sdb.value_box(str(value))
+
+    def server(input, output, session):
+        @sdb.render_value_box(executor="thread")
+        def box():
+            return functools.partial(make_box, n())
+
+    driver = session_driver(server)
+    await driver.start("box")
+    await driver.wait_for(lambda: len(driver.values("box")) == 2)
+    await set_value(n, 2)
+    await driver.wait_for(lambda: len(driver.values("box")) == 4)
+
+    loading, full, *rest = driver.values("box")
+    assert loading == {"loading": True}
+    assert "<h3>1</h3>" in full["html"]
+    assert rest == [{"loading": True}, {"patch": {"0.0.0": "2"}}]
+    assert len(threads) == 2
+    assert all(name.startswith("shinydashboard") for name in threads)
+
+
+def make_box_with_pid(value):
+    # At the top level, so that it can be pickled for a process pool
+    return sdb.value_box(str(value), str(os.getpid()))
+
+
+async def test_render_value_box_in_process(session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_value_box(executor="process")
+        def box():
+            return functools.partial(make_box_with_pid, n())
+
+    driver = session_driver(server)
+    await driver.start("box")
+    await driver.wait_for(lambda: len(driver.values("box")) == 2, timeout=30)
+
+    loading, full = driver.values("box")
+    assert loading == {"loading": True}
+    assert "<h3>1</h3>" in full["html"]
+    pid = re.search(r"<p>(\d+)</p>", full["html"]).group(1)
+    assert int(pid) != os.getpid()
+
+
+async def test_render_value_box_in_executor_without_reactives(session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_value_box(executor="thread")
+        def reads_reactives():
+            return lambda: sdb.value_box(str(n()))
+
+        @sdb.render_value_box(executor="thread")
+        def returns_box():
+            return sdb.value_box(str(n()))
+
+    driver = session_driver(server)
+    await driver.start("reads_reactives", "returns_box")
+    await driver.wait_for(lambda: len(driver.errors("reads_reactives")) == 1)
+
+    assert driver.values("reads_reactives") == [{"loading": True}]
+    assert "should return a function" in driver.errors("returns_box")[0]["message"]
+
+
+async def test_render_value_box_grid(session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_value_box_grid
+        def grid():
+            return [
+                dict(value=str(n()), subtitle="A", width=3),
+                sdb.info_box("B", str(n() * 10), width=3),
+            ]
+
+    driver = session_driver(server)
+    await driver.start("grid")
+    await set_value(n, 2)
+
+    full, patch = driver.values("grid")
+    assert full["html"].count('class="col col-sm-3"') == 2
+    assert patch == {"patch": {"0.0.0.0": "2", "1.0.1.1": "20"}}
+
+
+async def test_render_value_box_grid_by_key(session_driver):
+    regions = reactive.Value({"eu": 1, "us": 2})
+
+    def server(input, output, session):
+        @sdb.render_value_box_grid
+        def grid():
+            return {k: dict(value=str(v), subtitle=k) for k, v in regions().items()}
+
+    driver = session_driver(server)
+    await driver.start("grid")
+    await set_value(regions, {"ap": 5, "eu": 1, "us": 3})
+    await set_value(regions, {"us": 3, "ap": 5})
+    await set_value(regions, {"us": 3, "ap": 5})
+
+    full, added, removed = driver.values("grid")
+    assert '<div class="col" data-tile-key="eu">' in full["html"]
+    # Only the new tile is sent in full; the others are patched, or left as they are
+    assert added["tiles"]["keys"] == ["ap", "eu", "us"]
+    assert list(added["tiles"]["insert"]) == ["ap"]
+    assert 'data-tile-key="ap"' in added["tiles"]["insert"]["ap"]
+    assert added["tiles"]["patch"] == {"us": {"0.0.0.0": "3"}}
+    assert removed == {"tiles": {"keys": ["us", "ap"]}}
+
+
+async def test_render_menu_dropdown_skips_unchanged(session_driver):
+    n = reactive.Value(1)
+
+    def server(input, output, session):
+        @sdb.render_menu_dropdown
+        def menu():
+            return sdb.menu_dropdown(
+                sdb.icon("bell"),
+                sdb.item_notification(f"{n() // 2} new"),
+            )
+
+    driver = session_driver(server)
+    await driver.start("menu")
+    await set_value(n, 0)
+    await set_value(n, 2)
+
+    first, second = driver.values("menu")
+    assert "0 new" in first["html"]
+    assert "1 new" in second["html"]
+    assert sdb.render_stats().suppressed >= 1
+
+
+def test_renderers_make_their_output_containers():
+    @sdb.render_value_box
+    def box():
+        return None
+
+    @sdb.render_value_box_grid(throttle_ms=100)
+    def grid():
+        return None
+
+    @sdb.render_menu_dropdown
+    def menu():
+        return None
+
+    assert str(box.tagify()) == str(sdb.output_value_box("box"))
+    assert str(grid.tagify()) == str(sdb.output_value_box_grid("grid"))
+    assert str(menu.tagify()) == str(sdb.output_menu_dropdown("menu"))
+
+
+async def test_broadcast_renders_once_for_all_sessions(session_driver):
+    n = reactive.Value(1)
+    calls = []
+
+    def server(input, output, session):
+        @sdb.render_value_box(broadcast=True)
+        def box():
+            calls.append(n())
+            return sdb.value_box(str(n()))
+
+    first, second = session_driver(server), session_driver(server)
+    await first.start("box")
+    await second.start("box")
+    await set_value(n, 2)
+
+    assert calls == [1, 2]
+    for driver in (first, second):
+        full, patch = driver.values("box")
+        assert "<h3>1</h3>" in full["html"]
+        assert patch == {"patch": {"0.0.0": "2"}}
+
+    # The second session's function takes over when the first session ends
+    await first.close()
+    await set_value(n, 3)
+    assert calls == [1, 2, 3]
+    assert second.values("box")[-1] == {"patch": {"0.0.0": "3"}}
+
+    # And nothing is kept once all of them have ended
+    await second.close()
+    assert not any(app is second.app for app, _ in _Broadcast._instances)
+
+
+async def test_broadcast_needs_a_key_for_different_closures(session_driver):
+    def server(input, output, session):
+        data = {"value": "1"}
+
+        @sdb.render_value_box(broadcast=True)
+        def box():
+            return sdb.value_box(data["value"])
+
+        @sdb.render_value_box(broadcast=session.id)
+        def keyed():
+            return sdb.value_box(data["value"])
+
+    first, second = session_driver(server), session_driver(server)
+    await first.start("box", "keyed")
+    await second.start("box", "keyed")
+
+    assert "<h3>1</h3>" in first.values("box")[0]["html"]
+    assert "different closure variables" in second.errors("box")[0]["message"]
+    assert len(second.values("keyed")) == 1
+
+
+def test_cache_needs_a_key_for_closures():
+    region = "eu"
+
+    def box():
+        return sdb.value_box(region)
+
+    with pytest.raises(ValueError, match="needs a key"):
+        sdb.render_value_box(cache=True)(box)
+    sdb.render_value_box(cache=lambda: region)(box)
+
+
+async def test_cache_shares_a_pending_result(session_driver):
+    calls = []
+    release = asyncio.Event()
+
+    async def box():
+        calls.append(len(calls))
+        await release.wait()
+        if len(calls) == 1:
+            raise RuntimeError("failed")
+        return sdb.value_box("1")
+
+    fn = cached(box, key=lambda: "key")
+    driver = session_driver(lambda input, output, session: None)
+    await driver.start()
+    with session_context(driver.session), reactive.isolate():
+        misses = [asyncio.ensure_future(fn()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*misses, return_exceptions=True)
+        assert calls == [0]
+        assert all(isinstance(x, RuntimeError) for x in results)
+
+        # A failed result isn't kept
+        first, second = await asyncio.gather(fn(), fn())
+        assert calls == [0, 1]
+        assert first is second
+
+
+async def test_cache_refreshes_in_the_background(session_driver):
+    calls = []
+    release = asyncio.Event()
+
+    async def box():
+        calls.append(len(calls))
+        if len(calls) > 1:
+            await release.wait()
+        return len(calls)
+
+    fn = cached(box, key=lambda: "key", ttl=0.05)
+    driver = session_driver(lambda input, output, session: None)
+    await driver.start()
+    with session_context(driver.session), reactive.isolate():
+        assert await fn() == 1
+        await asyncio.sleep(0.1)
+
+        # The stale result is returned, while a refresh runs
+        assert await fn() == 1
+        [task] = _background_tasks
+        release.set()
+        await task
+        assert not _background_tasks
+        assert await fn() == 2
+        assert calls == [0, 1]
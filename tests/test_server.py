@@ -0,0 +1,111 @@
+import re
+
+import htmltools as ht
+import pytest
+from shiny import reactive
+
+import shinydashboard as sdb
+from shinydashboard._server import LAZY_TAB_INPUT, MENU_MESSAGE, _with_key
+
+
+def account_page(user):
+    return sdb.page(
+        sdb.header(),
+        sdb.sidebar("Bank", sdb.sidebar_menu_tab("Account", "account")),
+        sdb.body(
+            sdb.navset(
+                sdb.nav_content("account", f"balance for {user}", lazy=True),
+            )
+        ),
+        title="Bank",
+    )
+
+
+def lazy_token(page):
+    html = ht.HTMLDocument(page).render()["html"]
+    assert "balance for" not in html
+    return re.search(r'data-lazy-tab="([^"]+)"', html).group(1)
+
+
+def inserted(driver):
+    return [
+        msg["shiny-insert-ui"]
+        for msg in driver.conn.messages
+        if "shiny-insert-ui" in msg
+    ]
+
+
+async def test_lazy_tabs_are_inserted_into_their_own_page(session_driver):
+    # As for a function-style UI, each session's page is made for its request
+    alice = lazy_token(account_page("alice"))
+    bob = lazy_token(account_page("bob"))
+
+    def server(input, output, session):
+        sdb.dashboard_server()
+
+    first, second = session_driver(server), session_driver(server)
+    await first.start()
+    await second.start()
+    await first.set_inputs(**{LAZY_TAB_INPUT: alice})
+    await second.set_inputs(**{LAZY_TAB_INPUT: bob})
+    # Showing the tab again doesn't insert it again
+    await first.set_inputs(**{LAZY_TAB_INPUT: "unknown"})
+    await first.set_inputs(**{LAZY_TAB_INPUT: alice})
+
+    [to_alice] = inserted(first)
+    [to_bob] = inserted(second)
+    assert to_alice["selector"] == "#shinydash-tab-account"
+    assert to_alice["where"] == "afterBegin"
+    assert to_alice["content"]["html"] == "balance for alice"
+    assert to_bob["content"]["html"] == "balance for bob"
+
+
+async def test_menu_item_messages(session_driver):
+    def server(input, output, session):
+        @reactive.Effect
+        @reactive.event(input.step)
+        def _():
+            if input.step() == 1:
+                item = sdb.item_notification("Disk")
+                sdb.insert_menu_item("alerts", item, key="disk")
+                sdb.set_menu_badge("alerts", "auto")
+            elif input.step() == 2:
+                # Replaces the item with the same key
+                sdb.insert_menu_item(
+                    "alerts",
+                    sdb.item_notification("Disk full"),
+                    key="disk",
+                    position="last",
+                )
+                sdb.set_menu_badge("alerts", 3, status="danger")
+            else:
+                sdb.remove_menu_item("alerts", "disk")
+                sdb.set_menu_badge("alerts", None)
+
+    driver = session_driver(server)
+    await driver.start()
+    for step in (1, 2, 3):
+        await driver.set_inputs(step=step)
+
+    insert1, badge1, insert2, badge2, remove, badge3 = driver.custom(MENU_MESSAGE)
+    assert insert1["id"] == insert2["id"] == "alerts"
+    assert insert1["op"] == "insert"
+    assert insert1["key"] == insert2["key"] == "disk"
+    assert insert1["position"] == "first"
+    assert insert2["position"] == "last"
+    assert insert1["content"]["deps"] == []
+    assert 'data-menu-key="disk"' in insert1["content"]["html"]
+    assert "Disk" in insert1["content"]["html"]
+    assert 'data-menu-key="disk"' in insert2["content"]["html"]
+    assert "Disk full" in insert2["content"]["html"]
+
+    assert badge1 == {"id": "alerts", "op": "badge", "value": "auto", "status": None}
+    assert badge2 == {"id": "alerts", "op": "badge", "value": "3", "status": "danger"}
+    assert remove == {"id": "alerts", "op": "remove", "key": "disk"}
+    assert badge3 == {"id": "alerts", "op": "badge", "value": None, "status": None}
+
+
+def test_menu_item_key_needs_a_tag():
+    assert _with_key(ht.div("Disk"), "disk").attrs["data-menu-key"] == "disk"
+    with pytest.raises(TypeError):
+        _with_key(ht.TagList(ht.div("Disk")), "disk")
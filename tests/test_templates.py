@@ -0,0 +1,81 @@
+import re
+from typing import Any, Callable, Dict, Tuple
+
+import htmltools as ht
+import pytest
+from htmltools import tags
+
+import shinydashboard as sdb
+
+Case = Tuple[Callable[..., Any], Callable[..., ht.HTML], Tuple[Any, ...], Dict[str, Any]]
+
+clock = sdb.icon("clock")
+
+CASES: Dict[str, Case] = {
+    "value_box": (sdb.value_box, sdb.value_box_html, ("42",), {}),
+    "value_box icon": (
+        sdb.value_box,
+        sdb.value_box_html,
+        (42, "Users"),
+        {"icon": clock},
+    ),
+    "value_box escaping": (
+        sdb.value_box,
+        sdb.value_box_html,
+        ("<b>&", ht.HTML("<i>sub</i>")),
+        {"href": 'a?b=1&c="2"', "footer": "More", "gradient": True, "width": 3},
+    ),
+    "value_box tags": (
+        sdb.value_box,
+        sdb.value_box_html,
+        (tags.span("1", tags.b("2"), class_="x"), 3.5),
+        {"icon": tags.i(class_="fas fa-user"), "color": "success", "class_": "a b"},
+    ),
+    "info_box": (sdb.info_box, sdb.info_box_html, ("Title", "1"), {}),
+    "info_box fill": (
+        sdb.info_box,
+        sdb.info_box_html,
+        ("Title", 2),
+        {"subtitle": "<sub>", "icon": clock, "fill": True, "href": "#"},
+    ),
+    "info_box tags": (
+        sdb.info_box,
+        sdb.info_box_html,
+        (ht.HTML("<b>T</b>"), [tags.b("1"), "2"]),
+        {"subtitle": tags.small("s"), "icon": None, "gradient": True, "width": 4},
+    ),
+    "card": (sdb.card, sdb.card_html, (), {}),
+    "card text": (
+        sdb.card,
+        sdb.card_html,
+        ("Title", "a<", tags.p("b")),
+        {"color": "dark"},
+    ),
+    "card tools": (
+        sdb.card,
+        sdb.card_html,
+        (None, tags.script("1 < 2"), tags.br(), tags.img(src="a.png")),
+        {"closeable": True, "maximizable": True, "width": 6},
+    ),
+}
+
+
+def compact(html: str) -> str:
+    # Without the indentation that htmltools puts around elements; whitespace inside
+    # text is kept
+    return re.sub(r"\s+<", "<", re.sub(r">\s+", ">", html)).strip()
+
+
+@pytest.mark.parametrize("case", CASES.keys())
+def test_template_matches_component(case):
+    component, template, args, kwargs = CASES[case]
+    expected = ht.TagList(component(*args, **kwargs)).get_html_string()
+    actual = template(*args, **kwargs)
+    assert isinstance(actual, ht.HTML)
+    assert compact(str(actual)) == compact(expected)
+
+
+def test_template_rejects_dependencies():
+    dep = ht.HTMLDependency("dep", "1.0", source={"subdir": "."})
+    with pytest.raises(ValueError, match="HTML dependencies"):
+        sdb.value_box_html(ht.TagList("1", dep))